@@ -0,0 +1,191 @@
+# analisis_en_vivo.py (re-análisis incremental en segundo plano mientras se edita)
+import ast
+import queue
+import threading
+from errores import ErrorAnalisis
+from expresion_costo import ExpresionCosto
+
+# Espera tras la última tecla antes de volver a analizar
+RETARDO_EN_VIVO_MS = 600
+
+
+def dividir_segmentos(codigo):
+    """
+    Divide el módulo en segmentos de nivel superior: cada def o class (con sus
+    decoradores) y cada tramo continuo de otras sentencias. Devuelve una lista
+    de (nombre, primera_linea, ultima_linea, codigo). Lanza SyntaxError
+    """
+    tree = ast.parse(codigo)
+    lineas = codigo.splitlines()
+    segmentos = []
+    tramo = []
+
+    def cerrar_tramo():
+        if tramo:
+            primera, ultima = tramo[0].lineno, tramo[-1].end_lineno
+            segmentos.append(("(módulo)", primera, ultima, "\n".join(lineas[primera - 1:ultima])))
+            tramo.clear()
+
+    for nodo in tree.body:
+        if isinstance(nodo, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            cerrar_tramo()
+            primera = min([nodo.lineno] + [d.lineno for d in nodo.decorator_list])
+            segmentos.append((nodo.name, primera, nodo.end_lineno, "\n".join(lineas[primera - 1:nodo.end_lineno])))
+        else:
+            tramo.append(nodo)
+    cerrar_tramo()
+    return segmentos
+
+
+def llamadas_entre_segmentos(segmentos):
+    """
+    Devuelve, para cada segmento, el conjunto de índices de los otros
+    segmentos a los que llama por nombre (funciones o clases definidas en
+    ellos). Analizados por separado, esas llamadas costarían O(1)
+    """
+    definidos = {nombre: indice for indice, (nombre, _, _, _) in enumerate(segmentos) if nombre != "(módulo)"}
+    llamadas = []
+    for indice, (_, _, _, fragmento) in enumerate(segmentos):
+        llamados = set()
+        for nodo in ast.walk(ast.parse(fragmento)):
+            if (isinstance(nodo, ast.Call) and isinstance(nodo.func, ast.Name)
+                    and definidos.get(nodo.func.id, indice) != indice):
+                llamados.add(definidos[nodo.func.id])
+        llamadas.append(llamados)
+    return llamadas
+
+
+def unidades_de_analisis(segmentos):
+    """
+    Arma el código con que se analiza cada segmento: el propio segmento
+    primero (así sus líneas siguen numeradas desde 1) y a continuación los
+    segmentos a los que llama directa o indirectamente, en orden del módulo.
+    Editar un segmento solo invalida en la caché las unidades que lo
+    contienen: la suya y las de quienes lo llaman. Devuelve una lista de
+    (codigo, aporta); aporta indica si el costo de la unidad se suma al total
+    del módulo, es decir, si ningún segmento fuera de su ciclo de llamadas lo
+    llama y es el primero de ese ciclo
+    """
+    llamadas = llamadas_entre_segmentos(segmentos)
+    alcanzables = []
+    for indice in range(len(segmentos)):
+        vistos = set()
+        pendientes = [indice]
+        while pendientes:
+            for llamado in llamadas[pendientes.pop()]:
+                if llamado not in vistos:
+                    vistos.add(llamado)
+                    pendientes.append(llamado)
+        vistos.discard(indice)
+        alcanzables.append(vistos)
+
+    unidades = []
+    for indice, (_, _, _, fragmento) in enumerate(segmentos):
+        ciclo = {indice} | {otro for otro in alcanzables[indice] if indice in alcanzables[otro]}
+        llamado = any(miembro in llamadas[otro] for otro in range(len(segmentos)) if otro not in ciclo
+                      for miembro in ciclo)
+        codigo = "\n".join([fragmento] + [segmentos[otro][3] for otro in sorted(alcanzables[indice])])
+        unidades.append((codigo, not llamado and indice == min(ciclo)))
+    return unidades
+
+
+class AnalisisEnVivo:
+    """
+    Hilo de trabajo que analiza el código del editor sin bloquear la interfaz.
+    Solo se vuelven a analizar los segmentos cuyo código cambió o el de alguna
+    función a la que llaman: el resto se toma de la caché. Cada segmento se analiza con sus líneas numeradas desde
+    1, así que mover un segmento entero lo reutiliza, pero agregar o quitar
+    líneas dentro de él lo vuelve a analizar (la clave incluye posiciones).
+    Las líneas de cada resultado son relativas a 'primera' del segmento.
+    Los eventos se obtienen sin bloquear con consultar():
+      ('resultado', dict) o ('error', mensaje)
+    """
+
+    def __init__(self, cache):
+        self.cache = cache
+        self.pedidos = queue.Queue()
+        self.eventos = queue.Queue()
+        self.hilo = None
+
+    def solicitar(self, codigo):
+        if self.hilo is None or not self.hilo.is_alive():
+            self.hilo = threading.Thread(target=self._trabajar, daemon=True)
+            self.hilo.start()
+        self.pedidos.put(codigo)
+
+    def consultar(self):
+        eventos = []
+        while True:
+            try:
+                eventos.append(self.eventos.get_nowait())
+            except queue.Empty:
+                return eventos
+
+    def detener(self):
+        self.pedidos.put(None)
+
+    def _ultimo_pedido(self, codigo):
+        """
+        Descarta los pedidos intermedios: solo interesa el código más reciente
+        """
+        while True:
+            try:
+                codigo = self.pedidos.get_nowait()
+            except queue.Empty:
+                return codigo
+
+    def _trabajar(self):
+        while True:
+            codigo = self._ultimo_pedido(self.pedidos.get())
+            if codigo is None:
+                return
+            try:
+                resultado = self._analizar(codigo)
+            except SyntaxError as e:
+                self.eventos.put(('error', f"Línea {e.lineno}: {e.msg}"))
+                continue
+            if resultado is not None:
+                self.eventos.put(('resultado', resultado))
+
+    def _analizar(self, codigo):
+        """
+        Analiza cada segmento a través de la caché junto con los segmentos a
+        los que llama (ver unidades_de_analisis), así las llamadas se
+        resuelven igual que con el botón Analizar. Devuelve None si llegó un
+        pedido más nuevo a mitad del análisis
+        """
+        segmentos = []
+        expresion = ExpresionCosto()
+        exponenciales = []
+        fallos_previos = self.cache.fallos
+        divididos = dividir_segmentos(codigo)
+        for (nombre, primera, ultima, _), (unidad, aporta) in zip(divididos, unidades_de_analisis(divididos)):
+            if not self.pedidos.empty():
+                return None
+            segmento = {'nombre': nombre, 'primera': primera, 'ultima': ultima, 'aporta': aporta,
+                        'analizador': None, 'costo_por_linea': {}, 'error': None}
+            try:
+                analizador = self.cache.analizar(unidad)
+            except ErrorAnalisis as e:
+                segmento['error'] = e.mensaje
+            else:
+                segmento['analizador'] = analizador
+                # Las líneas de los segmentos llamados se colorean con su propio resultado
+                segmento['costo_por_linea'] = {linea: costo for linea, costo in analizador.costo_por_linea.items()
+                                               if linea <= ultima - primera + 1}
+                if aporta:
+                    expresion = expresion + analizador.tiempo_algoritmo.expresion
+                    exponenciales.extend(info['base_exponencial'] for info in
+                                         analizador.detalles_analisis['recursion']['funciones']
+                                         if 'base_exponencial' in info)
+            segmentos.append(segmento)
+
+        reanalizados = self.cache.fallos - fallos_previos
+        return {
+            'codigo': codigo,
+            'segmentos': segmentos,
+            'expresion': expresion,
+            'complejidad': f"O({max(exponenciales)}^n)" if exponenciales else expresion.complejidad(),
+            'reanalizados': reanalizados,
+            'reutilizados': len(segmentos) - reanalizados
+        }
@@ -1,21 +1,189 @@
 # analizador_algoritmo.py (versión completa integrada)
 import ast
 from collections import Counter
-import re
-from tkinter import messagebox
 import math
+import re
+from fractions import Fraction
+from errores import ErrorAnalisis, ErrorSintaxis
+from expresion_costo import ExpresionCosto
+from analizador_recursion import AnalizadorRecursion
+from grafo_llamadas import GrafoLlamadas, recorrer_local
+from analizador_while import AnalizadorWhile
+from modelo_costos import ModeloCostos, ContextoTipos
+from detector_patrones import DetectorPatrones
+from variables_tamano import VariablesTamano
+from operaciones_elementales import TIPOS_OE, contar_oe_por_tipo, oe_propias, texto_histograma
+
+# Tamaño de entrada con el que se calcula la proporción de costo de cada línea
+N_REFERENCIA = 1000
+
+_COMPRENSIONES = (ast.ListComp, ast.SetComp, ast.DictComp, ast.GeneratorExp)
+
+# Control de una vuelta de un for: comparar, incrementar y asignar
+_CONTROL_FOR = {'comparacion': 1, 'aritmetica': 1, 'asignacion': 1}
+
+
+def _contador(grado, grado_log=0):
+    """
+    Propiedad que expone el coeficiente de n^grado·log^grado_log(n) como contador
+    """
+    unidad = ExpresionCosto.potencia("n", grado) * (ExpresionCosto.logaritmo("n") if grado_log else 1)
+
+    def obtener(self):
+        return self.expresion.coeficiente(grado, grado_log)
+
+    def fijar(self, valor):
+        self.expresion = self.expresion + unidad * (valor - obtener(self))
+
+    return property(obtener, fijar)
+
 
 class TiempoAlgoritmo:
-    def __init__(self):
-        self.cant_constante = 0
-        self.cant_lineal = 0
-        self.cant_cuadratica = 0
-        self.cant_cubica = 0
-        self.cant_nlogn = 0
-        self.log_bases = {base: 0 for base in range(2, 11)}
+    """
+    Tiempo de un bloque de código como expresión de costo simbólica.
+    Los contadores cant_* son vistas de los términos clásicos de la expresión
+    """
+    cant_constante = _contador(0)
+    cant_lineal = _contador(1)
+    cant_cuadratica = _contador(2)
+    cant_cubica = _contador(3)
+    cant_nlogn = _contador(1, 1)
 
-    def agregar_constante(self):
-        self.cant_constante += 1
+    def __init__(self):
+        self.expresion = ExpresionCosto()
+        # Parte de la expresión que corresponde a cada línea del código
+        self.por_linea = {}
+        # Parte de la expresión que corresponde a cada tipo de operación elemental
+        self.por_tipo = {}
+        # Recursiones exponenciales, que ExpresionCosto no representa: cada una
+        # es (base, OE por tipo de una llamada) y aporta OE·base^n
+        self.exponenciales = []
+
+    def sumar(self, expresion, linea=None, tipo='llamada'):
+        """
+        Suma un costo de un tipo de operación. Sin tipo se cuenta como llamada
+        (operaciones de biblioteca y funciones del código)
+        """
+        self.expresion = self.expresion + expresion
+        self.por_tipo[tipo] = self.por_tipo.get(tipo, ExpresionCosto()) + expresion
+        if linea is not None:
+            self.por_linea[linea] = self.por_linea.get(linea, ExpresionCosto()) + expresion
+
+    def sumar_histograma(self, oe, repeticiones=1, linea=None):
+        """
+        Suma las operaciones de un histograma (tipo -> cantidad), cada una
+        repetida la cantidad de veces dada
+        """
+        for tipo, cantidad in oe.items():
+            if cantidad:
+                self.sumar(repeticiones * cantidad, linea, tipo)
+
+    def incorporar(self, otro, transformar=None, solo_lineas=False):
+        """
+        Suma otro tiempo línea por línea, aplicando antes transformar a cada
+        expresión (por ejemplo, multiplicar por las iteraciones de un bucle).
+        Con solo_lineas se conserva el detalle por línea sin sumar al total
+        """
+        transformar = transformar or (lambda expresion: expresion)
+        if not solo_lineas:
+            self.expresion = self.expresion + transformar(otro.expresion)
+            for tipo, expresion in otro.por_tipo.items():
+                self.por_tipo[tipo] = self.por_tipo.get(tipo, ExpresionCosto()) + transformar(expresion)
+        for linea, expresion in otro.por_linea.items():
+            self.por_linea[linea] = self.por_linea.get(linea, ExpresionCosto()) + transformar(expresion)
+
+    def sumar_exponencial(self, base, oe):
+        """
+        Suma una recursión de crecimiento base^n que hace las OE del
+        histograma oe (tipo -> cantidad) en cada llamada
+        """
+        self.exponenciales.append((base, {tipo: cantidad for tipo, cantidad in oe.items() if cantidad}))
+
+    def _llamadas_exponenciales(self, valores):
+        """
+        base^n de cada recursión exponencial (infinito si desborda). Con un
+        diccionario se usa el valor de n, o el mayor si n no está
+        """
+        if isinstance(valores, dict):
+            valores = valores.get("n", max(valores.values(), default=0))
+        llamadas = []
+        for base, _ in self.exponenciales:
+            try:
+                llamadas.append(float(base) ** valores)
+            except OverflowError:
+                llamadas.append(math.inf)
+        return llamadas
+
+    def evaluar(self, valores):
+        """
+        OE totales para un tamaño (número o diccionario variable -> valor),
+        incluidas las recursiones exponenciales
+        """
+        if not isinstance(valores, dict):
+            valores = dict({v: valores for v in self.expresion.variables()}, n=valores)
+        total = float(self.expresion.evaluar(valores))
+        for (_, oe), llamadas in zip(self.exponenciales, self._llamadas_exponenciales(valores)):
+            total += sum(oe.values()) * llamadas
+        return total
+
+    def oe_por_tipo(self, valores):
+        """
+        OE de cada tipo para un tamaño (número o diccionario variable -> valor)
+        """
+        if not isinstance(valores, dict):
+            valores = dict({v: valores for v in self.expresion.variables()}, n=valores)
+        oe = {
+            tipo: float(self.por_tipo[tipo].evaluar(valores))
+            for tipo in TIPOS_OE if self.por_tipo.get(tipo)
+        }
+        for (_, por_tipo), llamadas in zip(self.exponenciales, self._llamadas_exponenciales(valores)):
+            for tipo, cantidad in por_tipo.items():
+                oe[tipo] = oe.get(tipo, 0.0) + cantidad * llamadas
+        return {tipo: oe[tipo] for tipo in TIPOS_OE if tipo in oe}
+
+    def histograma_terminos(self):
+        """
+        Cada término de la expresión, de mayor a menor crecimiento, con el
+        coeficiente que aporta cada tipo de operación
+        """
+        histograma = []
+        for clave, coeficiente in self.expresion.terminos.items():
+            termino = ExpresionCosto({clave: coeficiente})
+            histograma.append({
+                'termino': termino.a_texto(),
+                'orden': termino.orden(),
+                'coeficiente': coeficiente,
+                'oe_por_tipo': {
+                    tipo: self.por_tipo[tipo].terminos[clave]
+                    for tipo in TIPOS_OE if clave in self.por_tipo.get(tipo, ExpresionCosto()).terminos
+                }
+            })
+        histograma.sort(key=lambda fila: fila['orden'], reverse=True)
+        return histograma
+
+    @property
+    def log_bases(self):
+        bases = {}
+        for (monomio, logs), coeficiente in self.expresion.terminos.items():
+            if not monomio and len(logs) == 1 and logs[0][1] == 1:
+                # El logaritmo sin base se evalúa en base 2
+                bases[logs[0][0][1] or 2] = coeficiente
+        return bases
+
+    def terminos_adicionales(self):
+        """
+        Términos que no corresponden a ningún contador clásico (n^4, n² log n, ...)
+        """
+        clasicos = ExpresionCosto()
+        for grado, grado_log in ((0, 0), (1, 0), (2, 0), (3, 0), (1, 1)):
+            clasicos = clasicos + ExpresionCosto.potencia("n", grado) * \
+                (ExpresionCosto.logaritmo("n") if grado_log else 1) * self.expresion.coeficiente(grado, grado_log)
+        for base, coeficiente in self.log_bases.items():
+            clasicos = clasicos + ExpresionCosto.logaritmo("n", base) * coeficiente
+        return self.expresion - clasicos
+
+    def agregar_constante(self, linea=None, tipo='asignacion'):
+        self.sumar(ExpresionCosto.constante(), linea, tipo)
 
     def agregar_lineal(self):
         self.cant_lineal += 1
@@ -30,12 +198,27 @@ class TiempoAlgoritmo:
         self.cant_nlogn += 1
 
     def agregar_logaritmica_base(self, base):
-        if base in self.log_bases:
-            self.log_bases[base] += 1
+        self.expresion = self.expresion + ExpresionCosto.logaritmo("n", base)
+
+
+class InfoNodo:
+    """
+    Datos precalculados de un nodo del árbol: su padre, los bucles que lo
+    contienen (de afuera hacia adentro) y la función donde está definido
+    """
+    def __init__(self, padre=None, bucles=(), funcion=None):
+        self.padre = padre
+        self.bucles = bucles
+        self.funcion = funcion
+        self.nivel_for = sum(1 for bucle in bucles if isinstance(bucle, ast.For))
 
 
 class AnalizadorAlgoritmo:
-    def __init__(self):
+    def __init__(self, modelo_costos=None):
+        # Costo de las operaciones de biblioteca (sorted, list.insert, x in lista, ...)
+        self.modelo_costos = modelo_costos or ModeloCostos()
+        self.contexto_tipos = ContextoTipos()
+
         # Variables del análisis original
         self.codigo_fuente = ""
         self.estructura_analizada = []
@@ -50,12 +233,18 @@ class AnalizadorAlgoritmo:
             'condicionales': 0,
             'funciones': 0,
             'max_iteraciones': 1,
-            'oe_por_iteracion': 0
+            'oe_por_iteracion': 0,
+            # Operaciones elementales de todo el código por tipo y las de una vuelta de cada bucle
+            'oe_por_tipo': {},
+            'oe_por_bucle': [],
+            'recursion': {'detectada': False, 'tipo': None, 'funciones': [], 'complejidad': None, 'exponencial': False},
+            'patrones': []
         }
         
         # Variables del nuevo sistema de análisis
         self.lineas = []
         self.tree = None
+        self.indice = {}
         self.tiempo_algoritmo = TiempoAlgoritmo()
         
         self.instruccion_simples = []
@@ -74,6 +263,25 @@ class AnalizadorAlgoritmo:
         self.instruccion_while = []
         self.instruccion_while_anidados = []
         self.instruccion_while_confor = []
+        self._for_con_while = set()
+        # (línea, texto) de las estructuras, en el orden en que se recorren
+        self._estructuras = []
+        self.tiempos_funcion = {}
+        # Costo de una llamada a cada función (cuerpo o solución de su recurrencia)
+        self.costos_llamada = {}
+        self._cuerpos = {}
+        self.grafo_llamadas = None
+        self.analizador_recursion = AnalizadorRecursion()
+        # Letra (n, m, k, ...) de cada tamaño de entrada distinto
+        self.tamanos = None
+        # Línea -> término de costo, complejidad y proporción del total
+        self.costo_por_linea = {}
+        # Una fila por función o método y el total del módulo
+        self.reporte_funciones = []
+        self.resumen_modulo = {}
+
+        # Medición real asociada (ResultadoMedicion), si se ejecutó el código
+        self.medicion = None
 
     def analizar_codigo(self, codigo):
         self.codigo_fuente = codigo
@@ -82,21 +290,30 @@ class AnalizadorAlgoritmo:
         try:
             self.tree = ast.parse(codigo)
             self.lineas = codigo.splitlines()
-            self._agregar_referencias_parent()
-            
-            # Realizar ambos tipos de análisis
-            self._visitar_nodos(self.tree, 0)
+            self._construir_indice()
+            self.tamanos = VariablesTamano(self.tree)
+            self.contexto_tipos = ContextoTipos(self.tree)
+            self.contexto_tipos.costo_llamada = self._costo_llamada_propia
+            self.contexto_tipos.variable_tamano = self.tamanos.variable
+            self._contar_operaciones()
+            # Un solo recorrido: las funciones de las hojas hacia arriba y
+            # después el código de nivel de módulo
+            self._costear_funciones()
             self._procesar_nodos(self.tree)
+            self.estructura_analizada = [texto for _, texto in sorted(self._estructuras, key=lambda e: e[0])]
+            soluciones = self._analizar_recursion()
+            self._atribuir_costo_por_linea()
+            self._generar_reporte_funciones(soluciones)
+            self.detalles_analisis['patrones'] = DetectorPatrones(
+                self.modelo_costos, self.contexto_tipos).detectar(self.tree, self.indice)
             
             self._determinar_complejidad()
             self._calcular_funcion_tiempo()
             return True
         except SyntaxError as e:
-            messagebox.showerror("Error de Sintaxis", f"Error en el código: {str(e)}")
-            return False
+            raise ErrorSintaxis(f"Error en el código: {str(e)}", e.lineno, e.offset) from e
         except Exception as e:
-            messagebox.showerror("Error", f"Error al analizar el código: {str(e)}")
-            return False
+            raise ErrorAnalisis(f"Error al analizar el código: {str(e)}") from e
 
     def _reset_analisis(self):
         self.estructura_analizada = []
@@ -109,7 +326,12 @@ class AnalizadorAlgoritmo:
             'condicionales': 0,
             'funciones': 0,
             'max_iteraciones': 1,
-            'oe_por_iteracion': 0
+            'oe_por_iteracion': 0,
+            # Operaciones elementales de todo el código por tipo y las de una vuelta de cada bucle
+            'oe_por_tipo': {},
+            'oe_por_bucle': [],
+            'recursion': {'detectada': False, 'tipo': None, 'funciones': [], 'complejidad': None, 'exponencial': False},
+            'patrones': []
         }
         self.complejidad_detectada = "O(1)"
         self.funcion_tiempo = ""
@@ -129,223 +351,467 @@ class AnalizadorAlgoritmo:
         self.instruccion_while = []
         self.instruccion_while_anidados = []
         self.instruccion_while_confor = []
-
-    def _visitar_nodos(self, node, nivel_actual):
-        self._procesar_nodo(node, nivel_actual)
-        for child in ast.iter_child_nodes(node):
-            self._visitar_nodos(child, nivel_actual)
-
-    def _procesar_nodo(self, node, nivel_actual):
-        if isinstance(node, ast.FunctionDef):
-            return
-
-        if isinstance(node, ast.Assign) or isinstance(node, ast.AugAssign):
-            self.detalles_analisis['operaciones_primitivas'] += self._contar_oe(node)
-        elif isinstance(node, ast.BinOp) or isinstance(node, ast.Compare) or isinstance(node, ast.Call):
-            self.detalles_analisis['operaciones_primitivas'] += self._contar_oe(node)
-
-        if isinstance(node, ast.For):
-            self._procesar_bucle_for(node, nivel_actual)
-        elif isinstance(node, ast.While):
-            self._procesar_bucle_while(node, nivel_actual)
-        elif isinstance(node, ast.If):
-            self._procesar_condicional(node, nivel_actual)
-
-    def _procesar_bucle_for(self, node, nivel_actual):
-        self.detalles_analisis['bucles_for'] += 1
-        self.estructura_analizada.append(f"Bucle FOR (nivel {nivel_actual})")
-
-        if nivel_actual > 0:
-            self.detalles_analisis['bucles_anidados'] += 1
-
-        self.detalles_analisis['nivel_anidamiento'] = max(
-            self.detalles_analisis['nivel_anidamiento'], nivel_actual + 1
-        )
-
-        oe_iteracion = sum(self._contar_oe(child) for child in node.body)
-        self.detalles_analisis['oe_por_iteracion'] += oe_iteracion + 1  # 1 comparación por vuelta
-
-        for child in node.body:
-            self._visitar_nodos(child, nivel_actual + 1)
-
-    def _procesar_bucle_while(self, node, nivel_actual):
-        self.detalles_analisis['bucles_while'] += 1
-        self.estructura_analizada.append(f"Bucle WHILE (nivel {nivel_actual})")
-        
-        if nivel_actual > 0:
+        self._for_con_while = set()
+        # (línea, texto) de las estructuras, en el orden en que se recorren
+        self._estructuras = []
+        self.tiempos_funcion = {}
+        # Costo de una llamada a cada función (cuerpo o solución de su recurrencia)
+        self.costos_llamada = {}
+        self._cuerpos = {}
+        self.grafo_llamadas = None
+        self.analizador_recursion = AnalizadorRecursion()
+        # Letra (n, m, k, ...) de cada tamaño de entrada distinto
+        self.tamanos = None
+        # Línea -> término de costo, complejidad y proporción del total
+        self.costo_por_linea = {}
+        # Una fila por función o método y el total del módulo
+        self.reporte_funciones = []
+        self.resumen_modulo = {}
+
+        # Medición real asociada (ResultadoMedicion), si se ejecutó el código
+        self.medicion = None
+
+    def _contar_operaciones(self):
+        """
+        Histograma por tipo de las operaciones elementales de todo el código
+        (cada nodo una vez); operaciones_primitivas es su total
+        """
+        oe = Counter()
+        for nodo in ast.walk(self.tree):
+            oe.update(oe_propias(nodo))
+        self.detalles_analisis['oe_por_tipo'] = {tipo: oe[tipo] for tipo in TIPOS_OE if oe[tipo]}
+        self.detalles_analisis['operaciones_primitivas'] = sum(oe.values())
+
+    def _anotar(self, linea, texto):
+        """
+        Agrega una estructura encontrada; al terminar el recorrido se ordenan por línea
+        """
+        self._estructuras.append((linea, texto))
+
+    def _registrar_bucle(self, nodo, control):
+        """
+        Cuenta el bucle, su nivel de anidamiento y las OE por tipo de una
+        vuelta: su cuerpo más el control
+        """
+        nivel = len(self.indice[nodo].bucles)
+        bucle = 'for' if isinstance(nodo, ast.For) else 'while'
+        self.detalles_analisis[f'bucles_{bucle}'] += 1
+        self._anotar(nodo.lineno, f"Bucle {bucle.upper()} (nivel {nivel})")
+        if nivel > 0:
             self.detalles_analisis['bucles_anidados'] += 1
-
         self.detalles_analisis['nivel_anidamiento'] = max(
-            self.detalles_analisis['nivel_anidamiento'], nivel_actual + 1
+            self.detalles_analisis['nivel_anidamiento'], nivel + 1
         )
 
-        oe_iteracion = sum(self._contar_oe(child) for child in node.body)
-        self.detalles_analisis['oe_por_iteracion'] += oe_iteracion + 1  # 1 comparación por vuelta
+        oe = Counter(control)
+        for sentencia in nodo.body:
+            oe.update(contar_oe_por_tipo(sentencia))
+        self.detalles_analisis['oe_por_iteracion'] += sum(oe.values())
+        self.detalles_analisis['oe_por_bucle'].append({
+            'linea': nodo.lineno,
+            'bucle': bucle,
+            'oe_por_tipo': {tipo: oe[tipo] for tipo in TIPOS_OE if oe[tipo]}
+        })
+
+    def _costear_funciones(self):
+        """
+        Calcula el costo de cada función de las hojas del grafo de llamadas
+        hacia arriba, de modo que al costear una función ya se conoce el costo
+        de las que llama (y se multiplica por las iteraciones de sus bucles).
+        Las recurrencias se resuelven por componente fuertemente conexa
+        """
+        self.grafo_llamadas = GrafoLlamadas(self.tree)
+        self.analizador_recursion.iniciar(self.grafo_llamadas)
+        for grupo in self.grafo_llamadas.orden_costeo():
+            # Las funciones anidadas están más abajo en el código que quien las contiene
+            for funcion in sorted(grupo, key=lambda f: f.lineno, reverse=True):
+                cuerpo = self._tiempo_bloque(funcion.body)
+                self._cuerpos[funcion] = cuerpo
+                self.tiempos_funcion[funcion] = cuerpo.expresion
+                self.costos_llamada[funcion] = cuerpo.expresion
+
+            componentes = {id(c): c for c in map(self.grafo_llamadas.componente_de, grupo)}
+            for componente in componentes.values():
+                self.costos_llamada.update(
+                    self.analizador_recursion.analizar_componente(componente, self.tiempos_funcion)
+                )
+
+    def _costo_llamada_propia(self, llamada):
+        """
+        Costo de una llamada a una función del código, o None si no es una de
+        ellas o es una llamada recursiva (la resuelve AnalizadorRecursion)
+        """
+        info = self.indice.get(llamada)
+        funcion = info.funcion if info else None
+        costos = [
+            self._costo_en_llamada(self.costos_llamada[destino], destino, llamada)
+            for destino in self.grafo_llamadas.destinos(llamada, funcion)
+            if destino in self.costos_llamada and not self.grafo_llamadas.misma_componente(funcion, destino)
+        ]
+        if not costos:
+            return None
+        total = costos[0]
+        for costo in costos[1:]:
+            total = total.maximo(costo)
+        return total
+
+    def _costo_en_llamada(self, costo, destino, llamada):
+        """
+        Expresa el costo de la función llamada en las variables de quien llama:
+        cada letra de un parámetro pasa a ser la del argumento correspondiente
+        """
+        parametros = self.tamanos.parametros(destino)
+        if isinstance(llamada.func, ast.Attribute) and parametros[:1] in (['self'], ['cls']):
+            parametros = parametros[1:]
+        cambios = {}
+        for nombre, argumento in zip(parametros, llamada.args):
+            letra = self.tamanos.letra_parametro(destino, nombre)
+            if letra is not None:
+                cambios[letra] = self.tamanos.variable(argumento)
+        for palabra in llamada.keywords:
+            letra = self.tamanos.letra_parametro(destino, palabra.arg)
+            if palabra.arg in parametros and letra is not None:
+                cambios[letra] = self.tamanos.variable(palabra.value)
+        return costo.renombrar(cambios) if cambios else costo
+
+    def _analizar_recursion(self):
+        """
+        Detecta funciones recursivas y suma a T(n) la solución de sus recurrencias
+        """
+        analizador = self.analizador_recursion
+        recursion = analizador.finalizar()
+        self.detalles_analisis['recursion'] = recursion
+        self.detalles_analisis['funciones'] = sum(1 for nodo in self.indice if isinstance(nodo, ast.Call))
+
+        for info in recursion['funciones']:
+            self.estructura_analizada.append(f"Recursión {info['tipo']} en {info['nombre']}: {info['recurrencia']}")
+        # La solución de cada función ya incluye las llamadas al resto de su
+        # recursión mutua: cada componente se suma una sola vez a T(n), en su
+        # primera función, y solo si nadie de afuera la llama (si no, la
+        # cuenta el sitio de la llamada)
+        grafo = self.grafo_llamadas
+        funciones = {f.lineno: f for f in grafo.funciones}
+        sumadas = set()
+        for linea, solucion in sorted(analizador.soluciones, key=lambda s: s[0]):
+            componente = grafo.componente_de(funciones[linea]) or [funciones[linea]]
+            clave = id(componente)
+            if clave in sumadas or any(grafo.tiene_llamadores(f) for f in componente):
+                self.tiempo_algoritmo.por_linea[linea] = self.tiempo_algoritmo.por_linea.get(linea, ExpresionCosto()) + solucion
+            else:
+                sumadas.add(clave)
+                self.tiempo_algoritmo.sumar(solucion, linea)
+
+        # Las exponenciales no son términos de la expresión: se guardan aparte
+        # con las OE de una llamada, una vez por componente, para que las
+        # estimaciones y proyecciones crezcan como base^n
+        sumadas = set()
+        for info in sorted(recursion['funciones'], key=lambda i: i['linea']):
+            if 'base_exponencial' not in info:
+                continue
+            funcion = funciones[info['linea']]
+            componente = grafo.componente_de(funcion) or [funcion]
+            if id(componente) in sumadas:
+                continue
+            sumadas.add(id(componente))
+            oe = Counter()
+            for miembro in componente:
+                oe.update(contar_oe_por_tipo(ast.Module(body=miembro.body, type_ignores=[])))
+            self.tiempo_algoritmo.sumar_exponencial(info['base_exponencial'], oe)
+        return dict(analizador.soluciones)
+
+    def _atribuir_costo_por_linea(self):
+        """
+        Reparte T(n) entre las líneas del código. La proporción de cada línea
+        se evalúa en n = N_REFERENCIA
+        """
+        valores = {
+            linea: float(expresion.evaluar(N_REFERENCIA))
+            for linea, expresion in self.tiempo_algoritmo.por_linea.items() if expresion
+        }
+        total = sum(valor for valor in valores.values() if valor > 0)
+        self.costo_por_linea = {
+            linea: {
+                'termino': self.tiempo_algoritmo.por_linea[linea].a_texto(),
+                'complejidad': self.tiempo_algoritmo.por_linea[linea].complejidad(),
+                'orden': self.tiempo_algoritmo.por_linea[linea].orden(),
+                'proporcion': max(valor, 0) / total if total else 0.0
+            }
+            for linea, valor in sorted(valores.items())
+        }
 
-        for child in node.body:
-            self._visitar_nodos(child, nivel_actual + 1)
+    def _nombre_calificado(self, funcion):
+        """
+        Nombre con las clases y funciones que contienen al def, como Clase.metodo
+        """
+        partes = [funcion.name]
+        padre = self.indice[funcion].padre
+        while padre is not None:
+            if isinstance(padre, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+                partes.append(padre.name)
+            padre = self.indice[padre].padre
+        return ".".join(reversed(partes))
+
+    def _generar_reporte_funciones(self, soluciones):
+        """
+        Arma la tabla por función con los tiempos ya calculados en el recorrido
+        principal (tiempos_funcion) y las soluciones de las recurrencias
+        """
+        exponenciales = {
+            info['linea']: info['complejidad']
+            for info in self.detalles_analisis['recursion']['funciones'] if 'base_exponencial' in info
+        }
+        self.reporte_funciones = []
+        for funcion, cuerpo in self.tiempos_funcion.items():
+            expresion = soluciones.get(funcion.lineno, cuerpo)
+            texto = f"{expresion.firma()} = " + (expresion.a_texto() or "1")
+            complejidad = expresion.complejidad()
+            if funcion.lineno in exponenciales:
+                complejidad = exponenciales[funcion.lineno]
+                texto += f" + {complejidad}"
+            oe = contar_oe_por_tipo(ast.Module(body=funcion.body, type_ignores=[]))
+            self.reporte_funciones.append({
+                'nombre': self._nombre_calificado(funcion),
+                'linea_inicio': funcion.lineno,
+                'linea_fin': funcion.end_lineno,
+                'metodo': isinstance(self.indice[funcion].padre, ast.ClassDef),
+                'complejidad': complejidad,
+                'funcion_tiempo': texto,
+                'oe': sum(oe.values()),
+                'oe_por_tipo': {tipo: oe[tipo] for tipo in TIPOS_OE if oe[tipo]},
+                'costo_referencia': None if funcion.lineno in exponenciales
+                else float(expresion.evaluar(N_REFERENCIA))
+            })
+        self.reporte_funciones.sort(key=lambda fila: fila['linea_inicio'])
+
+        # Lo que queda fuera de todo def es el código de nivel de módulo
+        rangos = [(fila['linea_inicio'], fila['linea_fin']) for fila in self.reporte_funciones]
+        nivel_modulo = ExpresionCosto()
+        for linea, expresion in self.tiempo_algoritmo.por_linea.items():
+            if not any(inicio <= linea <= fin for inicio, fin in rangos):
+                nivel_modulo = nivel_modulo + expresion
+        ranking = self.ranking_funciones()
+        self.resumen_modulo = {
+            'funciones': sum(1 for fila in self.reporte_funciones if not fila['metodo']),
+            'metodos': sum(1 for fila in self.reporte_funciones if fila['metodo']),
+            'mas_costosa': ranking[0]['nombre'] if ranking else None,
+            'complejidad_nivel_modulo': nivel_modulo.complejidad(),
+            'funcion_tiempo_nivel_modulo': f"{nivel_modulo.firma()} = " + (nivel_modulo.a_texto() or "0")
+        }
 
-    def _procesar_condicional(self, node, nivel_actual):
-        self.detalles_analisis['condicionales'] += 1
-        self.detalles_analisis['operaciones_primitivas'] += 1
-        self.estructura_analizada.append(f"Condicional IF (nivel {nivel_actual})")
-
-        for child in node.body:
-            self._visitar_nodos(child, nivel_actual)
-        for child in node.orelse:
-            self._visitar_nodos(child, nivel_actual)
-
-    def _contar_oe(self, nodo):
-        if isinstance(nodo, ast.FunctionDef) or isinstance(nodo, ast.Subscript):
-            return 0
-        if isinstance(nodo, ast.Assign):
-            return 1 + self._contar_oe(nodo.value)
-        elif isinstance(nodo, ast.AugAssign):
-            return 2 + self._contar_oe(nodo.value)
-        elif isinstance(nodo, ast.BinOp):
-            return 1 + self._contar_oe(nodo.left) + self._contar_oe(nodo.right)
-        elif isinstance(nodo, ast.Compare):
-            return 1 + sum(self._contar_oe(comp) for comp in nodo.comparators)
-        elif isinstance(nodo, ast.Call):
-            return 1 + sum(self._contar_oe(arg) for arg in nodo.args)
-        elif isinstance(nodo, ast.Constant):
-            return 0
-        else:
-            return sum(self._contar_oe(child) for child in ast.iter_child_nodes(nodo))
+    def ranking_funciones(self):
+        """
+        Filas del reporte de la más costosa a la menos costosa (en n = N_REFERENCIA)
+        """
+        return sorted(self.reporte_funciones, reverse=True, key=lambda fila: float('inf')
+                      if fila['costo_referencia'] is None else fila['costo_referencia'])
 
     def _determinar_complejidad(self):
-        # Primero verificar la complejidad basada en el tiempo de algoritmo
-        if self.tiempo_algoritmo.cant_cubica > 0:
-            self.complejidad_detectada = "O(n^3)"
-        elif self.tiempo_algoritmo.cant_cuadratica > 0:
-            self.complejidad_detectada = "O(n²)"
-        elif self.tiempo_algoritmo.cant_nlogn > 0:
-            self.complejidad_detectada = "O(n log n)"
-        elif self.tiempo_algoritmo.cant_lineal > 0:
-            self.complejidad_detectada = "O(n)"
-        elif any(count > 0 for count in self.tiempo_algoritmo.log_bases.values()):
-            # Tomar la primera base de logaritmo con conteo > 0
-            base = next(b for b, cnt in self.tiempo_algoritmo.log_bases.items() if cnt > 0)
-            self.complejidad_detectada = f"O(log_{base} n)"
+        # La complejidad es la del término dominante de la expresión de costo,
+        # salvo que una recursión crezca exponencialmente (no es un polinomio)
+        recursion = self.detalles_analisis['recursion']
+        if recursion['exponencial']:
+            self.complejidad_detectada = recursion['complejidad']
         else:
-            self.complejidad_detectada = "O(1)"
+            self.complejidad_detectada = self.tiempo_algoritmo.expresion.complejidad()
 
     def _calcular_funcion_tiempo(self):
         try:
-            # Calcular basado en el tiempo de algoritmo
-            partes = []
-            
-            if self.tiempo_algoritmo.cant_cubica > 0:
-                partes.append(f"{self.tiempo_algoritmo.cant_cubica}n³")
-            if self.tiempo_algoritmo.cant_cuadratica > 0:
-                partes.append(f"{self.tiempo_algoritmo.cant_cuadratica}n²")
-            if self.tiempo_algoritmo.cant_nlogn > 0:
-                partes.append(f"{self.tiempo_algoritmo.cant_nlogn}n log n")
-            if self.tiempo_algoritmo.cant_lineal > 0:
-                partes.append(f"{self.tiempo_algoritmo.cant_lineal}n")
-                
-            # Agregar términos logarítmicos
-            for base, count in self.tiempo_algoritmo.log_bases.items():
-                if count > 0:
-                    partes.append(f"{count}log_{base}(n)")
-                    
-            if self.tiempo_algoritmo.cant_constante > 0:
-                partes.append(str(self.tiempo_algoritmo.cant_constante))
-                
-            if not partes:
-                self.funcion_tiempo = "T(n) = 1"
-            else:
-                self.funcion_tiempo = "T(n) = " + " + ".join(partes)
-                
+            # T(n) (o T(n, m) con varios tamaños) con todos los términos y sus
+            # coeficientes, de mayor a menor orden
+            texto = self.tiempo_algoritmo.expresion.a_texto()
+            self.funcion_tiempo = f"{self.tiempo_algoritmo.expresion.firma()} = " + (texto or "1")
+            recursion = self.detalles_analisis['recursion']
+            if recursion['exponencial']:
+                self.funcion_tiempo += f" + {recursion['complejidad']}"
         except Exception as e:
             self.funcion_tiempo = f"Error al calcular T(n): {str(e)}"
 
     # ===== Métodos del nuevo sistema de análisis =====
-    def _procesar_nodos(self, nodo):
-        for child in ast.iter_child_nodes(nodo):
-            if isinstance(child, ast.If):
-                self._clasificar_if(child)
-            elif isinstance(child, ast.For):
-                self._clasificar_for(child)
-            elif isinstance(child, ast.While):
-                self._clasificar_while(child)
-            else:
-                if isinstance(child, ast.Assign):
-                    self._procesar_instruccion_simple(child)
-                elif isinstance(child, ast.AugAssign):
-                    self._procesar_instruccion_aumentada(child)
-                elif isinstance(child, ast.Expr) and isinstance(child.value, ast.Call):
-                    if isinstance(child.value.func, ast.Name) and child.value.func.id == 'print':
-                        self._procesar_print(child)
-                    else:
-                        self._procesar_instruccion_simple(child)
-                elif isinstance(child, ast.Return):
-                    self._procesar_return(child)
-                elif isinstance(child, ast.Compare):
-                    self._procesar_comparacion(child)
-
-                self._procesar_nodos(child)
-
-    def _procesar_instruccion_simple(self, nodo):
+    def _procesar_nodos(self, nodo, tiempo=None):
+        if tiempo is None:
+            tiempo = self.tiempo_algoritmo
+        self._procesar_bloque(ast.iter_child_nodes(nodo), tiempo)
+        return tiempo
+
+    def _procesar_bloque(self, nodos, tiempo):
+        """
+        Aplica a cada nodo la regla registrada para su tipo (ver reglas). Si
+        la regla no costea el nodo completo, se suman además el costo de
+        biblioteca de la sentencia y el de sus hijos
+        """
+        for child in nodos:
+            regla = self.reglas.get(type(child))
+            if regla is not None and regla(self, child, tiempo):
+                continue
+            if isinstance(child, ast.stmt):
+                self._sumar_biblioteca(tiempo, [
+                    campo for campo in ast.iter_child_nodes(child) if isinstance(campo, ast.expr)
+                ], child.lineno)
+            self._procesar_nodos(child, tiempo)
+
+    def _procesar_funcion(self, nodo, tiempo):
+        # El cuerpo ya se costeó en _costear_funciones. Si la función se
+        # llama desde el código, su costo ya está en cada llamada
+        tiempo.incorporar(self._cuerpos[nodo], solo_lineas=self.grafo_llamadas.tiene_llamadores(nodo))
+        return True
+
+    def _procesar_expresion(self, nodo, tiempo):
+        if not isinstance(nodo.value, ast.Call):
+            # Docstrings y otras expresiones sueltas: solo las OE que contienen
+            self._sumar_sentencia(nodo, tiempo)
+            return True
+        if isinstance(nodo.value.func, ast.Name) and nodo.value.func.id == 'print':
+            self._procesar_print(nodo, tiempo)
+        else:
+            self._procesar_instruccion_simple(nodo, tiempo)
+        return True
+
+    def _sumar_sentencia(self, nodo, tiempo, tipo=None, propias=None):
+        """
+        Suma las OE de una sentencia simple con su tipo real: las de todo su
+        árbol (a[i] = o.x * 2 son una asignación, dos subíndices o atributos
+        y una multiplicación) más las propias de la sentencia que no son un
+        nodo) como devolver en return). Si no hay ninguna y se indica un
+        tipo, cuenta 1 OE de ese tipo. También suma el costo de biblioteca de
+        sus expresiones
+        """
+        oe = contar_oe_por_tipo(nodo)
+        oe.update(propias or {})
+        if not oe and tipo:
+            oe[tipo] = 1
+        tiempo.sumar_histograma(oe, 1, nodo.lineno)
+        self._sumar_biblioteca(tiempo, [
+            campo for campo in ast.iter_child_nodes(nodo) if isinstance(campo, ast.expr)
+        ], nodo.lineno)
+
+    def _sumar_biblioteca(self, tiempo, expresiones, linea, repeticiones=1):
+        """
+        Suma el costo de biblioteca de las expresiones. El de las funciones del
+        código llamadas directamente (fuera de comprensiones) se reparte entre
+        los tipos como en su cuerpo; el resto cuenta como llamada
+        """
+        resto = self._costo_biblioteca(*expresiones) * repeticiones
+        for llamada in recorrer_local(expresiones):
+            if not isinstance(llamada, ast.Call) or self._en_comprension(llamada, expresiones):
+                continue
+            for tipo, parte in self._tipos_llamada_propia(llamada).items():
+                tiempo.sumar(parte * repeticiones, linea, tipo)
+                resto = resto - parte * repeticiones
+        tiempo.sumar(resto, linea)
+
+    def _en_comprension(self, nodo, raices):
+        while nodo not in raices:
+            nodo = self.indice[nodo].padre
+            if isinstance(nodo, _COMPRENSIONES):
+                return True
+        return False
+
+    def _tipos_llamada_propia(self, llamada):
+        """
+        Costo por tipo de una llamada a una función del código que cuesta lo
+        que su cuerpo; vacío si no es así (recursiones, varios destinos posibles)
+        """
+        info = self.indice.get(llamada)
+        funcion = info.funcion if info else None
+        destinos = [
+            destino for destino in self.grafo_llamadas.destinos(llamada, funcion)
+            if destino in self.costos_llamada and not self.grafo_llamadas.misma_componente(funcion, destino)
+        ]
+        if len(destinos) != 1 or destinos[0] not in self._cuerpos:
+            return {}
+        destino = destinos[0]
+        cuerpo = self._cuerpos[destino]
+        if self.costos_llamada[destino] != cuerpo.expresion:
+            return {}
+        return {
+            tipo: self._costo_en_llamada(expresion, destino, llamada)
+            for tipo, expresion in cuerpo.por_tipo.items() if expresion and tipo != 'llamada'
+        }
+
+    def _costo_biblioteca(self, *expresiones):
+        """
+        Costo de las operaciones de biblioteca de las expresiones según el modelo de costos
+        """
+        total = ExpresionCosto()
+        for expresion in expresiones:
+            total = total + self.modelo_costos.costo_expresion(expresion, self.contexto_tipos)
+        return total
+
+    def _tiempo_bloque(self, nodos):
+        """
+        Calcula el tiempo de un bloque de sentencias recorriendo los nodos
+        del árbol ya parseado (sin volver a extraer ni parsear su código)
+        """
+        tiempo = TiempoAlgoritmo()
+        self._procesar_bloque(nodos, tiempo)
+        return tiempo
+
+    def _procesar_instruccion_simple(self, nodo, tiempo):
         lineno = nodo.lineno
         self.instruccion_simples.append(self.lineas[lineno - 1].strip())
-        self.tiempo_algoritmo.agregar_constante()
+        self._sumar_sentencia(nodo, tiempo, 'asignacion' if isinstance(nodo, ast.Assign) else 'llamada')
+        return True
 
-    def _procesar_print(self, nodo):
+    def _procesar_print(self, nodo, tiempo):
         lineno = nodo.lineno
         self.instruccion_simples.append(self.lineas[lineno - 1].strip())
-        self.tiempo_algoritmo.agregar_constante()
+        self._sumar_sentencia(nodo, tiempo, 'llamada')
 
-    def _procesar_return(self, nodo):
+    def _procesar_return(self, nodo, tiempo):
         lineno = nodo.lineno
         self.instruccion_simples.append(self.lineas[lineno - 1].strip())
-        self.tiempo_algoritmo.agregar_constante()
+        # Devolver el valor cuenta como una asignación
+        self._sumar_sentencia(nodo, tiempo, 'asignacion', Counter(asignacion=1))
+        return True
 
-    def _procesar_comparacion(self, nodo):
+    def _procesar_comparacion(self, nodo, tiempo):
         lineno = nodo.lineno
         comparacion = self.lineas[lineno - 1].strip()
         ops = nodo.ops
 
         if any(isinstance(op, (ast.Gt, ast.Lt, ast.Eq)) for op in ops):
             self.instruccion_simples.append(comparacion)
-            self.tiempo_algoritmo.agregar_constante()
         elif any(isinstance(op, (ast.GtE, ast.LtE, ast.NotEq)) for op in ops):
-            self.instruccion_compuestas.append(comparacion)
-            self.tiempo_algoritmo.agregar_constante()
-            self.tiempo_algoritmo.agregar_constante()
+            self.instruccion_compuesta.append(comparacion)
+        tiempo.sumar_histograma(contar_oe_por_tipo(nodo), 1, nodo.lineno)
+        self._sumar_biblioteca(tiempo, [nodo], nodo.lineno)
+        return True
 
-    def _procesar_instruccion_aumentada(self, nodo):
+    def _procesar_instruccion_aumentada(self, nodo, tiempo):
         lineno = nodo.lineno
         self.instruccion_simples_aumentadas.append(self.lineas[lineno - 1].strip())
-        self.tiempo_algoritmo.agregar_constante()
-        self.tiempo_algoritmo.agregar_constante()
+        self._sumar_sentencia(nodo, tiempo, 'aritmetica')
+        return True
 
     def _obtener_bloque(self, nodo):
         start_line = nodo.lineno - 1
         end_line = self._encontrar_fin_bloque(start_line)
         return "\n".join(self.lineas[start_line:end_line])
 
-    def _clasificar_if(self, nodo_if):
+    def _clasificar_if(self, nodo_if, tiempo):
         bloques = []
-        bloques.append((self._extraer_codigo_bloque(nodo_if.body), "if"))
+        bloques.append((nodo_if.body, "if"))
         
         current_node = nodo_if
         while current_node.orelse and any(isinstance(n, ast.If) for n in current_node.orelse):
             next_if = next(n for n in current_node.orelse if isinstance(n, ast.If))
-            bloques.append((self._extraer_codigo_bloque(next_if.body), "elif"))
+            bloques.append((next_if.body, "elif"))
             current_node = next_if
         
         if current_node.orelse and not all(isinstance(n, ast.If) for n in current_node.orelse):
-            bloques.append((self._extraer_codigo_bloque(current_node.orelse), "else"))
+            bloques.append((current_node.orelse, "else"))
         
-        tiempos = []
-        for codigo_bloque, tipo in bloques:
-            analizador_temp = AnalizadorAlgoritmo()
-            analizador_temp.analizar_codigo(codigo_bloque)
-            tiempos.append(analizador_temp.tiempo_algoritmo)
+        tiempos = [self._tiempo_bloque(cuerpo) for cuerpo, tipo in bloques]
         
         tiempo_max = self._obtener_tiempo_maximo(tiempos)
-        self._sumar_tiempo(tiempo_max)
+        self._sumar_tiempos(tiempo, tiempo_max)
+
+        # Condiciones de toda la cadena if/elif
+        actual = nodo_if
+        self._registrar_condicional(actual, tiempo)
+        while len(actual.orelse) == 1 and isinstance(actual.orelse[0], ast.If):
+            actual = actual.orelse[0]
+            self._registrar_condicional(actual, tiempo)
         
         bloque_completo = self._obtener_bloque(nodo_if)
         hay_elif = False
@@ -368,66 +834,33 @@ class AnalizadorAlgoritmo:
             self.instruccion_condicionales_completas.append(bloque_completo)
         else:
             self.instruccion_condicionales.append(bloque_completo)
+        return True
 
-    def _extraer_codigo_bloque(self, nodos):
-        if not nodos:
-            return ""
-
-        lineas_bloque = []
-        min_indent = None
-
-        for nodo in nodos:
-            start = nodo.lineno - 1
-            end = nodo.end_lineno if hasattr(nodo, 'end_lineno') else nodo.lineno
-            for i in range(start, end):
-                linea = self.lineas[i]
-                if linea.strip() == "":
-                    continue
-                lineas_bloque.append(linea)
-                indent_actual = len(linea) - len(linea.lstrip())
-                if min_indent is None or indent_actual < min_indent:
-                    min_indent = indent_actual
-
-        lineas_sin_indent = [linea[min_indent:] if len(linea) > min_indent else linea for linea in lineas_bloque]
-        return "\n".join(lineas_sin_indent).strip()
+    def _registrar_condicional(self, nodo, tiempo):
+        self.detalles_analisis['condicionales'] += 1
+        self._anotar(nodo.lineno, f"Condicional IF (nivel {len(self.indice[nodo].bucles)})")
+        # Como en el while, la condición cuenta las OE de su árbol por tipo
+        tiempo.sumar_histograma(contar_oe_por_tipo(nodo.test) or Counter(comparacion=1), 1, nodo.lineno)
+        self._sumar_biblioteca(tiempo, [nodo.test], nodo.lineno)
 
     def _obtener_tiempo_maximo(self, tiempos):
         max_tiempo = TiempoAlgoritmo()
         
         for tiempo in tiempos:
-            if tiempo.cant_constante > max_tiempo.cant_constante:
-                max_tiempo.cant_constante = tiempo.cant_constante
-            if tiempo.cant_lineal > max_tiempo.cant_lineal:
-                max_tiempo.cant_lineal = tiempo.cant_lineal
-            if tiempo.cant_cuadratica > max_tiempo.cant_cuadratica:
-                max_tiempo.cant_cuadratica = tiempo.cant_cuadratica
-            if tiempo.cant_cubica > max_tiempo.cant_cubica:
-                max_tiempo.cant_cubica = tiempo.cant_cubica
-            if tiempo.cant_nlogn > max_tiempo.cant_nlogn:
-                max_tiempo.cant_nlogn = tiempo.cant_nlogn
-            
-            for base in tiempo.log_bases:
-                if tiempo.log_bases[base] > max_tiempo.log_bases[base]:
-                    max_tiempo.log_bases[base] = tiempo.log_bases[base]
+            max_tiempo.expresion = max_tiempo.expresion.maximo(tiempo.expresion)
+            # Cada rama está en líneas distintas: se conserva el costo de todas
+            max_tiempo.por_linea.update(tiempo.por_linea)
+
+        # Cada término se reparte entre los tipos como en la rama que lo aporta
+        for clave, coeficiente in max_tiempo.expresion.terminos.items():
+            rama = next(t for t in tiempos if t.expresion.terminos.get(clave) == coeficiente)
+            for tipo, expresion in rama.por_tipo.items():
+                if clave in expresion.terminos:
+                    parte = ExpresionCosto({clave: expresion.terminos[clave]})
+                    max_tiempo.por_tipo[tipo] = max_tiempo.por_tipo.get(tipo, ExpresionCosto()) + parte
         
         return max_tiempo
 
-    def _sumar_tiempo(self, tiempo):
-        for _ in range(tiempo.cant_constante):
-            self.tiempo_algoritmo.agregar_constante()
-        for _ in range(tiempo.cant_lineal):
-            self.tiempo_algoritmo.agregar_lineal()
-        for _ in range(tiempo.cant_cuadratica):
-            self.tiempo_algoritmo.agregar_cuadratica()
-        for _ in range(tiempo.cant_cubica):
-            self.tiempo_algoritmo.agregar_cubica()
-        for _ in range(tiempo.cant_nlogn):
-            self.tiempo_algoritmo.agregar_nlogn()
-        
-        for base in tiempo.log_bases:
-            for _ in range(tiempo.log_bases[base]):
-                self.tiempo_algoritmo.agregar_logaritmica_base(base)
-
     def _extraer_codigo_nodos(self, nodos):
         if not nodos:
             return ""
@@ -463,81 +896,152 @@ class AnalizadorAlgoritmo:
         
         return '\n'.join(lineas_sin_indent)
 
-    def _clasificar_for(self, nodo):
+    def _clasificar_for(self, nodo, tiempo):
         bloque = self._extraer_codigo_nodos([nodo])
-        analizador_cuerpo = AnalizadorAlgoritmo()
-        cuerpo_codigo = self._extraer_codigo_nodos(nodo.body)
-        analizador_cuerpo.analizar_codigo(cuerpo_codigo)
+        # El cuerpo se calcula primero (de abajo hacia arriba); puede depender
+        # de la variable de este bucle, que se suma sobre todas sus iteraciones
+        cuerpo = self._tiempo_bloque(nodo.body)
 
-        es_lineal = self._es_for_lineal(nodo)
         nivel = self._calcular_nivel_anidamiento(nodo)
         bloque_con_nivel = f"# Nivel de anidamiento: {nivel}\n{bloque}"
 
         if nivel > 1:
             self.instruccion_for_anidados.append(bloque_con_nivel)
-            self.tiempo_algoritmo.agregar_constante()
-            self.tiempo_algoritmo.cant_lineal += 3
-            self.tiempo_algoritmo.cant_lineal += 1
-            self.tiempo_algoritmo.cant_cuadratica += 3
-
-            if analizador_cuerpo.tiempo_algoritmo.cant_constante > 0:
-                self.tiempo_algoritmo.cant_cuadratica += analizador_cuerpo.tiempo_algoritmo.cant_constante
-            if analizador_cuerpo.tiempo_algoritmo.cant_lineal > 0:
-                self.tiempo_algoritmo.cant_cubica += analizador_cuerpo.tiempo_algoritmo.cant_lineal
         else:
             self.instruccion_for.append(bloque_con_nivel)
-            self.tiempo_algoritmo.agregar_constante()
-            self.tiempo_algoritmo.agregar_constante()
 
-            if es_lineal:
-                self.tiempo_algoritmo.cant_lineal += 3
-                self.tiempo_algoritmo.cant_lineal += analizador_cuerpo.tiempo_algoritmo.cant_constante
-                self.tiempo_algoritmo.cant_cuadratica += analizador_cuerpo.tiempo_algoritmo.cant_lineal
-            else:
-                self.tiempo_algoritmo.agregar_constante()
-                self.tiempo_algoritmo.agregar_constante()
-                self._sumar_tiempos(self.tiempo_algoritmo, analizador_cuerpo.tiempo_algoritmo)
-
-    def _es_for_lineal(self, nodo_for):
-        if isinstance(nodo_for.iter, ast.Call) and \
-        isinstance(nodo_for.iter.func, ast.Name) and \
-        nodo_for.iter.func.id == 'range':
-            
-            if len(nodo_for.iter.args) == 1:
-                arg = nodo_for.iter.args[0]
-                if isinstance(arg, ast.Name):
-                    return True
-                elif isinstance(arg, ast.Constant) and isinstance(arg.value, int):
-                    return False
+        limites = self._limites_range(nodo)
+        if limites:
+            variable, inicio, fin, paso = limites
+            iteraciones = (fin - inicio) * Fraction(1, paso)
+            repetir = lambda expresion: expresion.sumatoria(variable, inicio, fin, paso)
+        else:
+            # Recorrido de una colección: n, o la letra de su tamaño (m, k, ...)
+            iteraciones = ExpresionCosto.potencia(self.tamanos.variable(nodo.iter))
+            repetir = lambda expresion: expresion * iteraciones
+
+        # Inicialización (2) más el iterable (una vez), control del bucle (3 por
+        # vuelta: comparar, incrementar y asignar) y el cuerpo en cada vuelta
+        self._sumar_biblioteca(tiempo, [nodo.iter], nodo.lineno)
+        tiempo.sumar(1 + iteraciones, nodo.lineno, 'asignacion')
+        tiempo.sumar(1 + iteraciones, nodo.lineno, 'comparacion')
+        tiempo.sumar(iteraciones, nodo.lineno, 'aritmetica')
+        tiempo.incorporar(cuerpo, repetir)
+        self._registrar_bucle(nodo, _CONTROL_FOR)
         return True
-    
-    def _calcular_nivel_anidamiento(self, nodo_objetivo):
-        for parent in ast.walk(self.tree):
-            for child in ast.iter_child_nodes(parent):
-                setattr(child, 'parent', parent)
 
-        nivel = 0
-        actual = nodo_objetivo
-        while hasattr(actual, 'parent'):
-            actual = actual.parent
-            if isinstance(actual, ast.For):
-                nivel += 1
+    def _limites_range(self, nodo_for):
+        """
+        (variable, inicio, fin, paso) de un for sobre range(...), con inicio y
+        fin como expresiones simbólicas; None si no es un range con paso constante
+        """
+        iterable = nodo_for.iter
+        if not (isinstance(iterable, ast.Call) and isinstance(iterable.func, ast.Name)
+                and iterable.func.id == 'range' and 1 <= len(iterable.args) <= 3
+                and isinstance(nodo_for.target, ast.Name)):
+            return None
+
+        argumentos = iterable.args
+        paso = 1
+        if len(argumentos) == 3:
+            paso = self._valor_constante(argumentos[2])
+            if not isinstance(paso, int) or paso == 0:
+                return None
+        if len(argumentos) == 1:
+            inicio, fin = ExpresionCosto.constante(0), self._expresion_simbolica(argumentos[0])
+        else:
+            inicio, fin = self._expresion_simbolica(argumentos[0]), self._expresion_simbolica(argumentos[1])
+        return self._simbolo_indice(nodo_for.target.id), inicio, fin, paso
+
+    @staticmethod
+    def _simbolo_indice(nombre):
+        """
+        Símbolo de la variable de un for sobre range, distinto de las letras de tamaño
+        """
+        return f"_{nombre}"
+
+    def _en_iterable(self, nodo, bucle):
+        """
+        Indica si el nodo está dentro del iterable (for x in ...) del bucle
+        """
+        while nodo is not None and self.indice[nodo].padre is not bucle:
+            nodo = self.indice[nodo].padre
+        return nodo is bucle.iter
+
+    def _valor_constante(self, nodo):
+        if isinstance(nodo, ast.Constant) and isinstance(nodo.value, int):
+            return nodo.value
+        if isinstance(nodo, ast.UnaryOp) and isinstance(nodo.op, ast.USub):
+            valor = self._valor_constante(nodo.operand)
+            return -valor if valor is not None else None
+        return None
+
+    def _expresion_simbolica(self, nodo):
+        """
+        Traduce una expresión de Python a ExpresionCosto. Las variables de los
+        for sobre range que la contienen se conservan por nombre (para sumarlas
+        después) y cualquier otro tamaño (nombres, len(...)) es la letra que le
+        asigna VariablesTamano
+        """
+        if isinstance(nodo, ast.Constant) and isinstance(nodo.value, (int, float)):
+            return ExpresionCosto.constante(nodo.value) if nodo.value else ExpresionCosto()
+        if isinstance(nodo, ast.Name):
+            # El nombre se refiere a la variable del for más interno que la
+            # asigna, sin contar el for en cuyo propio range aparece
+            # (for i in range(i, n) usa la i de afuera)
+            for bucle in reversed(self.indice[nodo].bucles):
+                if isinstance(bucle, ast.For) and isinstance(bucle.target, ast.Name) \
+                        and bucle.target.id == nodo.id and not self._en_iterable(nodo, bucle):
+                    if self._limites_range(bucle):
+                        return ExpresionCosto.potencia(self._simbolo_indice(nodo.id))
+                    break
+            return ExpresionCosto.potencia(self.tamanos.variable(nodo))
+        if isinstance(nodo, ast.UnaryOp) and isinstance(nodo.op, ast.USub):
+            return -self._expresion_simbolica(nodo.operand)
+        if isinstance(nodo, ast.BinOp):
+            izquierda = self._expresion_simbolica(nodo.left)
+            if isinstance(nodo.op, (ast.Add, ast.Sub, ast.Mult)):
+                derecha = self._expresion_simbolica(nodo.right)
+                if isinstance(nodo.op, ast.Add):
+                    return izquierda + derecha
+                if isinstance(nodo.op, ast.Sub):
+                    return izquierda - derecha
+                return izquierda * derecha
+            constante = self._valor_constante(nodo.right)
+            if isinstance(nodo.op, (ast.FloorDiv, ast.Div)) and constante:
+                return izquierda * Fraction(1, constante)
+            if isinstance(nodo.op, ast.Pow) and constante is not None and constante >= 0:
+                return izquierda ** constante
+        return ExpresionCosto.potencia(self.tamanos.variable(nodo))
 
-        return nivel + 1
+    def _calcular_nivel_anidamiento(self, nodo_objetivo):
+        return self.indice[nodo_objetivo].nivel_for + 1
 
     def _sumar_tiempos(self, tiempo_destino, tiempo_origen):
-        tiempo_destino.cant_constante += tiempo_origen.cant_constante
-        tiempo_destino.cant_lineal += tiempo_origen.cant_lineal
-        tiempo_destino.cant_cuadratica += tiempo_origen.cant_cuadratica
-        tiempo_destino.cant_cubica += tiempo_origen.cant_cubica
-        tiempo_destino.cant_nlogn += tiempo_origen.cant_nlogn
-        
-        for base in tiempo_origen.log_bases:
-            if base in tiempo_destino.log_bases:
-                tiempo_destino.log_bases[base] += tiempo_origen.log_bases[base]
+        tiempo_destino.incorporar(tiempo_origen)
 
-    def _clasificar_while(self, nodo):
+    def _clasificar_while(self, nodo, tiempo):
         bloque = self._obtener_bloque(nodo)
+
+        # Cota de iteraciones inferida de la condición y las actualizaciones;
+        # la condición se evalúa una vez por vuelta y una más al salir
+        tipo, iteraciones = AnalizadorWhile().inferir_iteraciones(nodo)
+        iteraciones = iteraciones.renombrar({"n": self._variable_while(nodo)})
+        cuerpo = self._tiempo_bloque(nodo.body)
+        condicion = contar_oe_por_tipo(nodo.test) or Counter(comparacion=1)
+        tiempo.sumar_histograma(condicion, iteraciones + 1, nodo.lineno)
+        self._sumar_biblioteca(tiempo, [nodo.test], nodo.lineno, iteraciones + 1)
+        tiempo.incorporar(cuerpo, lambda expresion: expresion * iteraciones)
+        self._registrar_bucle(nodo, condicion)
+        if nodo.orelse:
+            self._sumar_tiempos(tiempo, self._tiempo_bloque(nodo.orelse))
+        self._anotar(nodo.lineno, f"Iteraciones del WHILE (línea {nodo.lineno}): {iteraciones.a_texto()} ({tipo})")
+
+        bucles = self.indice[nodo].bucles
+        if bucles and isinstance(bucles[-1], ast.For) and bucles[-1] not in self._for_con_while:
+            self._for_con_while.add(bucles[-1])
+            self.instruccion_for_conwhile.append(self._extraer_codigo_nodos([bucles[-1]]))
+
         tiene_while = any(isinstance(n, ast.While) for n in ast.iter_child_nodes(nodo))
         tiene_for = any(isinstance(n, ast.For) for n in ast.iter_child_nodes(nodo))
 
@@ -547,6 +1051,24 @@ class AnalizadorAlgoritmo:
             self.instruccion_while_confor.append(bloque)
         else:
             self.instruccion_while.append(bloque)
+        return True
+
+    def _variable_while(self, nodo):
+        """
+        Tamaño que limita un while: la letra de los nombres de la condición que
+        el cuerpo no modifica (y de sus len(...)), si todos comparten la misma
+        """
+        asignados = {
+            n.id for sentencia in nodo.body for n in ast.walk(sentencia)
+            if isinstance(n, ast.Name) and isinstance(n.ctx, ast.Store)
+        }
+        candidatos = [
+            n for n in ast.walk(nodo.test)
+            if (isinstance(n, ast.Name) and n.id not in asignados and self.tamanos.clave(n) is not None)
+            or (isinstance(n, ast.Call) and isinstance(n.func, ast.Name) and n.func.id == 'len')
+        ]
+        letras = {self.tamanos.variable(n) for n in candidatos}
+        return letras.pop() if len(letras) == 1 else "n"
 
     def _encontrar_fin_bloque(self, start_index):
         base_indent = len(self.lineas[start_index]) - len(self.lineas[start_index].lstrip())
@@ -559,10 +1081,47 @@ class AnalizadorAlgoritmo:
                 return i
         return len(self.lineas)
 
-    def _agregar_referencias_parent(self):
-        for nodo in ast.walk(self.tree):
+    def _construir_indice(self):
+        """
+        Recorre el árbol una sola vez y guarda para cada nodo su InfoNodo,
+        de modo que las consultas de anidamiento sean búsquedas O(1)
+        """
+        self.indice = {self.tree: InfoNodo()}
+        pendientes = [self.tree]
+        while pendientes:
+            nodo = pendientes.pop()
+            info = self.indice[nodo]
+            bucles = info.bucles + (nodo,) if isinstance(nodo, (ast.For, ast.While)) else info.bucles
+            funcion = nodo if isinstance(nodo, (ast.FunctionDef, ast.AsyncFunctionDef)) else info.funcion
             for hijo in ast.iter_child_nodes(nodo):
                 hijo.parent = nodo
+                self.indice[hijo] = InfoNodo(nodo, bucles, funcion)
+                pendientes.append(hijo)
+
+    # Regla de cada tipo de nodo: regla(analizador, nodo, tiempo) suma a tiempo
+    # el costo del nodo y registra lo que encuentra. Devuelve True si costeó el
+    # nodo completo (estructuras de control y funciones); las llamadas y las
+    # comprensiones las costea el modelo de costos dentro de cada sentencia
+    reglas = {
+        ast.If: _clasificar_if,
+        ast.For: _clasificar_for,
+        ast.While: _clasificar_while,
+        ast.FunctionDef: _procesar_funcion,
+        ast.AsyncFunctionDef: _procesar_funcion,
+        ast.Assign: _procesar_instruccion_simple,
+        ast.AugAssign: _procesar_instruccion_aumentada,
+        ast.Expr: _procesar_expresion,
+        ast.Return: _procesar_return,
+        ast.Compare: _procesar_comparacion,
+    }
+
+    @classmethod
+    def registrar_regla(cls, tipo_nodo, regla):
+        """
+        Agrega o reemplaza la regla de un tipo de nodo (solo para esta clase y
+        sus subclases)
+        """
+        cls.reglas = {**cls.reglas, tipo_nodo: regla}
 
     def mostrar_resultados(self):
         def imprimir_bloques(nombre, bloques):
@@ -608,6 +1167,37 @@ class AnalizadorAlgoritmo:
         print("Cantidad de OEs (Operaciones Elementales Cuadraticos):", self.tiempo_algoritmo.cant_cuadratica)
         print("Cantidad de OEs (Operaciones Elementales Cubicos):", self.tiempo_algoritmo.cant_cubica)
 
+    def obtener_datos(self):
+        """
+        Devuelve los resultados del análisis como diccionario serializable
+        """
+        return {
+            'complejidad': self.complejidad_detectada,
+            'funcion_tiempo': self.funcion_tiempo,
+            'operaciones_primitivas': self.detalles_analisis['operaciones_primitivas'],
+            'oe': {
+                'constante': self.tiempo_algoritmo.cant_constante,
+                'lineal': self.tiempo_algoritmo.cant_lineal,
+                'cuadratica': self.tiempo_algoritmo.cant_cuadratica,
+                'cubica': self.tiempo_algoritmo.cant_cubica,
+                'nlogn': self.tiempo_algoritmo.cant_nlogn,
+                'logaritmica': {base: cant for base, cant in self.tiempo_algoritmo.log_bases.items() if cant > 0}
+            },
+            'terminos': self.tiempo_algoritmo.expresion.como_lista(),
+            'terminos_por_tipo': [
+                {
+                    'termino': fila['termino'],
+                    'oe_por_tipo': {tipo: str(coeficiente) if isinstance(coeficiente, Fraction) else coeficiente
+                                    for tipo, coeficiente in fila['oe_por_tipo'].items()}
+                }
+                for fila in self.tiempo_algoritmo.histograma_terminos()
+            ],
+            'costo_por_linea': self.costo_por_linea,
+            'funciones': self.reporte_funciones,
+            'modulo': dict(self.resumen_modulo, complejidad=self.complejidad_detectada),
+            'detalles': dict(self.detalles_analisis)
+        }
+
     def obtener_resumen(self):
         resumen = f"""
 ANÁLISIS DE COMPLEJIDAD ALGORÍTMICA
@@ -615,7 +1205,10 @@ ANÁLISIS DE COMPLEJIDAD ALGORÍTMICA
 
 Complejidad detectada: {self.complejidad_detectada}
 Función de tiempo estimada: {self.funcion_tiempo}
-
+"""
+        if self.medicion is not None and self.medicion.clase_espacio:
+            resumen += f"Complejidad espacial (empírica): {self.medicion.clase_espacio}\n"
+        resumen += f"""
 Detalles del análisis:
 - Bucles FOR encontrados: {self.detalles_analisis['bucles_for']}
 - Bucles WHILE encontrados: {self.detalles_analisis['bucles_while']}
@@ -639,6 +1232,51 @@ Estructuras encontradas:
         for base, count in self.tiempo_algoritmo.log_bases.items():
             if count > 0:
                 resumen += f"- Operaciones logarítmicas (log_{base} n): {count}\n"
+
+        adicionales = self.tiempo_algoritmo.terminos_adicionales()
+        if adicionales:
+            resumen += f"- Términos de otros órdenes: {adicionales.a_texto()}\n"
+
+        resumen += "\nOPERACIONES ELEMENTALES POR TIPO:\n"
+        resumen += f"- En el código ({self.detalles_analisis['operaciones_primitivas']}): " \
+                   f"{texto_histograma(self.detalles_analisis['oe_por_tipo'])}\n"
+        for bucle in sorted(self.detalles_analisis['oe_por_bucle'], key=lambda b: b['linea']):
+            resumen += f"- Una vuelta del {bucle['bucle']} de la línea {bucle['linea']}: " \
+                       f"{texto_histograma(bucle['oe_por_tipo'])}\n"
+        for fila in self.tiempo_algoritmo.histograma_terminos():
+            resumen += f"- Término {fila['termino']}: {texto_histograma(fila['oe_por_tipo'])}\n"
+
+        recursion = self.detalles_analisis['recursion']
+        if recursion['detectada']:
+            resumen += f"\nRECURSIÓN ({recursion['tipo']}):\n"
+            for info in recursion['funciones']:
+                resumen += f"- {info['nombre']}: {info['recurrencia']}\n"
+                if info['complejidad']:
+                    promedio = " (caso promedio, particiones balanceadas)" if info['caso_promedio'] else ""
+                    resumen += f"  {info['metodo']}: {info['complejidad']}{promedio}\n"
+
+        if self.reporte_funciones:
+            resumen += "\nFUNCIONES (de mayor a menor costo):\n"
+            for fila in self.ranking_funciones():
+                resumen += (f"- {fila['nombre']} (líneas {fila['linea_inicio']}-{fila['linea_fin']}): "
+                            f"{fila['complejidad']}, {fila['funcion_tiempo']}, OE: {fila['oe']}\n")
+            if not self.resumen_modulo['funcion_tiempo_nivel_modulo'].endswith(" = 0"):
+                resumen += (f"- Nivel de módulo: {self.resumen_modulo['complejidad_nivel_modulo']}, "
+                            f"{self.resumen_modulo['funcion_tiempo_nivel_modulo']}\n")
+
+        calientes = sorted(self.costo_por_linea.items(), key=lambda item: item[1]['proporcion'], reverse=True)[:5]
+        if calientes:
+            resumen += f"\nLÍNEAS MÁS COSTOSAS (n = {N_REFERENCIA}):\n"
+            for linea, costo in calientes:
+                codigo = self.lineas[linea - 1].strip() if linea <= len(self.lineas) else ""
+                resumen += f"- Línea {linea} ({costo['proporcion']:.1%}, {costo['complejidad']}): {codigo}\n"
+
+        patrones = self.detalles_analisis['patrones']
+        if patrones:
+            resumen += "\nPATRONES INEFICIENTES:\n"
+            for patron in patrones:
+                resumen += f"- Línea {patron['linea']}: {patron['mensaje']}\n"
+                resumen += f"  Sugerencia: {patron['sugerencia']}\n"
         
         return resumen
 
@@ -0,0 +1,128 @@
+# analizador_lotes.py (análisis por lotes desde la línea de comandos)
+import argparse
+import glob
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from cache_analisis import CacheAnalisis
+from errores import ErrorAnalisis
+from modelo_costos import ModeloCostos
+
+# Caché del proceso actual (cada proceso del pool abre la suya)
+_cache = None
+
+
+def descubrir_archivos(rutas):
+    """
+    Devuelve los archivos .py de las rutas dadas (directorios, globs o archivos)
+    """
+    vistos = set()
+    for ruta in rutas:
+        if os.path.isdir(ruta):
+            candidatos = []
+            for carpeta, subcarpetas, archivos in os.walk(ruta):
+                subcarpetas[:] = sorted(d for d in subcarpetas if not d.startswith('.') and d != '__pycache__')
+                candidatos.extend(os.path.join(carpeta, a) for a in sorted(archivos) if a.endswith('.py'))
+        elif glob.has_magic(ruta):
+            candidatos = sorted(glob.glob(ruta, recursive=True))
+        else:
+            candidatos = [ruta]
+
+        for archivo in candidatos:
+            clave = os.path.normpath(archivo)
+            if archivo.endswith('.py') and os.path.isfile(archivo) and clave not in vistos:
+                vistos.add(clave)
+                yield archivo
+
+
+def _obtener_cache(ruta_cache, ruta_costos=None):
+    global _cache
+    if _cache is None:
+        modelo = ModeloCostos.desde_archivo(ruta_costos) if ruta_costos else None
+        _cache = CacheAnalisis(ruta_disco=ruta_cache, modelo_costos=modelo)
+    return _cache
+
+
+def analizar_archivo(ruta, ruta_cache=None, ruta_costos=None):
+    """
+    Analiza un archivo completo una sola vez (se ejecuta en un proceso del
+    pool) y devuelve una fila por función a partir del reporte por función,
+    de modo que las llamadas entre funciones del archivo se resuelvan igual
+    que en la interfaz
+    """
+    cache = _obtener_cache(ruta_cache, ruta_costos)
+    try:
+        with open(ruta, 'r', encoding='utf-8') as f:
+            codigo = f.read()
+        analizador = cache.analizar(codigo)
+    except ErrorAnalisis as e:
+        return [{'archivo': ruta, 'error': e.como_diccionario()}]
+    except SyntaxError as e:
+        return [{'archivo': ruta, 'error': {'tipo': 'ErrorSintaxis', 'mensaje': str(e), 'linea': e.lineno}}]
+    except (OSError, UnicodeDecodeError, ValueError) as e:
+        return [{'archivo': ruta, 'error': {'tipo': type(e).__name__, 'mensaje': str(e)}}]
+
+    resultados = []
+    for fila in analizador.reporte_funciones:
+        resultado = {'archivo': ruta, 'funcion': fila['nombre']}
+        resultado.update((clave, valor) for clave, valor in fila.items() if clave != 'nombre')
+        resultado['costo_por_linea'] = {
+            linea: costo for linea, costo in analizador.costo_por_linea.items()
+            if fila['linea_inicio'] <= linea <= fila['linea_fin']
+        }
+        resultados.append(resultado)
+    return resultados
+
+
+def analizar_rutas(rutas, procesos=None, ruta_cache=None, ruta_costos=None):
+    """
+    Analiza en paralelo los archivos de las rutas y va devolviendo un
+    resultado por función a medida que cada archivo termina
+    """
+    archivos = list(descubrir_archivos(rutas))
+    if procesos == 1:
+        for archivo in archivos:
+            yield from analizar_archivo(archivo, ruta_cache, ruta_costos)
+        return
+
+    with ProcessPoolExecutor(max_workers=procesos) as pool:
+        futuros = [pool.submit(analizar_archivo, archivo, ruta_cache, ruta_costos) for archivo in archivos]
+        for futuro in as_completed(futuros):
+            yield from futuro.result()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Analiza la complejidad de cada función de los archivos .py indicados "
+                    "y emite un resultado JSON por línea"
+    )
+    parser.add_argument('rutas', nargs='+', help="directorios, globs (p. ej. 'src/**/*.py') o archivos")
+    parser.add_argument('-j', '--procesos', type=int, default=os.cpu_count(),
+                        help="número de procesos de análisis (por defecto, todos los núcleos)")
+    parser.add_argument('-o', '--salida', help="archivo JSON Lines de salida (por defecto, stdout)")
+    parser.add_argument('--cache', help="archivo SQLite donde guardar los resultados entre ejecuciones")
+    parser.add_argument('--costos', help="archivo JSON que amplía o reemplaza el modelo de costos de "
+                                         "operaciones de biblioteca, p. ej. {\"list.insert\": \"n\"}")
+    args = parser.parse_args(argv)
+
+    if args.costos:
+        try:
+            ModeloCostos.desde_archivo(args.costos)
+        except ErrorAnalisis as e:
+            print(e.mensaje, file=sys.stderr)
+            return 2
+
+    salida = open(args.salida, 'w', encoding='utf-8') if args.salida else sys.stdout
+    try:
+        for resultado in analizar_rutas(args.rutas, args.procesos, args.cache, args.costos):
+            salida.write(json.dumps(resultado, ensure_ascii=False) + "\n")
+            salida.flush()
+    finally:
+        if salida is not sys.stdout:
+            salida.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
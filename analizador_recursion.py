@@ -0,0 +1,315 @@
+# analizador_recursion.py (detección de recursión directa y mutua y resolución de recurrencias)
+import ast
+import math
+from collections import Counter
+from fractions import Fraction
+from expresion_costo import ExpresionCosto, LOG_SIN_BASE
+from grafo_llamadas import GrafoLlamadas, recorrer_local
+
+_AMBITOS = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Lambda)
+_COMPRENSIONES = (ast.ListComp, ast.SetComp, ast.DictComp, ast.GeneratorExp)
+
+
+def _redondear(valor):
+    return int(round(valor)) if abs(valor - round(valor)) < 1e-9 else round(valor, 2)
+
+
+def _biseccion(f, bajo, alto, iteraciones=100):
+    """
+    Raíz de una función decreciente con f(bajo) >= 0 >= f(alto)
+    """
+    for _ in range(iteraciones):
+        medio = (bajo + alto) / 2
+        if f(medio) > 0:
+            bajo = medio
+        else:
+            alto = medio
+    return (bajo + alto) / 2
+
+
+def _termino(grado, grado_log=0, base=LOG_SIN_BASE, coeficiente=1):
+    termino = ExpresionCosto.potencia("n", grado, coeficiente)
+    return termino * ExpresionCosto.logaritmo("n", base, grado_log) if grado_log else termino
+
+
+class AnalizadorRecursion:
+    """
+    Detecta funciones recursivas (directas o mutuas, por componentes fuertemente
+    conexas del grafo de llamadas), extrae su recurrencia
+      T(n) = Σ aᵢ·T(n/bᵢ) + f(n)   o   T(n) = Σ T(n - cᵢ) + f(n)
+    y la resuelve con el teorema maestro, Akra-Bazzi o la ecuación característica
+    """
+
+    def __init__(self):
+        self.resultados = {}
+        self.soluciones = []
+        self.grafo = None
+
+    def analizar(self, tree, tiempos_funcion=None):
+        """
+        tiempos_funcion asocia cada nodo de función con la ExpresionCosto de su
+        cuerpo, que se usa como trabajo no recursivo f(n)
+        """
+        self.iniciar(GrafoLlamadas(tree))
+        for componente in self.grafo.componentes():
+            self.analizar_componente(componente, tiempos_funcion or {})
+        return self.finalizar()
+
+    def iniciar(self, grafo):
+        """
+        Prepara un análisis por partes: analizar_componente para cada grupo de
+        funciones (de las hojas hacia arriba) y finalizar al terminar
+        """
+        self.grafo = grafo
+        self.soluciones = []
+        self._tipos = set()
+        self.resultados = {
+            'detectada': False,
+            'tipo': None,
+            'funciones': [],
+            'complejidad': None,
+            'exponencial': False
+        }
+
+    def analizar_componente(self, componente, tiempos_funcion):
+        """
+        Resuelve las recurrencias de una componente fuertemente conexa del grafo
+        de llamadas. Devuelve función -> solución (vacío si no es recursiva o
+        si la solución no es un polinomio)
+        """
+        if not self.grafo.es_recursiva(componente):
+            return {}
+        tipo = 'mutua' if len(componente) > 1 else 'directa'
+        self._tipos.add(tipo)
+        soluciones = {}
+        for funcion in sorted(componente, key=lambda f: f.lineno):
+            trabajo = tiempos_funcion.get(funcion, ExpresionCosto.constante())
+            previas = len(self.soluciones)
+            self.resultados['funciones'].append(self._analizar_funcion(funcion, set(componente), trabajo, tipo))
+            if len(self.soluciones) > previas:
+                soluciones[funcion] = self.soluciones[-1][1]
+        return soluciones
+
+    def finalizar(self):
+        if self._tipos:
+            self.resultados['detectada'] = True
+            self.resultados['tipo'] = " y ".join(sorted(self._tipos))
+            self.resultados['funciones'].sort(key=lambda info: info['linea'])
+            self._complejidad_global()
+        return self.resultados
+
+    # ===== Extracción de la recurrencia =====
+    def _llamadas_en(self, nodos, funcion, componente):
+        return [
+            nodo for nodo in recorrer_local(nodos)
+            if isinstance(nodo, ast.Call) and any(d in componente for d in self.grafo.destinos(nodo, funcion))
+        ]
+
+    def _camino(self, sentencias, funcion, componente):
+        """
+        Llamadas recursivas del camino de ejecución con más llamadas: las ramas
+        de un if son excluyentes y un return termina el camino.
+        Devuelve (llamadas, termina)
+        """
+        acumuladas = []
+        for i, sentencia in enumerate(sentencias):
+            if isinstance(sentencia, _AMBITOS):
+                continue
+            if isinstance(sentencia, ast.If):
+                acumuladas += self._llamadas_en([sentencia.test], funcion, componente)
+                rama_si, termina_si = self._camino(sentencia.body, funcion, componente)
+                rama_no, termina_no = self._camino(sentencia.orelse, funcion, componente)
+                if termina_si and termina_no:
+                    return acumuladas + max(rama_si, rama_no, key=len), True
+                if termina_si or termina_no:
+                    # Una rama sale de la función; la otra sigue con el resto del bloque
+                    rama_sale, rama_sigue = (rama_si, rama_no) if termina_si else (rama_no, rama_si)
+                    resto, termina = self._camino(sentencias[i + 1:], funcion, componente)
+                    sigue = rama_sigue + resto
+                    if len(rama_sale) > len(sigue):
+                        return acumuladas + rama_sale, True
+                    return acumuladas + sigue, termina
+                acumuladas += max(rama_si, rama_no, key=len)
+            elif isinstance(sentencia, (ast.For, ast.AsyncFor, ast.While)):
+                cabecera = [sentencia.test] if isinstance(sentencia, ast.While) else [sentencia.iter]
+                acumuladas += self._llamadas_en(cabecera, funcion, componente)
+                acumuladas += self._camino(sentencia.body, funcion, componente)[0]
+            elif isinstance(sentencia, (ast.Return, ast.Raise)):
+                return acumuladas + self._llamadas_en([sentencia], funcion, componente), True
+            else:
+                acumuladas += self._llamadas_en([sentencia], funcion, componente)
+        return acumuladas, False
+
+    def _asignaciones(self, funcion):
+        asignaciones = {}
+        for nodo in recorrer_local(funcion.body):
+            if isinstance(nodo, ast.Assign):
+                for destino in nodo.targets:
+                    if isinstance(destino, ast.Name):
+                        asignaciones.setdefault(destino.id, nodo.value)
+        return asignaciones
+
+    def _divisor(self, expr, asignaciones, profundidad=3):
+        """
+        b si el argumento se obtiene dividiendo el tamaño (n // b, n >> k,
+        arr[:len(arr) // 2], (bajo + alto) // 2, ...)
+        """
+        for nodo in ast.walk(expr):
+            if isinstance(nodo, ast.BinOp) and isinstance(nodo.right, ast.Constant) \
+                    and isinstance(nodo.right.value, (int, float)):
+                valor = nodo.right.value
+                if isinstance(nodo.op, (ast.FloorDiv, ast.Div)) and valor > 1:
+                    return valor
+                if isinstance(nodo.op, ast.RShift) and valor > 0:
+                    return 2 ** valor
+            elif isinstance(nodo, ast.Name) and nodo.id in asignaciones and profundidad:
+                divisor = self._divisor(asignaciones[nodo.id], asignaciones, profundidad - 1)
+                if divisor:
+                    return divisor
+        return None
+
+    def _decremento(self, expr, asignaciones, profundidad=3):
+        """
+        c si el argumento reduce el tamaño en una constante (n - c, arr[c:], arr[:-c])
+        """
+        if isinstance(expr, ast.BinOp) and isinstance(expr.op, ast.Sub) \
+                and isinstance(expr.right, ast.Constant) and isinstance(expr.right.value, int) and expr.right.value > 0:
+            return expr.right.value
+        if isinstance(expr, ast.Subscript) and isinstance(expr.slice, ast.Slice):
+            inferior, superior = expr.slice.lower, expr.slice.upper
+            if isinstance(inferior, ast.Constant) and isinstance(inferior.value, int) and inferior.value > 0 and superior is None:
+                return inferior.value
+            if inferior is None and isinstance(superior, ast.UnaryOp) and isinstance(superior.op, ast.USub) \
+                    and isinstance(superior.operand, ast.Constant) and isinstance(superior.operand.value, int):
+                return superior.operand.value
+        if isinstance(expr, ast.Name) and expr.id in asignaciones and profundidad:
+            return self._decremento(asignaciones[expr.id], asignaciones, profundidad - 1)
+        return None
+
+    def _es_particion(self, expr, asignaciones):
+        """
+        El argumento es una parte filtrada de la entrada ([x for x in arr if ...])
+        """
+        valor = asignaciones.get(expr.id) if isinstance(expr, ast.Name) else expr
+        if isinstance(valor, _COMPRENSIONES):
+            return any(generador.ifs for generador in valor.generators)
+        return isinstance(valor, ast.Call) and isinstance(valor.func, ast.Name) and valor.func.id == 'filter'
+
+    def _reduccion(self, llamada, asignaciones):
+        argumentos = list(llamada.args) + [k.value for k in llamada.keywords]
+        for argumento in argumentos:
+            divisor = self._divisor(argumento, asignaciones)
+            if divisor:
+                return ('division', divisor)
+        for argumento in argumentos:
+            decremento = self._decremento(argumento, asignaciones)
+            if decremento:
+                return ('resta', decremento)
+        if any(self._es_particion(argumento, asignaciones) for argumento in argumentos):
+            return ('particion', None)
+        return None
+
+    def _trabajo(self, trabajo):
+        """
+        Grado, grado del logaritmo y coeficiente del trabajo no recursivo f(n)
+        """
+        clave = trabajo.termino_dominante()
+        if clave is None:
+            return 0, 0, 1
+        monomio, logs = clave
+        return sum(e for _, e in monomio), sum(e for _, e in logs), trabajo.terminos[clave]
+
+    def _analizar_funcion(self, funcion, componente, trabajo, tipo):
+        llamadas = self._camino(funcion.body, funcion, componente)[0]
+        asignaciones = self._asignaciones(funcion)
+        reducciones = [self._reduccion(llamada, asignaciones) for llamada in llamadas]
+
+        info = {
+            'nombre': funcion.name,
+            'linea': funcion.lineno,
+            'tipo': tipo,
+            'subllamadas': len(llamadas),
+            'recurrencia': None,
+            'metodo': None,
+            'complejidad': None,
+            'caso_promedio': False
+        }
+        if not llamadas or None in reducciones:
+            info['recurrencia'] = "no se pudo determinar cómo se reduce el tamaño de la entrada"
+            return info
+
+        # Las particiones filtradas se suponen balanceadas (caso promedio)
+        particiones = sum(1 for r in reducciones if r[0] == 'particion')
+        if particiones:
+            info['caso_promedio'] = True
+            reducciones = [('division', max(particiones, 2)) if r[0] == 'particion' else r for r in reducciones]
+
+        grado, grado_log, coeficiente = self._trabajo(trabajo)
+        texto_trabajo = _termino(grado, grado_log).complejidad()
+
+        decrementos = [valor for clase, valor in reducciones if clase == 'resta']
+        if decrementos:
+            terminos = [f"T(n-{c})" for c in sorted(decrementos)]
+            info['recurrencia'] = f"T(n) = {' + '.join(terminos)} + {texto_trabajo}"
+            self._resolver_resta(info, decrementos, grado, grado_log, coeficiente)
+        else:
+            divisores = Counter(valor for _, valor in reducciones)
+            terminos = [f"{a if a > 1 else ''}T(n/{_redondear(b)})" for b, a in sorted(divisores.items())]
+            info['recurrencia'] = f"T(n) = {' + '.join(terminos)} + {texto_trabajo}"
+            self._resolver_division(info, divisores, grado, grado_log, coeficiente)
+        return info
+
+    # ===== Resolución =====
+    def _resolver_division(self, info, divisores, grado, grado_log, coeficiente):
+        if len(divisores) == 1:
+            (b, a), = divisores.items()
+            critico = math.log(a) / math.log(b)
+            info['metodo'] = "Teorema maestro"
+        else:
+            critico = _biseccion(lambda p: sum(a * b ** -p for b, a in divisores.items()) - 1, -10, 10)
+            info['metodo'] = "Akra-Bazzi"
+        critico = _redondear(critico)
+
+        if grado < critico - 1e-9:
+            solucion = _termino(critico)
+        elif abs(grado - critico) < 1e-9:
+            b = next(iter(divisores))
+            base = b if len(divisores) == 1 and isinstance(b, int) else LOG_SIN_BASE
+            solucion = _termino(grado, grado_log + 1, base, Fraction(coeficiente) / (grado_log + 1))
+        else:
+            # Domina el trabajo de la raíz: los niveles forman una serie geométrica de razón r
+            if all(isinstance(b, int) for b in divisores) and isinstance(grado, int):
+                razon = sum(Fraction(a, b ** grado) for b, a in divisores.items())
+            else:
+                razon = Fraction(sum(a * b ** -grado for b, a in divisores.items())).limit_denominator(1000)
+            solucion = _termino(grado, grado_log, coeficiente=coeficiente * razon / (1 - razon))
+
+        info['complejidad'] = solucion.complejidad()
+        self.soluciones.append((info['linea'], solucion))
+
+    def _resolver_resta(self, info, decrementos, grado, grado_log, coeficiente):
+        if len(decrementos) == 1:
+            # Una sola llamada: el trabajo se suma sobre n/c niveles
+            c = decrementos[0]
+            info['metodo'] = "Suma de niveles (resta y vencerás)"
+            solucion = _termino(grado + 1, grado_log, coeficiente=Fraction(coeficiente) / (c * (grado + 1)))
+            info['complejidad'] = solucion.complejidad()
+            self.soluciones.append((info['linea'], solucion))
+            return
+
+        # Varias llamadas: crecimiento r^n con r raíz de Σ r^(-cᵢ) = 1
+        info['metodo'] = "Ecuación característica"
+        raiz = _redondear(_biseccion(lambda r: sum(r ** -c for c in decrementos) - 1, 1, len(decrementos)))
+        info['complejidad'] = f"O({raiz}^n)"
+        info['base_exponencial'] = raiz
+        self.resultados['exponencial'] = True
+
+    def _complejidad_global(self):
+        exponenciales = [f['base_exponencial'] for f in self.resultados['funciones'] if 'base_exponencial' in f]
+        if exponenciales:
+            self.resultados['complejidad'] = f"O({max(exponenciales)}^n)"
+        elif self.soluciones:
+            total = ExpresionCosto()
+            for _, solucion in self.soluciones:
+                total = total + solucion
+            self.resultados['complejidad'] = total.complejidad()
@@ -1,8 +1,33 @@
-# analizador_while.py (corregido)
+# analizador_while.py (cota de iteraciones de bucles while)
 import ast
 import math
+from fractions import Fraction
+from expresion_costo import ExpresionCosto
+from operaciones_elementales import contar_oe_por_tipo
+
+_AMBITOS = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Lambda)
+_OPERADORES = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.LShift, ast.RShift)
+
+
+def _es_numero(nodo):
+    return isinstance(nodo, ast.Constant) and isinstance(nodo.value, (int, float)) \
+        and not isinstance(nodo.value, bool)
+
+
+def _nombres(nodo):
+    return {n.id for n in ast.walk(nodo) if isinstance(n, ast.Name)}
+
 
 class AnalizadorWhile:
+    """
+    Infiere cuántas veces itera un bucle while a partir de su condición y de
+    cómo el cuerpo actualiza las variables de control:
+      - i = i * c, i //= c, i >>= k, mitades (bajo + alto) // 2 -> log_c(n)
+      - i += c, i -= c, dos punteros que se acercan          -> n / c
+      - crecimiento hasta un límite constante                 -> constante
+      - sin actualización reconocible (while cola:, True)     -> n
+    """
+
     def __init__(self):
         self.resultados = {}
 
@@ -10,91 +35,165 @@ class AnalizadorWhile:
         if not isinstance(nodo_while, ast.While):
             raise ValueError("Se esperaba un nodo While")
 
-        self.resultados = {
-            'tipo': 'while estándar',
-            'oe_condicion': 0,
-            'oe_cuerpo': 0,
-            'oe_por_iteracion': 0,
-            'iteraciones': 'n',
-            'funcion_tiempo': '',
-            'complejidad': 'O(n)',
-            'variables_control': []
-        }
-
+        tipo, iteraciones = self.inferir_iteraciones(nodo_while)
+        self.resultados['tipo'] = tipo
         self.resultados['oe_condicion'] = self._contar_oe(nodo_while.test)
-
-        base_log = self._detectar_cambio_logaritmico(nodo_while.body)
-
         self.resultados['oe_cuerpo'] = self._contar_oe_cuerpo(nodo_while.body)
         self.resultados['oe_por_iteracion'] = self.resultados['oe_condicion'] + self.resultados['oe_cuerpo']
+        self.resultados['iteraciones'] = iteraciones.a_texto() or "0"
+        self.resultados['funcion_tiempo'] = f'T(n) = {self.resultados["oe_por_iteracion"]}*{self.resultados["iteraciones"]} + c'
+        self.resultados['complejidad'] = iteraciones.complejidad()
+        return self.resultados
 
-        if base_log:
-            self._configurar_caso_logaritmico(base_log)
-        elif self._es_iteracion_fija(nodo_while):
-            self._configurar_caso_constante()
-        else:
-            self._configurar_caso_lineal()
+    def inferir_iteraciones(self, nodo_while):
+        """
+        Devuelve (tipo, iteraciones), con las iteraciones como ExpresionCosto
+        """
+        self.resultados = {'variables_control': []}
+        variables = self._variables_control(nodo_while.test)
+        asignaciones = self._asignaciones(nodo_while.body)
+        actualizaciones = [
+            (variable, valor)
+            for variable, valores in asignaciones.items() if variable in variables
+            for valor in valores
+        ]
+        self.resultados['variables_control'] = sorted({v for v, _ in actualizaciones})
+        if not actualizaciones:
+            return 'while lineal', ExpresionCosto.potencia("n")
 
-        return self.resultados
+        clases = [self._clasificar_actualizacion(v, valor, variables, asignaciones) for v, valor in actualizaciones]
+        limite = self._limite_constante(nodo_while.test, variables)
 
-    def _detectar_cambio_logaritmico(self, cuerpo):
-        for nodo in cuerpo:
-            if isinstance(nodo, ast.Assign) and isinstance(nodo.value, ast.BinOp):
-                var = nodo.targets[0].id if isinstance(nodo.targets[0], ast.Name) else None
-                if isinstance(nodo.value.left, ast.Name) and nodo.value.left.id == var:
-                    if isinstance(nodo.value.op, (ast.FloorDiv, ast.Mult)) and isinstance(nodo.value.right, ast.Constant):
-                        self.resultados['variables_control'].append(var)
-                        return nodo.value.right.value
+        factores = [factor for clase, factor in clases if clase in ('multiplica', 'divide', 'mitad')]
+        if factores:
+            base = min(factores)
+            if limite is not None and all(clase == 'multiplica' for clase, _ in clases):
+                return 'while constante', ExpresionCosto.constante(max(1, math.ceil(math.log(max(limite, 2)) / math.log(base))))
+            tipo = 'búsqueda por mitades' if any(clase == 'mitad' for clase, _ in clases) \
+                else f'while con multiplicación/división por {base}'
+            if isinstance(base, float) and base.is_integer():
+                base = int(base)
+            return tipo, ExpresionCosto.logaritmo("n", base)
+
+        pasos = [paso for clase, paso in clases if clase in ('suma', 'resta')]
+        if pasos and len(pasos) == len(clases):
+            paso = min(pasos)
+            if limite is not None and all(clase == 'suma' for clase, _ in clases):
+                return 'while constante', ExpresionCosto.constante(max(1, math.ceil(limite / paso)))
+            if len(self.resultados['variables_control']) > 1:
+                # Dos punteros que se acercan: entre ambos recorren n posiciones
+                return 'dos punteros', ExpresionCosto.potencia("n")
+            tipo = 'while lineal' if paso == 1 else f'while con paso {paso}'
+            coeficiente = Fraction(1, paso) if isinstance(paso, int) else 1 / paso
+            return tipo, ExpresionCosto.potencia("n", coeficiente=coeficiente)
+
+        return 'while lineal', ExpresionCosto.potencia("n")
+
+    def _variables_control(self, test):
+        llamadas = {n.func.id for n in ast.walk(test) if isinstance(n, ast.Call) and isinstance(n.func, ast.Name)}
+        return _nombres(test) - llamadas
+
+    def _asignaciones(self, cuerpo):
+        """
+        Valores asignados a cada nombre dentro del cuerpo, con las asignaciones
+        aumentadas (i += c) escritas como i = i + c
+        """
+        asignaciones = {}
+        pendientes = list(cuerpo)
+        while pendientes:
+            nodo = pendientes.pop()
+            if isinstance(nodo, _AMBITOS):
+                continue
+            if isinstance(nodo, ast.Assign):
+                for destino in nodo.targets:
+                    if isinstance(destino, ast.Name):
+                        asignaciones.setdefault(destino.id, []).append(nodo.value)
+                    elif isinstance(destino, ast.Tuple) and isinstance(nodo.value, ast.Tuple) \
+                            and len(destino.elts) == len(nodo.value.elts):
+                        for elemento, valor in zip(destino.elts, nodo.value.elts):
+                            if isinstance(elemento, ast.Name):
+                                asignaciones.setdefault(elemento.id, []).append(valor)
+            elif isinstance(nodo, ast.AugAssign) and isinstance(nodo.target, ast.Name) \
+                    and isinstance(nodo.op, _OPERADORES):
+                valor = ast.BinOp(left=ast.Name(id=nodo.target.id, ctx=ast.Load()), op=nodo.op, right=nodo.value)
+                asignaciones.setdefault(nodo.target.id, []).append(valor)
+            pendientes.extend(ast.iter_child_nodes(nodo))
+        return asignaciones
+
+    def _resolver(self, valor, variable, asignaciones, profundidad=3):
+        """
+        Valores posibles de una actualización, sustituyendo los nombres
+        auxiliares (hijo = 2*i + 1; i = hijo) por lo que se les asigna
+        """
+        if isinstance(valor, ast.Name) and valor.id != variable and valor.id in asignaciones and profundidad:
+            return [
+                resuelto
+                for candidato in asignaciones[valor.id]
+                for resuelto in self._resolver(candidato, variable, asignaciones, profundidad - 1)
+            ]
+        return [valor]
+
+    def _clasificar_actualizacion(self, variable, valor, variables, asignaciones):
+        clases = [self._clasificar_valor(variable, v, variables, asignaciones)
+                  for v in self._resolver(valor, variable, asignaciones)]
+        return next((c for c in clases if c[0] != 'desconocida'), ('desconocida', None))
+
+    def _clasificar_valor(self, variable, valor, variables, asignaciones):
+        for nodo in ast.walk(valor):
+            if isinstance(nodo, ast.Name) and nodo.id != variable and nodo.id in asignaciones:
+                # Punto medio calculado en el cuerpo: medio = (bajo + alto) // 2
+                for auxiliar in asignaciones[nodo.id]:
+                    if self._es_mitad(auxiliar, variables):
+                        return ('mitad', 2)
+            if isinstance(nodo, ast.BinOp) and isinstance(nodo.op, ast.Mult) and _es_numero(nodo.left) \
+                    and nodo.left.value > 1 and variable in _nombres(nodo.right):
+                return ('multiplica', nodo.left.value)
+            if not isinstance(nodo, ast.BinOp) or not _es_numero(nodo.right):
+                continue
+            constante = nodo.right.value
+            if variable not in _nombres(nodo.left):
+                continue
+            if isinstance(nodo.op, ast.Mult) and constante > 1:
+                return ('multiplica', constante)
+            if isinstance(nodo.op, ast.LShift) and constante > 0:
+                return ('multiplica', 2 ** constante)
+            if isinstance(nodo.op, (ast.FloorDiv, ast.Div)) and constante > 1:
+                return ('divide', constante)
+            if isinstance(nodo.op, ast.RShift) and constante > 0:
+                return ('divide', 2 ** constante)
+
+        if self._es_mitad(valor, variables):
+            return ('mitad', 2)
+
+        if isinstance(valor, ast.BinOp) and isinstance(valor.op, (ast.Add, ast.Sub)) \
+                and isinstance(valor.left, ast.Name) and valor.left.id == variable and _es_numero(valor.right):
+            paso = valor.right.value if isinstance(valor.op, ast.Add) else -valor.right.value
+            if paso:
+                return ('suma', paso) if paso > 0 else ('resta', -paso)
+        return ('desconocida', None)
+
+    def _es_mitad(self, valor, variables):
+        return any(
+            isinstance(n, ast.BinOp) and isinstance(n.op, (ast.FloorDiv, ast.RShift)) and _es_numero(n.right)
+            and n.right.value in ((2,) if isinstance(n.op, ast.FloorDiv) else (1,))
+            and len(_nombres(n.left) & variables) >= 2
+            for n in ast.walk(valor)
+        )
+
+    def _limite_constante(self, test, variables):
+        """
+        Límite numérico de una condición del tipo i < 100 (None si depende de n)
+        """
+        if isinstance(test, ast.Compare) and len(test.comparators) == 1:
+            izquierda, derecha = test.left, test.comparators[0]
+            if _es_numero(derecha) and isinstance(izquierda, ast.Name):
+                return abs(derecha.value)
+            if _es_numero(izquierda) and isinstance(derecha, ast.Name):
+                return abs(izquierda.value)
         return None
 
     def _contar_oe(self, nodo):
-        if isinstance(nodo, ast.FunctionDef) or isinstance(nodo, ast.Subscript):
-            return 0
-        if isinstance(nodo, ast.Assign):
-            return 1 + self._contar_oe(nodo.value)
-        elif isinstance(nodo, ast.AugAssign):
-            return 2 + self._contar_oe(nodo.value)
-        elif isinstance(nodo, ast.BinOp):
-            return 1 + self._contar_oe(nodo.left) + self._contar_oe(nodo.right)
-        elif isinstance(nodo, ast.Compare):
-            return 1 + sum(self._contar_oe(comp) for comp in nodo.comparators)
-        elif isinstance(nodo, ast.Call):
-            return 1 + sum(self._contar_oe(arg) for arg in nodo.args)
-        elif isinstance(nodo, ast.Constant):
-            return 0
-        else:
-            return sum(self._contar_oe(child) for child in ast.iter_child_nodes(nodo))
+        return sum(contar_oe_por_tipo(nodo).values())
 
     def _contar_oe_cuerpo(self, cuerpo):
         return sum(self._contar_oe(nodo) for nodo in cuerpo)
-
-    def _es_iteracion_fija(self, nodo):
-        if isinstance(nodo.test, ast.Compare):
-            for comp in nodo.test.comparators:
-                if isinstance(comp, ast.Constant):
-                    return True
-        return False
-
-    def _configurar_caso_logaritmico(self, base):
-        self.resultados.update({
-            'tipo': f'while con multiplicación/división por {base}',
-            'iteraciones': f'log_{base}(n)',
-            'funcion_tiempo': f'T(n) = {self.resultados["oe_por_iteracion"]}*log_{base}(n) + c',
-            'complejidad': f'O(log {base} n)'
-        })
-
-    def _configurar_caso_lineal(self):
-        self.resultados.update({
-            'tipo': 'while lineal',
-            'iteraciones': 'n',
-            'funcion_tiempo': f'T(n) = {self.resultados["oe_por_iteracion"]}*n + c',
-            'complejidad': 'O(n)'
-        })
-
-    def _configurar_caso_constante(self):
-        self.resultados.update({
-            'tipo': 'while constante',
-            'iteraciones': '10',
-            'funcion_tiempo': f'T(n) = {self.resultados["oe_por_iteracion"]}*10 + c',
-            'complejidad': 'O(1)'
-        })
@@ -0,0 +1,220 @@
+# cache_analisis.py (caché de resultados indexada por el hash del AST normalizado)
+import ast
+import glob
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from analizador_algoritmo import AnalizadorAlgoritmo
+from modelo_costos import ModeloCostos
+
+# Atributos del analizador que dependen del texto concreto y no se guardan
+_ATRIBUTOS_NO_CACHEADOS = ('tree', 'lineas', 'codigo_fuente', 'indice', '_for_con_while', 'tiempos_funcion', 'medicion',
+                           'modelo_costos', 'contexto_tipos', 'grafo_llamadas', 'analizador_recursion',
+                           'costos_llamada', '_cuerpos', 'tamanos', '_estructuras')
+
+_huella = None
+
+
+def huella_analizador():
+    """
+    Hash de los fuentes del proyecto: al cambiar el analizador cambia la huella
+    y las entradas guardadas en disco por versiones anteriores dejan de usarse
+    """
+    global _huella
+    if _huella is None:
+        h = hashlib.sha256()
+        for ruta in sorted(glob.glob(os.path.join(os.path.dirname(os.path.abspath(__file__)), '*.py'))):
+            with open(ruta, 'rb') as f:
+                h.update(f.read())
+        _huella = h.hexdigest()
+    return _huella
+
+
+def _quitar_docstrings(tree):
+    for nodo in ast.walk(tree):
+        if isinstance(nodo, (ast.Module, ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+            cuerpo = nodo.body
+            if cuerpo and isinstance(cuerpo[0], ast.Expr) and \
+               isinstance(cuerpo[0].value, ast.Constant) and isinstance(cuerpo[0].value.value, str):
+                nodo.body = cuerpo[1:] or [ast.Pass()]
+    return tree
+
+
+def hash_codigo(codigo, modelo_costos=None):
+    """
+    Hash del AST normalizado: ignora comentarios, espacios dentro de las
+    líneas y el texto de los docstrings. Los números de línea sí forman parte
+    de la clave (las columnas no): el resultado guarda datos por línea (costo
+    por línea, patrones, rangos de cada función) que dejarían de coincidir
+    si se agregan o quitan líneas. Incluye la huella del modelo de costos si
+    se indica. Lanza SyntaxError si el código no es válido
+    """
+    tree = _quitar_docstrings(ast.parse(codigo))
+    for nodo in ast.walk(tree):
+        if hasattr(nodo, 'col_offset'):
+            nodo.col_offset = nodo.end_col_offset = 0
+    volcado = ast.dump(tree, annotate_fields=False, include_attributes=True)
+    huella = huella_analizador() + (modelo_costos.huella() if modelo_costos else "")
+    return hashlib.sha256((huella + volcado).encode('utf-8')).hexdigest()
+
+
+class CacheDisco:
+    """
+    Nivel persistente de la caché en SQLite, con expulsión de las entradas
+    menos usadas cuando se supera el tamaño máximo
+    """
+
+    def __init__(self, ruta, max_bytes=64 * 1024 * 1024):
+        self.ruta = ruta
+        self.max_bytes = max_bytes
+        self.conexion = sqlite3.connect(ruta, timeout=30, check_same_thread=False)
+        self.conexion.execute(
+            "CREATE TABLE IF NOT EXISTS resultados ("
+            "clave TEXT PRIMARY KEY, datos BLOB NOT NULL, usado REAL NOT NULL)"
+        )
+        self.conexion.commit()
+        fila = self.conexion.execute("SELECT COALESCE(SUM(LENGTH(datos)), 0) FROM resultados").fetchone()
+        self.bytes_usados = fila[0]
+
+    def obtener(self, clave):
+        fila = self.conexion.execute("SELECT datos FROM resultados WHERE clave = ?", (clave,)).fetchone()
+        if fila is None:
+            return None
+        self.conexion.execute("UPDATE resultados SET usado = ? WHERE clave = ?", (time.time(), clave))
+        self.conexion.commit()
+        return fila[0]
+
+    def guardar(self, clave, datos):
+        """
+        Guarda una entrada y expulsa las menos usadas si el archivo supera el
+        máximo. El tamaño se mide dentro de la misma transacción de escritura,
+        así el límite se respeta aunque varios procesos compartan el archivo
+        """
+        if self.conexion.in_transaction:
+            self.conexion.commit()
+        self.conexion.execute("BEGIN IMMEDIATE")
+        try:
+            self.conexion.execute(
+                "INSERT OR REPLACE INTO resultados (clave, datos, usado) VALUES (?, ?, ?)",
+                (clave, sqlite3.Binary(datos), time.time())
+            )
+            self._expulsar()
+            self.conexion.commit()
+        except Exception:
+            self.conexion.rollback()
+            raise
+
+    def _expulsar(self):
+        fila = self.conexion.execute("SELECT COALESCE(SUM(LENGTH(datos)), 0) FROM resultados").fetchone()
+        self.bytes_usados = fila[0]
+        while self.bytes_usados > self.max_bytes:
+            filas = self.conexion.execute(
+                "SELECT clave, LENGTH(datos) FROM resultados ORDER BY usado ASC LIMIT 32"
+            ).fetchall()
+            if not filas:
+                self.bytes_usados = 0
+                break
+            for clave, tamano in filas:
+                self.conexion.execute("DELETE FROM resultados WHERE clave = ?", (clave,))
+                self.bytes_usados -= tamano
+                if self.bytes_usados <= self.max_bytes:
+                    break
+
+    def cerrar(self):
+        self.conexion.close()
+
+
+class CacheAnalisis:
+    """
+    Caché delante de AnalizadorAlgoritmo.analizar_codigo: un nivel LRU en
+    memoria y, opcionalmente, un nivel en disco
+    """
+
+    def __init__(self, max_memoria=256, ruta_disco=None, max_bytes_disco=64 * 1024 * 1024, modelo_costos=None):
+        self.max_memoria = max_memoria
+        self.modelo_costos = modelo_costos or ModeloCostos()
+        self.memoria = OrderedDict()
+        self.disco = CacheDisco(ruta_disco, max_bytes_disco) if ruta_disco else None
+        self.aciertos_memoria = 0
+        self.aciertos_disco = 0
+        self.fallos = 0
+        # El análisis en vivo usa la caché desde su hilo de trabajo
+        self._cerrojo = threading.RLock()
+
+    def analizar(self, codigo):
+        """
+        Devuelve un AnalizadorAlgoritmo con el análisis del código, reutilizando
+        el resultado guardado si ya se analizó un código equivalente.
+        Lanza ErrorAnalisis igual que analizar_codigo
+        """
+        try:
+            clave = hash_codigo(codigo, self.modelo_costos)
+        except SyntaxError:
+            clave = None
+
+        datos = self.obtener(clave) if clave else None
+        if datos is not None:
+            return self._restaurar(datos, codigo)
+
+        with self._cerrojo:
+            self.fallos += 1
+        analizador = AnalizadorAlgoritmo(self.modelo_costos)
+        analizador.analizar_codigo(codigo)
+        if clave:
+            self.guardar(clave, self._serializar(analizador))
+        return analizador
+
+    def obtener(self, clave):
+        with self._cerrojo:
+            datos = self.memoria.get(clave)
+            if datos is not None:
+                self.memoria.move_to_end(clave)
+                self.aciertos_memoria += 1
+                return datos
+
+            if self.disco is not None:
+                datos = self.disco.obtener(clave)
+                if datos is not None:
+                    self.aciertos_disco += 1
+                    self._guardar_memoria(clave, datos)
+                    return datos
+            return None
+
+    def guardar(self, clave, datos):
+        with self._cerrojo:
+            self._guardar_memoria(clave, datos)
+            if self.disco is not None:
+                self.disco.guardar(clave, datos)
+
+    def _guardar_memoria(self, clave, datos):
+        self.memoria[clave] = datos
+        self.memoria.move_to_end(clave)
+        while len(self.memoria) > self.max_memoria:
+            self.memoria.popitem(last=False)
+
+    def _serializar(self, analizador):
+        estado = {k: v for k, v in vars(analizador).items() if k not in _ATRIBUTOS_NO_CACHEADOS}
+        return pickle.dumps(estado, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def _restaurar(self, datos, codigo):
+        analizador = AnalizadorAlgoritmo(self.modelo_costos)
+        vars(analizador).update(pickle.loads(datos))
+        analizador.codigo_fuente = codigo
+        analizador.lineas = codigo.splitlines()
+        return analizador
+
+    def estadisticas(self):
+        return {
+            'aciertos_memoria': self.aciertos_memoria,
+            'aciertos_disco': self.aciertos_disco,
+            'fallos': self.fallos,
+            'entradas_memoria': len(self.memoria)
+        }
+
+    def cerrar(self):
+        if self.disco is not None:
+            self.disco.cerrar()
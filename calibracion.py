@@ -0,0 +1,172 @@
+# calibracion.py (perfil de la máquina: tiempo real de cada tipo de operación elemental)
+import argparse
+import datetime
+import json
+import os
+import platform
+import sys
+import timeit
+from errores import ErrorAnalisis
+
+# Archivo donde se guarda el perfil de la máquina entre ejecuciones
+RUTA_PERFIL = os.path.join(os.path.expanduser("~"), ".analizador_complejidad", "perfil_maquina.json")
+
+# Nanosegundos por OE supuestos sin calibrar (1e6 OE por segundo)
+NS_POR_OE_PREDETERMINADO = 1000.0
+
+# Microbenchmark de cada tipo de operación elemental: (sentencia, preparación).
+# Se descuenta el costo del propio bucle de timeit (sentencia 'pass')
+MICROBENCHMARKS = {
+    'asignacion': ("x = y", "y = 7"),
+    'aritmetica': ("y + z", "y = 7; z = 3"),
+    'comparacion': ("y < z", "y = 7; z = 3"),
+    'subindice': ("v[3]", "v = [1, 2, 3, 4, 5]"),
+    'llamada': ("f()", "def f(): pass"),
+    'atributo': ("o.a", "class C: a = 1\no = C()"),
+    'reserva': ("[y, z]", "y = 7; z = 3"),
+}
+
+
+def _maquina():
+    return {
+        'nodo': platform.node(),
+        'procesador': platform.processor() or platform.machine(),
+        'python': platform.python_version(),
+        'implementacion': platform.python_implementation()
+    }
+
+
+class PerfilMaquina:
+    """
+    Nanosegundos por operación elemental de cada tipo medidos en una máquina.
+    Convierte conteos de OE en tiempo estimado: con un conteo sin tipo se usa
+    el promedio de los tipos medidos
+    """
+
+    def __init__(self, ns_por_tipo=None, maquina=None, fecha=None):
+        self.ns_por_tipo = dict(ns_por_tipo or {})
+        self.maquina = maquina or {}
+        self.fecha = fecha
+
+    @classmethod
+    def predeterminado(cls):
+        """
+        Perfil sin calibrar: todas las operaciones a NS_POR_OE_PREDETERMINADO
+        """
+        return cls({tipo: NS_POR_OE_PREDETERMINADO for tipo in MICROBENCHMARKS})
+
+    @property
+    def calibrado(self):
+        return self.fecha is not None
+
+    @classmethod
+    def calibrar(cls, numero=200_000, repeticiones=5):
+        """
+        Ejecuta los microbenchmarks en esta máquina. De cada uno se toma la
+        mejor de las repeticiones (la menos afectada por otros procesos)
+        """
+        def mejor(sentencia, preparacion):
+            return min(timeit.repeat(sentencia, preparacion, number=numero, repeat=repeticiones)) / numero * 1e9
+
+        base = mejor("pass", "")
+        ns_por_tipo = {
+            # Nunca menos de una centésima de ns: el bucle vacío puede medir más que la operación
+            tipo: max(mejor(sentencia, preparacion) - base, 0.01)
+            for tipo, (sentencia, preparacion) in MICROBENCHMARKS.items()
+        }
+        return cls(ns_por_tipo, _maquina(), datetime.datetime.now().isoformat(timespec='seconds'))
+
+    @classmethod
+    def cargar(cls, ruta=RUTA_PERFIL):
+        try:
+            with open(ruta, 'r', encoding='utf-8') as f:
+                datos = json.load(f)
+            ns_por_tipo = {str(k): float(v) for k, v in datos['ns_por_tipo'].items()}
+            return cls(ns_por_tipo, datos.get('maquina'), datos.get('fecha'))
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            raise ErrorAnalisis(f"No se pudo cargar el perfil de la máquina '{ruta}': {e}",
+                                "Error en el perfil de la máquina") from e
+
+    @classmethod
+    def cargar_o_predeterminado(cls, ruta=RUTA_PERFIL):
+        """
+        El perfil guardado si existe y es válido; si no, el predeterminado
+        """
+        if not os.path.exists(ruta):
+            return cls.predeterminado()
+        try:
+            return cls.cargar(ruta)
+        except ErrorAnalisis:
+            return cls.predeterminado()
+
+    def guardar(self, ruta=RUTA_PERFIL):
+        carpeta = os.path.dirname(ruta)
+        if carpeta:
+            os.makedirs(carpeta, exist_ok=True)
+        with open(ruta, 'w', encoding='utf-8') as f:
+            json.dump({'ns_por_tipo': self.ns_por_tipo, 'maquina': self.maquina, 'fecha': self.fecha},
+                      f, ensure_ascii=False, indent=2)
+
+    def es_de_esta_maquina(self):
+        """
+        Indica si el perfil se midió en esta máquina y versión de Python
+        """
+        return self.calibrado and self.maquina == _maquina()
+
+    def ns_por_oe(self):
+        """
+        Nanosegundos de una OE sin tipo: el promedio de los tipos medidos
+        """
+        if not self.ns_por_tipo:
+            return NS_POR_OE_PREDETERMINADO
+        return sum(self.ns_por_tipo.values()) / len(self.ns_por_tipo)
+
+    def oe_por_segundo(self):
+        return 1e9 / self.ns_por_oe()
+
+    def segundos(self, oe):
+        """
+        Tiempo estimado en segundos de una cantidad de OE, o de un diccionario
+        tipo -> cantidad con el costo medido de cada tipo (los tipos no
+        medidos, al promedio)
+        """
+        if isinstance(oe, dict):
+            promedio = self.ns_por_oe()
+            return sum(cantidad * self.ns_por_tipo.get(tipo, promedio) for tipo, cantidad in oe.items()) / 1e9
+        return oe * self.ns_por_oe() / 1e9
+
+    def descripcion(self):
+        if not self.calibrado:
+            return f"sin calibrar ({self.oe_por_segundo():,.0f} OE/seg supuestas)"
+        nodo = self.maquina.get('nodo') or "máquina"
+        ajeno = "" if self.es_de_esta_maquina() else ", medido en otra máquina: conviene recalibrar"
+        return f"{nodo}, Python {self.maquina.get('python', '?')}, {self.fecha} " \
+               f"({self.oe_por_segundo():,.0f} OE/seg{ajeno})"
+
+    def obtener_resumen(self):
+        resumen = "PERFIL DE LA MÁQUINA\n"
+        resumen += "=" * 40 + "\n\n"
+        resumen += f"{self.descripcion()}\n\n"
+        for tipo, ns in sorted(self.ns_por_tipo.items(), key=lambda item: item[1]):
+            resumen += f"  {tipo:<14} {ns:>10.2f} ns\n"
+        resumen += f"\n  {'promedio':<14} {self.ns_por_oe():>10.2f} ns por OE\n"
+        return resumen
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Mide el costo de las operaciones elementales en esta máquina y guarda el perfil"
+    )
+    parser.add_argument('-o', '--salida', default=RUTA_PERFIL, help=f"archivo del perfil (por defecto, {RUTA_PERFIL})")
+    parser.add_argument('-n', '--numero', type=int, default=200_000, help="ejecuciones de cada operación por repetición")
+    args = parser.parse_args(argv)
+
+    perfil = PerfilMaquina.calibrar(numero=args.numero)
+    perfil.guardar(args.salida)
+    print(perfil.obtener_resumen())
+    print(f"Perfil guardado en {args.salida}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,285 @@
+# comparador_multiple.py (comparación y ranking de varias implementaciones a la vez)
+import argparse
+import math
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from analizador_algoritmo import N_REFERENCIA
+from analizador_lotes import descubrir_archivos
+from cache_analisis import CacheAnalisis
+from ejecutor_aislado import EjecucionAislada
+from errores import ErrorAnalisis
+from funcion_tiempo import FuncionTiempo
+from modelo_costos import ModeloCostos
+from punto_cruce import curva_empirica, puntos_cruce
+
+# Caché del proceso actual (cada proceso del pool abre la suya)
+_cache = None
+
+
+def cargar_candidatos(rutas):
+    """
+    Devuelve (nombre, codigo) de cada archivo .py de las rutas (directorios,
+    globs o archivos), nombrado por el archivo sin extensión
+    """
+    candidatos = []
+    for archivo in descubrir_archivos(rutas):
+        with open(archivo, 'r', encoding='utf-8') as f:
+            candidatos.append((os.path.splitext(os.path.basename(archivo))[0], f.read()))
+    return candidatos
+
+
+def _nombres_unicos(candidatos):
+    """
+    Agrega un sufijo a los nombres repetidos (dos archivos solucion.py en carpetas distintas)
+    """
+    vistos = {}
+    unicos = []
+    for nombre, codigo in candidatos:
+        vistos[nombre] = vistos.get(nombre, 0) + 1
+        unicos.append((nombre if vistos[nombre] == 1 else f"{nombre} ({vistos[nombre]})", codigo))
+    return unicos
+
+
+def _analizar_candidato(nombre, codigo, ruta_cache=None, ruta_costos=None):
+    """
+    Analiza un candidato (se ejecuta en un proceso del pool). Devuelve solo
+    datos serializables: la expresión de costo y el resumen del análisis
+    """
+    global _cache
+    if _cache is None:
+        modelo = ModeloCostos.desde_archivo(ruta_costos) if ruta_costos else None
+        _cache = CacheAnalisis(ruta_disco=ruta_cache, modelo_costos=modelo)
+    try:
+        analizador = _cache.analizar(codigo)
+    except ErrorAnalisis as e:
+        return {'nombre': nombre, 'error': e.mensaje}
+    return {
+        'nombre': nombre,
+        'complejidad': analizador.complejidad_detectada,
+        'funcion_tiempo': analizador.funcion_tiempo,
+        'expresion': analizador.tiempo_algoritmo.expresion,
+        'exponencial': analizador.detalles_analisis['recursion']['exponencial']
+    }
+
+
+class ComparadorMultiple:
+    """
+    Analiza en paralelo una lista de implementaciones candidatas, las mide
+    opcionalmente y las ordena por costo. Las mediciones se hacen de a una,
+    cada una en su proceso aislado, para que no compitan por la CPU.
+    Los eventos se obtienen sin bloquear con consultar():
+      ('analisis', nombre), ('medicion', nombre), ('error', nombre, mensaje) o ('fin',)
+    """
+
+    def __init__(self, candidatos, medir=False, tamanos=None, tiempo_limite=60,
+                 procesos=None, ruta_cache=None, ruta_costos=None):
+        self.candidatos = _nombres_unicos(candidatos)
+        self.medir = medir
+        self.tamanos = tamanos
+        self.tiempo_limite = tiempo_limite
+        self.procesos = procesos
+        self.ruta_cache = ruta_cache
+        self.ruta_costos = ruta_costos
+        self.resultados = {nombre: {'nombre': nombre} for nombre, _ in self.candidatos}
+        self._pool = None
+        self._futuros = {}
+        self._por_medir = []
+        self._medicion = None
+        self.terminada = False
+
+    def iniciar(self):
+        self._pool = ProcessPoolExecutor(max_workers=self.procesos,
+                                         mp_context=multiprocessing.get_context("spawn"))
+        self._futuros = {
+            self._pool.submit(_analizar_candidato, nombre, codigo, self.ruta_cache, self.ruta_costos): nombre
+            for nombre, codigo in self.candidatos
+        }
+        if self.medir:
+            self._por_medir = list(self.candidatos)
+            self._siguiente_medicion()
+
+    def _siguiente_medicion(self):
+        self._medicion = None
+        if self._por_medir:
+            nombre, codigo = self._por_medir.pop(0)
+            ejecucion = EjecucionAislada(codigo, self.tamanos, tiempo_limite=self.tiempo_limite)
+            ejecucion.iniciar()
+            self._medicion = (nombre, ejecucion)
+
+    def consultar(self):
+        eventos = []
+        if self.terminada:
+            return eventos
+        for futuro in [f for f in self._futuros if f.done()]:
+            nombre = self._futuros.pop(futuro)
+            try:
+                self.resultados[nombre].update(futuro.result())
+            except Exception as e:
+                self.resultados[nombre]['error'] = f"{type(e).__name__}: {e}"
+            if 'error' in self.resultados[nombre]:
+                eventos.append(('error', nombre, self.resultados[nombre]['error']))
+            else:
+                eventos.append(('analisis', nombre))
+
+        if self._medicion is not None:
+            nombre, ejecucion = self._medicion
+            for evento in ejecucion.consultar():
+                if evento[0] == 'resultado':
+                    self.resultados[nombre]['medicion'] = evento[1]
+                    eventos.append(('medicion', nombre))
+                elif evento[0] == 'error':
+                    self.resultados[nombre]['error_medicion'] = evento[1]
+                    eventos.append(('error', nombre, evento[1]))
+            if not ejecucion.activa:
+                self._siguiente_medicion()
+
+        if not self._futuros and self._medicion is None:
+            self._finalizar()
+            eventos.append(('fin',))
+        return eventos
+
+    def cancelar(self):
+        if self._medicion is not None:
+            self._medicion[1].cancelar()
+        self._por_medir = []
+        self._medicion = None
+        for futuro in self._futuros:
+            futuro.cancel()
+        self._futuros = {}
+        self._finalizar()
+
+    def _finalizar(self):
+        self.terminada = True
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+
+    def ejecutar(self, intervalo=0.1):
+        """
+        Versión bloqueante: inicia, espera a que todo termine y devuelve el ranking
+        """
+        self.iniciar()
+        while not self.terminada:
+            self.consultar()
+            time.sleep(intervalo)
+        return self.ranking()
+
+    @staticmethod
+    def _costo_referencia(resultado):
+        if 'expresion' not in resultado:
+            return math.inf
+        if resultado['exponencial']:
+            return math.inf
+        return float(resultado['expresion'].evaluar(N_REFERENCIA))
+
+    def ranking(self):
+        """
+        Candidatos analizados del menos al más costoso en n = N_REFERENCIA (las
+        recursiones exponenciales al final); los que fallaron, después
+        """
+        analizados = [r for r in self.resultados.values() if 'expresion' in r]
+        fallidos = [r for r in self.resultados.values() if 'expresion' not in r]
+        return sorted(analizados, key=lambda r: (r['exponencial'], self._costo_referencia(r))) + fallidos
+
+    def cruces(self, empiricos=False):
+        """
+        (nombre1, nombre2, tamaños de cruce) de cada par de candidatos, entre
+        sus T(n) o, con empiricos, entre las curvas ajustadas a sus mediciones
+        """
+        if empiricos:
+            curvas = [(r['nombre'], curva_empirica(r['medicion'])) for r in self.ranking() if 'medicion' in r]
+        else:
+            curvas = [(r['nombre'], r['expresion'].evaluar) for r in self.ranking()
+                      if 'expresion' in r and not r['exponencial']]
+        curvas = [(nombre, curva) for nombre, curva in curvas if curva is not None]
+        pares = []
+        for i, (nombre1, curva1) in enumerate(curvas):
+            for nombre2, curva2 in curvas[i + 1:]:
+                cruces = puntos_cruce(curva1, curva2)
+                if cruces:
+                    pares.append((nombre1, nombre2, cruces))
+        return pares
+
+    def funciones_tiempo(self):
+        """
+        FuncionTiempo de cada candidato analizado, en el orden del ranking,
+        para graficarlas superpuestas
+        """
+        funciones = []
+        for resultado in self.ranking():
+            if 'expresion' not in resultado:
+                continue
+            funcion = FuncionTiempo()
+            funcion.generar_funcion(resultado['complejidad'])
+            funcion.usar_costo(resultado['expresion'])
+            funcion.notacion_asintotica = f"{resultado['nombre']}: {resultado['complejidad']}"
+            funciones.append(funcion)
+        return funciones
+
+    def obtener_resumen(self):
+        resumen = "COMPARACIÓN DE IMPLEMENTACIONES\n"
+        resumen += "=" * 60 + "\n\n"
+        resumen += f"{'#':>2}  {'candidato':<24} {'complejidad':<14} {'costo (n = ' + str(N_REFERENCIA) + ')':>18}" \
+                   f"  {'exp. empírico':>13}\n"
+        resumen += "─" * 76 + "\n"
+        for posicion, resultado in enumerate(self.ranking(), 1):
+            if 'expresion' not in resultado:
+                resumen += f"{'-':>2}  {resultado['nombre']:<24} error: {resultado.get('error', 'sin resultado')}\n"
+                continue
+            costo = self._costo_referencia(resultado)
+            costo = "∞" if math.isinf(costo) else f"{costo:,.0f}"
+            medicion = resultado.get('medicion')
+            exponente = f"n^{medicion.exponente:.2f}" if medicion is not None and medicion.exponente is not None \
+                else "-"
+            resumen += f"{posicion:>2}  {resultado['nombre']:<24} {resultado['complejidad']:<14} {costo:>18}" \
+                       f"  {exponente:>13}\n"
+
+        resumen += "\nFUNCIONES DE TIEMPO:\n"
+        for resultado in self.ranking():
+            if 'expresion' not in resultado:
+                continue
+            resumen += f"- {resultado['nombre']}: {resultado['funcion_tiempo']}\n"
+            if 'error_medicion' in resultado:
+                resumen += f"  (medición: {resultado['error_medicion']})\n"
+
+        secciones = [("PUNTOS DE CRUCE", self.cruces())]
+        if any('medicion' in r for r in self.resultados.values()):
+            secciones.append(("PUNTOS DE CRUCE (curvas medidas)", self.cruces(empiricos=True)))
+        for titulo, cruces in secciones:
+            resumen += f"\n{titulo}:\n"
+            if not cruces:
+                resumen += "- Ningún par de candidatos se cruza: el orden es el mismo para todo n\n"
+            for nombre1, nombre2, tamanos in cruces:
+                resumen += f"- {nombre1} / {nombre2}: n ≈ {', '.join(f'{n:,.2f}' for n in tamanos)}\n"
+        return resumen
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Compara varias implementaciones (una por archivo .py) y las ordena por costo"
+    )
+    parser.add_argument('rutas', nargs='+', help="directorios, globs o archivos con los candidatos")
+    parser.add_argument('-j', '--procesos', type=int, default=os.cpu_count(),
+                        help="número de procesos de análisis (por defecto, todos los núcleos)")
+    parser.add_argument('--medir', action='store_true',
+                        help="medir además cada candidato (su primera def, con listas aleatorias)")
+    parser.add_argument('--cache', help="archivo SQLite donde guardar los resultados entre ejecuciones")
+    parser.add_argument('--costos', help="archivo JSON que amplía o reemplaza el modelo de costos")
+    args = parser.parse_args(argv)
+
+    candidatos = cargar_candidatos(args.rutas)
+    if len(candidatos) < 2:
+        print("Se necesitan al menos dos candidatos para comparar", file=sys.stderr)
+        return 2
+    comparador = ComparadorMultiple(candidatos, medir=args.medir, procesos=args.procesos,
+                                    ruta_cache=args.cache, ruta_costos=args.costos)
+    comparador.ejecutar()
+    print(comparador.obtener_resumen())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,143 @@
+# detector_patrones.py (patrones de código que elevan la complejidad sin necesidad)
+import ast
+from modelo_costos import TIPO_POR_DEFECTO
+
+_AMBITOS = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Lambda)
+_LITERALES = (ast.List, ast.Tuple, ast.Set, ast.Dict)
+
+
+def _es_cero(nodo):
+    return isinstance(nodo, ast.Constant) and nodo.value == 0 and not isinstance(nodo.value, bool)
+
+
+def _texto(nodo):
+    try:
+        return ast.unparse(nodo)
+    except (AttributeError, ValueError):
+        return "..."
+
+
+class DetectorPatrones:
+    """
+    Busca patrones conocidos que hacen un bucle más caro de lo necesario:
+      - x in lista dentro de un bucle        (usar un set)
+      - cadena += ... dentro de un bucle     (acumular en lista y usar join)
+      - lista.pop(0) / lista.insert(0, x)    (usar collections.deque)
+      - len(x) invariante dentro de un bucle (calcularlo una vez antes)
+      - sorted() / .sort() dentro de un bucle (ordenar una vez o usar heapq)
+    Cada hallazgo es un diccionario con linea, patron, mensaje y sugerencia
+    """
+
+    def __init__(self, modelo_costos, contexto_tipos):
+        self.modelo_costos = modelo_costos
+        self.contexto_tipos = contexto_tipos
+        self.hallazgos = []
+
+    def detectar(self, tree, indice):
+        """
+        indice es el de AnalizadorAlgoritmo: nodo -> InfoNodo con sus bucles
+        """
+        self.hallazgos = []
+        vistos = set()
+        for nodo in ast.walk(tree):
+            info = indice.get(nodo)
+            if info is None or not info.bucles:
+                continue
+            bucles = info.bucles
+            if self._en_iterable(nodo, bucles[-1], indice):
+                # El iterable de un for se evalúa una sola vez, antes de su bucle
+                bucles = bucles[:-1]
+                if not bucles:
+                    continue
+            for patron, mensaje, sugerencia in self._revisar(nodo, bucles[-1]):
+                if (nodo.lineno, patron) in vistos:
+                    continue
+                vistos.add((nodo.lineno, patron))
+                self.hallazgos.append({
+                    'linea': nodo.lineno,
+                    'patron': patron,
+                    'mensaje': mensaje,
+                    'sugerencia': sugerencia
+                })
+        self.hallazgos.sort(key=lambda h: (h['linea'], h['patron']))
+        return self.hallazgos
+
+    @staticmethod
+    def _en_iterable(nodo, bucle, indice):
+        """
+        Indica si el nodo está dentro del iterable (for x in ...) del bucle
+        """
+        if not isinstance(bucle, ast.For):
+            return False
+        while nodo is not None and indice[nodo].padre is not bucle:
+            nodo = indice[nodo].padre
+        return nodo is bucle.iter
+
+    def _revisar(self, nodo, bucle):
+        if isinstance(nodo, ast.Compare):
+            yield from self._pertenencia(nodo)
+        elif isinstance(nodo, ast.AugAssign):
+            yield from self._concatenacion(nodo)
+        elif isinstance(nodo, ast.Call):
+            yield from self._llamada(nodo, bucle)
+
+    def _pertenencia(self, nodo):
+        for operador, comparado in zip(nodo.ops, nodo.comparators):
+            if not isinstance(operador, (ast.In, ast.NotIn)) or isinstance(comparado, _LITERALES):
+                continue
+            tipo = self.contexto_tipos.tipo_de(comparado) or TIPO_POR_DEFECTO
+            costo = self.modelo_costos.costo(f"{tipo}.in")
+            if tipo != 'str' and costo is not None and not costo.es_constante():
+                yield ('pertenencia_en_lista',
+                       f"'in' sobre {_texto(comparado)} ({tipo}) recorre el contenedor en cada iteración: "
+                       f"{costo.complejidad()} por consulta",
+                       f"Convertir {_texto(comparado)} en un set antes del bucle")
+
+    def _concatenacion(self, nodo):
+        if not isinstance(nodo.op, ast.Add) or not isinstance(nodo.target, ast.Name):
+            return
+        if self.contexto_tipos.tipo_de(nodo.target) == 'str' or self.contexto_tipos.tipo_de(nodo.value) == 'str':
+            yield ('concatenacion_cadenas',
+                   f"'{nodo.target.id} += ...' copia la cadena completa en cada iteración",
+                   "Acumular las partes en una lista y unirlas con ''.join() al final")
+
+    def _llamada(self, nodo, bucle):
+        funcion = nodo.func
+        if isinstance(funcion, ast.Name) and funcion.id == 'sorted':
+            yield ('ordenamiento_en_bucle', "sorted() ordena de nuevo en cada iteración: O(n log n) por vuelta",
+                   "Ordenar una sola vez fuera del bucle, o mantener el orden con heapq/bisect")
+        elif isinstance(funcion, ast.Name) and funcion.id == 'len' and len(nodo.args) == 1 \
+                and isinstance(nodo.args[0], ast.Name) and not self._modificado(nodo.args[0].id, bucle):
+            nombre = nodo.args[0].id
+            yield ('len_repetido', f"len({nombre}) se recalcula en cada iteración aunque {nombre} no cambia",
+                   f"Guardar len({nombre}) en una variable antes del bucle")
+        elif isinstance(funcion, ast.Attribute):
+            tipo = self.contexto_tipos.tipo_de(funcion.value)
+            if funcion.attr == 'sort':
+                yield ('ordenamiento_en_bucle', f"{_texto(funcion.value)}.sort() ordena en cada iteración",
+                       "Ordenar una sola vez fuera del bucle, o mantener el orden con heapq/bisect")
+            elif tipo in (None, 'list') and nodo.args and _es_cero(nodo.args[0]) \
+                    and funcion.attr in ('pop', 'insert'):
+                yield (f'{funcion.attr}_al_inicio',
+                       f"{_texto(funcion.value)}.{funcion.attr}(0{', ...' if funcion.attr == 'insert' else ''}) "
+                       f"desplaza todos los elementos de la lista: O(n)",
+                       f"Usar collections.deque y {'popleft()' if funcion.attr == 'pop' else 'appendleft()'}")
+
+    def _modificado(self, nombre, bucle):
+        """
+        Indica si el bucle reasigna el nombre o llama a alguno de sus métodos
+        """
+        pendientes = list(ast.iter_child_nodes(bucle))
+        while pendientes:
+            nodo = pendientes.pop()
+            if isinstance(nodo, _AMBITOS):
+                continue
+            if isinstance(nodo, ast.Name) and nodo.id == nombre and isinstance(nodo.ctx, (ast.Store, ast.Del)):
+                return True
+            if isinstance(nodo, ast.Attribute) and isinstance(nodo.value, ast.Name) and nodo.value.id == nombre:
+                return True
+            if isinstance(nodo, ast.Subscript) and isinstance(nodo.value, ast.Name) and nodo.value.id == nombre \
+                    and isinstance(nodo.ctx, (ast.Store, ast.Del)):
+                return True
+            pendientes.extend(ast.iter_child_nodes(nodo))
+        return False
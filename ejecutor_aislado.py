@@ -0,0 +1,138 @@
+# ejecutor_aislado.py (medición en un proceso separado con límites de tiempo, memoria y CPU)
+import multiprocessing
+import os
+import queue
+import signal
+import time
+from medicion_empirica import MedidorEmpirico, cargar_funcion
+
+try:
+    import resource
+except ImportError:  # Windows: sin límites de recursos, solo el tiempo límite
+    resource = None
+
+
+def _memoria_virtual_actual():
+    """
+    Memoria virtual del proceso en bytes (0 si no se puede leer)
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return 0
+
+
+def _aplicar_limites(limite_memoria_mb, limite_cpu):
+    if resource is None:
+        return
+    if limite_memoria_mb:
+        # El límite se suma a lo que ya ocupa el intérprete para que solo
+        # restrinja lo que reserve el código medido
+        limite = _memoria_virtual_actual() + limite_memoria_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limite, limite))
+    if limite_cpu:
+        resource.setrlimit(resource.RLIMIT_CPU, (limite_cpu, limite_cpu + 1))
+
+
+def _proceso_medicion(codigo, tamanos, repeticiones, limite_memoria_mb, limite_cpu, cola):
+    """
+    Punto de entrada del proceso hijo: mide y envía el progreso y el resultado por la cola
+    """
+    try:
+        _aplicar_limites(limite_memoria_mb, limite_cpu)
+        funcion = cargar_funcion(codigo)
+        medidor = MedidorEmpirico(funcion, tamanos=tamanos, repeticiones=repeticiones)
+        resultado = medidor.medir(progreso=lambda n, tiempo: cola.put(('progreso', n, tiempo)))
+        cola.put(('resultado', resultado))
+    except MemoryError:
+        cola.put(('error', f"El código superó el límite de memoria ({limite_memoria_mb} MB)"))
+    except BaseException as e:
+        cola.put(('error', f"{type(e).__name__}: {e}"))
+
+
+class EjecucionAislada:
+    """
+    Ejecuta una medición de MedidorEmpirico en un proceso hijo, de modo que un
+    código lento o que reserve demasiada memoria no bloquee ni tire abajo la
+    interfaz. Los eventos se obtienen sin bloquear con consultar():
+      ('progreso', n, tiempo_ns), ('resultado', ResultadoMedicion) o ('error', mensaje)
+    """
+
+    def __init__(self, codigo, tamanos=None, repeticiones=5, tiempo_limite=60,
+                 limite_memoria_mb=512, limite_cpu=None):
+        self.codigo = codigo
+        self.tamanos = tamanos
+        self.repeticiones = repeticiones
+        self.tiempo_limite = tiempo_limite
+        self.limite_memoria_mb = limite_memoria_mb
+        self.limite_cpu = limite_cpu or tiempo_limite
+        self.proceso = None
+        self.cola = None
+        self.inicio = None
+        self.terminada = False
+
+    def iniciar(self):
+        contexto = multiprocessing.get_context("spawn")
+        self.cola = contexto.Queue()
+        self.proceso = contexto.Process(
+            target=_proceso_medicion,
+            args=(self.codigo, self.tamanos, self.repeticiones,
+                  self.limite_memoria_mb, self.limite_cpu, self.cola),
+            daemon=True
+        )
+        self.inicio = time.monotonic()
+        self.proceso.start()
+
+    @property
+    def activa(self):
+        return self.proceso is not None and not self.terminada
+
+    def consultar(self):
+        """
+        Devuelve los eventos pendientes sin bloquear y aplica el tiempo límite
+        """
+        eventos = []
+        if self.proceso is None or self.terminada:
+            return eventos
+
+        while True:
+            try:
+                evento = self.cola.get_nowait()
+            except queue.Empty:
+                break
+            eventos.append(evento)
+            if evento[0] in ('resultado', 'error'):
+                self._finalizar()
+                return eventos
+
+        if time.monotonic() - self.inicio > self.tiempo_limite:
+            self.cancelar()
+            eventos.append(('error', f"Se superó el tiempo límite de {self.tiempo_limite} s"))
+        elif not self.proceso.is_alive():
+            # Puede quedar un último evento en la cola tras terminar el proceso
+            try:
+                eventos.append(self.cola.get(timeout=0.5))
+            except queue.Empty:
+                eventos.append(('error', self._motivo_fin()))
+            self._finalizar()
+        return eventos
+
+    def _motivo_fin(self):
+        codigo = self.proceso.exitcode
+        if codigo is not None and codigo < 0 and hasattr(signal, 'SIGXCPU') and -codigo == signal.SIGXCPU:
+            return f"Se superó el límite de CPU ({self.limite_cpu} s)"
+        return f"El proceso de medición terminó inesperadamente (código {codigo})"
+
+    def cancelar(self):
+        if self.proceso is not None and self.proceso.is_alive():
+            self.proceso.terminate()
+            self.proceso.join(1)
+            if self.proceso.is_alive():
+                self.proceso.kill()
+        self._finalizar()
+
+    def _finalizar(self):
+        self.terminada = True
+        if self.proceso is not None:
+            self.proceso.join(1)
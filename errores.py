@@ -0,0 +1,34 @@
+class ErrorAnalisis(Exception):
+    """
+    Error producido al analizar un código. Lo lanzan los analizadores en lugar
+    de mostrar diálogos, para que la interfaz (o cualquier otro cliente)
+    decida cómo informarlo
+    """
+
+    def __init__(self, mensaje, titulo="Error", linea=None, columna=None):
+        super().__init__(mensaje)
+        self.mensaje = mensaje
+        self.titulo = titulo
+        self.linea = linea
+        self.columna = columna
+
+    def como_diccionario(self):
+        """
+        Devuelve el diagnóstico como diccionario serializable
+        """
+        return {
+            'tipo': type(self).__name__,
+            'titulo': self.titulo,
+            'mensaje': self.mensaje,
+            'linea': self.linea,
+            'columna': self.columna
+        }
+
+
+class ErrorSintaxis(ErrorAnalisis):
+    """
+    El código a analizar no es Python válido
+    """
+
+    def __init__(self, mensaje, linea=None, columna=None):
+        super().__init__(mensaje, "Error de Sintaxis", linea, columna)
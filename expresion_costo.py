@@ -0,0 +1,428 @@
+# expresion_costo.py (expresión de costo simbólica: suma de términos c·n^a·log^b n)
+import math
+from fractions import Fraction
+from functools import lru_cache
+
+# Base de los logaritmos que se muestran como "log n" sin base explícita
+# (se evalúan en base 2)
+LOG_SIN_BASE = 0
+
+_SUPERINDICES = {2: "²", 3: "³"}
+
+# Nombres de las variables de tamaño, en el orden en que se asignan y se muestran
+VARIABLES_TAMANO = ("n", "m", "k", "p", "q", "r", "s")
+
+
+def _normalizar(coeficiente):
+    if isinstance(coeficiente, Fraction) and coeficiente.denominator == 1:
+        return int(coeficiente)
+    return coeficiente
+
+
+def _combinar(factores1, factores2):
+    """
+    Multiplica dos productos de factores (tuplas ordenadas de (factor, exponente))
+    """
+    exponentes = dict(factores1)
+    for factor, exponente in factores2:
+        exponentes[factor] = exponentes.get(factor, 0) + exponente
+    return tuple(sorted(((f, e) for f, e in exponentes.items() if e), key=_orden_factor))
+
+
+def _orden_variable(variable):
+    """
+    Posición de una variable: primero las de tamaño (n, m, k, ...), luego el resto
+    """
+    if variable in VARIABLES_TAMANO:
+        return (VARIABLES_TAMANO.index(variable), variable)
+    return (len(VARIABLES_TAMANO), variable)
+
+
+def _orden_factor(factor):
+    clave, _ = factor
+    return _orden_variable(clave[0] if isinstance(clave, tuple) else clave), clave
+
+
+@lru_cache(maxsize=None)
+def _bernoulli(m):
+    """
+    Número de Bernoulli B_m (con B_1 = -1/2)
+    """
+    if m == 0:
+        return Fraction(1)
+    return -sum(math.comb(m + 1, j) * _bernoulli(j) for j in range(m)) / (m + 1)
+
+
+def _suma_potencias(j, cantidad):
+    """
+    Fórmula de Faulhaber: Σ t^j para t = 0 .. cantidad - 1, como expresión
+    """
+    total = ExpresionCosto()
+    for m in range(j + 1):
+        coeficiente = Fraction(math.comb(j + 1, m)) * _bernoulli(m) / (j + 1)
+        if coeficiente:
+            total = total + cantidad ** (j + 1 - m) * coeficiente
+    return total
+
+
+def _como_expresion(valor):
+    if isinstance(valor, ExpresionCosto):
+        return valor
+    return ExpresionCosto.constante(valor)
+
+
+def _log(valor, base):
+    divisor = math.log2(base) if base else 1
+    if hasattr(valor, 'shape'):
+        import numpy as np
+        return np.log2(np.maximum(valor, 1)) / divisor
+    return math.log2(valor) / divisor if valor > 1 else 0
+
+
+def _texto_potencia(variable, exponente):
+    if exponente == 1:
+        return variable
+    if exponente in _SUPERINDICES:
+        return variable + _SUPERINDICES[exponente]
+    return f"{variable}^{exponente}"
+
+
+def _texto_log(variable, base, exponente, notacion_o):
+    if base == LOG_SIN_BASE:
+        texto = f"log {variable}"
+    elif notacion_o:
+        texto = f"log_{base} {variable}"
+    else:
+        texto = f"log_{base}({variable})"
+    return texto if exponente == 1 else f"({texto})^{exponente}"
+
+
+def _texto_coeficiente(coeficiente):
+    if isinstance(coeficiente, Fraction):
+        return f"({coeficiente})"
+    if isinstance(coeficiente, float):
+        return f"{coeficiente:g}"
+    return str(coeficiente)
+
+
+class ExpresionCosto:
+    """
+    Expresión de costo T(n) como suma de términos c·n^a·log^b(n), de grado y
+    bases de logaritmo arbitrarios. Cada término se identifica por la clave
+    (monomio, logaritmos), donde
+      - monomio es una tupla ordenada de (variable, exponente)
+      - logaritmos es una tupla ordenada de ((variable, base), exponente)
+    y guarda su coeficiente exacto (entero o Fraction)
+    """
+
+    def __init__(self, terminos=None):
+        self.terminos = {}
+        for clave, coeficiente in (terminos or {}).items():
+            self._acumular(clave, coeficiente)
+
+    @classmethod
+    def constante(cls, valor=1):
+        return cls({((), ()): valor})
+
+    @classmethod
+    def potencia(cls, variable="n", grado=1, coeficiente=1):
+        if grado == 0:
+            return cls.constante(coeficiente)
+        return cls({(((variable, grado),), ()): coeficiente})
+
+    @classmethod
+    def logaritmo(cls, variable="n", base=LOG_SIN_BASE, grado=1, coeficiente=1):
+        # log_2 y el logaritmo sin base son el mismo término
+        if base == 2:
+            base = LOG_SIN_BASE
+        return cls({((), (((variable, base), grado),)): coeficiente})
+
+    def _acumular(self, clave, coeficiente):
+        total = self.terminos.get(clave, 0) + coeficiente
+        if total:
+            self.terminos[clave] = _normalizar(total)
+        else:
+            self.terminos.pop(clave, None)
+
+    def copia(self):
+        copia = ExpresionCosto()
+        copia.terminos = dict(self.terminos)
+        return copia
+
+    def __add__(self, otra):
+        otra = _como_expresion(otra)
+        resultado = self.copia()
+        for clave, coeficiente in otra.terminos.items():
+            resultado._acumular(clave, coeficiente)
+        return resultado
+
+    __radd__ = __add__
+
+    def __neg__(self):
+        return self * -1
+
+    def __sub__(self, otra):
+        return self + (-_como_expresion(otra))
+
+    def __rsub__(self, otra):
+        return _como_expresion(otra) - self
+
+    def __mul__(self, otra):
+        if not isinstance(otra, ExpresionCosto):
+            if not otra:
+                return ExpresionCosto()
+            resultado = ExpresionCosto()
+            resultado.terminos = {c: _normalizar(v * otra) for c, v in self.terminos.items()}
+            return resultado
+
+        resultado = ExpresionCosto()
+        for (monomio1, logs1), coef1 in self.terminos.items():
+            for (monomio2, logs2), coef2 in otra.terminos.items():
+                clave = (_combinar(monomio1, monomio2), _combinar(logs1, logs2))
+                resultado._acumular(clave, coef1 * coef2)
+        return resultado
+
+    __rmul__ = __mul__
+
+    def __pow__(self, exponente):
+        if not isinstance(exponente, int) or exponente < 0:
+            raise ValueError("Solo se admiten exponentes enteros no negativos")
+        resultado = ExpresionCosto.constante()
+        for _ in range(exponente):
+            resultado = resultado * self
+        return resultado
+
+    def __eq__(self, otra):
+        if not isinstance(otra, ExpresionCosto):
+            otra = _como_expresion(otra)
+        return self.terminos == otra.terminos
+
+    def __bool__(self):
+        return bool(self.terminos)
+
+    def __repr__(self):
+        return f"ExpresionCosto({self.a_texto() or '0'})"
+
+    def maximo(self, otra):
+        """
+        Cota superior término a término de dos expresiones (peor caso entre ramas)
+        """
+        resultado = self.copia()
+        for clave, coeficiente in otra.terminos.items():
+            if coeficiente > resultado.terminos.get(clave, 0):
+                resultado.terminos[clave] = coeficiente
+        return resultado
+
+    def coeficiente(self, grado=0, grado_log=0, base=LOG_SIN_BASE, variable="n"):
+        """
+        Coeficiente del término n^grado·log^grado_log(n)
+        """
+        monomio = ((variable, grado),) if grado else ()
+        logs = (((variable, base), grado_log),) if grado_log else ()
+        return self.terminos.get((monomio, logs), 0)
+
+    def variables(self):
+        """
+        Variables de la expresión, primero las de tamaño en el orden n, m, k, ...
+        """
+        nombres = set()
+        for monomio, logs in self.terminos:
+            nombres.update(v for v, _ in monomio)
+            nombres.update(v for (v, _), _ in logs)
+        return sorted(nombres, key=_orden_variable)
+
+    def firma(self):
+        """
+        Encabezado de la función de tiempo: T(n), T(n, m), ...
+        """
+        return f"T({', '.join(self.variables() or ['n'])})"
+
+    def renombrar(self, cambios):
+        """
+        Reemplaza variables según el diccionario anterior -> nueva (todas a la
+        vez, de modo que se pueden intercambiar). Las variables que pasan a
+        coincidir se combinan: n·m con m -> n es n²
+        """
+        resultado = ExpresionCosto()
+        for (monomio, logs), coeficiente in self.terminos.items():
+            clave = (
+                _combinar((), tuple((cambios.get(v, v), e) for v, e in monomio)),
+                _combinar((), tuple(((cambios.get(v, v), b), e) for (v, b), e in logs))
+            )
+            resultado._acumular(clave, coeficiente)
+        return resultado
+
+    def evaluar_con(self, valores, predeterminado):
+        """
+        Evalúa con las variables indicadas en valores y el resto en predeterminado
+        """
+        return self.evaluar({v: valores.get(v, predeterminado) for v in self.variables()})
+
+    def es_constante(self):
+        return all(clave == ((), ()) for clave in self.terminos)
+
+    @staticmethod
+    def _orden(clave):
+        monomio, logs = clave
+        return (sum(e for _, e in monomio), sum(e for _, e in logs))
+
+    @classmethod
+    def _orden_texto(cls, clave):
+        """
+        Orden en que se muestran los términos: de mayor a menor crecimiento y,
+        a igual grado, primero los que combinan más variables y luego por el
+        orden de las variables (n antes que m), para que el texto no dependa
+        del orden en que se sumaron
+        """
+        monomio, logs = clave
+        grado, grado_log = cls._orden(clave)
+        return (-grado, -grado_log, -len(monomio),
+                tuple((_orden_variable(v), -e) for v, e in monomio),
+                tuple((_orden_variable(v), b, -e) for (v, b), e in logs))
+
+    def termino_dominante(self):
+        """
+        Clave del término de mayor crecimiento (None si la expresión es cero)
+        """
+        positivos = [c for c, v in self.terminos.items() if v > 0] or list(self.terminos)
+        if not positivos:
+            return None
+        return max(positivos, key=self._orden)
+
+    def orden(self):
+        """
+        (grado, grado del logaritmo) del término dominante, para ordenar clases
+        """
+        clave = self.termino_dominante()
+        return self._orden(clave) if clave else (0, 0)
+
+    def grado(self):
+        return self.orden()[0]
+
+    @staticmethod
+    def _domina(clave, otra):
+        """
+        Indica si el término clave crece al menos tanto como otra en cada variable
+        """
+        def por_variable(c):
+            monomio, logs = c
+            grados = {}
+            for v, e in monomio:
+                grados[v] = (e, 0)
+            for (v, _), e in logs:
+                grados[v] = (grados.get(v, (0, 0))[0], grados.get(v, (0, 0))[1] + e)
+            return grados
+        propios, ajenos = por_variable(clave), por_variable(otra)
+        return all(propios.get(v, (0, 0)) >= grado for v, grado in ajenos.items())
+
+    def terminos_dominantes(self):
+        """
+        Claves de los términos que ningún otro supera en todas las variables
+        (con una sola variable, solo el dominante)
+        """
+        if len(self.variables()) <= 1:
+            clave = self.termino_dominante()
+            return [clave] if clave is not None else []
+        positivos = [c for c, v in self.terminos.items() if v > 0] or list(self.terminos)
+        dominantes = []
+        for clave in sorted(positivos, key=self._orden_texto):
+            if not any(self._domina(otra, clave) for otra in dominantes):
+                dominantes.append(clave)
+        return dominantes
+
+    def complejidad(self):
+        """
+        Notación O del término dominante, por ejemplo "O(n²)" o "O(n log n)".
+        Con varias variables se suman los términos no comparables: "O(n·m + k²)"
+        """
+        claves = self.terminos_dominantes()
+        if not claves or claves == [((), ())]:
+            return "O(1)"
+        textos = []
+        for monomio, logs in claves:
+            partes = ["·".join(_texto_potencia(v, e) for v, e in monomio)] if monomio else []
+            partes += [_texto_log(v, b, e, True) for (v, b), e in logs]
+            textos.append(' '.join(partes) or "1")
+        return f"O({' + '.join(textos)})"
+
+    def _texto_termino(self, clave, coeficiente):
+        monomio, logs = clave
+        texto = "·".join(_texto_potencia(v, e) for v, e in monomio)
+        if logs:
+            texto += (" " if texto else "") + " ".join(_texto_log(v, b, e, False) for (v, b), e in logs)
+        if not texto:
+            return _texto_coeficiente(coeficiente)
+        if coeficiente == 1:
+            return texto
+        return _texto_coeficiente(coeficiente) + texto
+
+    def a_texto(self):
+        """
+        Texto de la expresión con los términos de mayor a menor crecimiento,
+        por ejemplo "6n² + 5n + 2"
+        """
+        texto = ""
+        for clave in sorted(self.terminos, key=self._orden_texto):
+            coeficiente = self.terminos[clave]
+            termino = self._texto_termino(clave, abs(coeficiente))
+            if not texto:
+                texto = termino if coeficiente > 0 else f"-{termino}"
+            else:
+                texto += f" + {termino}" if coeficiente > 0 else f" - {termino}"
+        return texto
+
+    def sumatoria(self, variable, inicio, fin, paso=1):
+        """
+        Suma de la expresión para variable = inicio, inicio + paso, ... mientras
+        no alcance fin (como en range), con inicio y fin expresiones. Las
+        potencias de la variable se suman con la fórmula de Faulhaber; sus
+        logaritmos se acotan por el logaritmo de n
+        """
+        inicio, fin = _como_expresion(inicio), _como_expresion(fin)
+        cantidad = (fin - inicio) * Fraction(1, paso)
+        cota = (fin.variables() or ["n"])[0]
+        resultado = ExpresionCosto()
+        for (monomio, logs), coeficiente in self.terminos.items():
+            exponentes = dict(monomio)
+            grado = exponentes.pop(variable, 0)
+            logs = _combinar((), tuple(((cota if v == variable else v, b), e) for (v, b), e in logs))
+            factor = ExpresionCosto({(tuple(sorted(exponentes.items())), logs): coeficiente})
+            if not grado:
+                resultado = resultado + factor * cantidad
+                continue
+            # Σ (inicio + paso·t)^grado = Σ_j C(grado, j)·inicio^(grado-j)·paso^j·Σ t^j
+            suma = ExpresionCosto()
+            for j in range(grado + 1):
+                suma = suma + inicio ** (grado - j) * (math.comb(grado, j) * paso ** j) * _suma_potencias(j, cantidad)
+            resultado = resultado + factor * suma
+        return resultado
+
+    def evaluar(self, valores):
+        """
+        Evalúa la expresión. valores puede ser un número o arreglo de NumPy
+        (se usa para todas las variables) o un diccionario variable -> valor
+        """
+        if not isinstance(valores, dict):
+            valores = {v: valores for v in self.variables()}
+        total = 0
+        for (monomio, logs), coeficiente in self.terminos.items():
+            termino = float(coeficiente)
+            for variable, exponente in monomio:
+                termino = termino * valores[variable] ** exponente
+            for (variable, base), exponente in logs:
+                termino = termino * _log(valores[variable], base) ** exponente
+            total = total + termino
+        return total
+
+    def como_lista(self):
+        """
+        Términos como lista de diccionarios serializables
+        """
+        return [
+            {
+                'coeficiente': str(coeficiente) if isinstance(coeficiente, Fraction) else coeficiente,
+                'potencias': dict(monomio),
+                'logaritmos': [{'variable': v, 'base': b or 2, 'grado': e} for (v, b), e in logs]
+            }
+            for (monomio, logs), coeficiente in sorted(self.terminos.items(), key=lambda t: self._orden_texto(t[0]))
+        ]
@@ -1,4 +1,41 @@
 import math
+from punto_cruce import N_MAXIMO_CRUCE, puntos_cruce, describir_cruces
+
+# Término dominante de cada expresión generada por FuncionTiempo.generar_funcion.
+# Cada término recibe el módulo matemático a usar (math para escalares o numpy
+# para arreglos completos) y el valor de n
+_TERMINOS = {
+    "1": lambda m, n: 1,
+    "log(n)": lambda m, n: m.log2(n),
+    "n": lambda m, n: n,
+    "n*log(n)": lambda m, n: n * m.log2(n),
+    "n²": lambda m, n: n * n,
+    "n³": lambda m, n: n * n * n,
+}
+
+
+def _termino_de_expresion(expresion):
+    """
+    Devuelve el término correspondiente a la expresión; las potencias "n^k"
+    que no están en la tabla se evalúan como n**k, las exponenciales "b^n"
+    como b**n y el resto como lineal
+    """
+    if expresion in _TERMINOS:
+        return _TERMINOS[expresion]
+    if expresion.endswith("^n"):
+        try:
+            base = float(expresion[:-2])
+            return lambda m, n: base ** n
+        except ValueError:
+            pass
+    if expresion.startswith("n^"):
+        try:
+            grado = float(expresion[2:])
+            return lambda m, n: n ** grado
+        except ValueError:
+            pass
+    return _TERMINOS["n"]  # Default
+
 
 class FuncionTiempo:
     """
@@ -9,6 +46,12 @@ class FuncionTiempo:
         self.expresion = expresion
         self.notacion_asintotica = notacion
         self.valores_calculados = {}
+        self.costo = None
+        self._evaluador = None
+        self._expresion_compilada = None
+        # Con varias variables de tamaño: la que recorre el eje x y el valor del resto
+        self.variable = None
+        self.valor_fijo = None
         
     def generar_funcion(self, complejidad):
         """
@@ -23,9 +66,15 @@ class FuncionTiempo:
         elif complejidad == "O(n²)":
             self.expresion = "n²"
             self.notacion_asintotica = "O(n²)"
-        elif complejidad == "O(n³)":
+        elif complejidad in ("O(n³)", "O(n^3)"):
             self.expresion = "n³"
             self.notacion_asintotica = "O(n³)"
+        elif complejidad == "O(n log n)":
+            self.expresion = "n*log(n)"
+            self.notacion_asintotica = "O(n log n)"
+        elif "log" in complejidad and "n log" not in complejidad:
+            self.expresion = "log(n)"
+            self.notacion_asintotica = "O(log n)"
         elif "log" in complejidad:
             self.expresion = "n*log(n)"
             self.notacion_asintotica = "O(n log n)"
@@ -33,37 +82,128 @@ class FuncionTiempo:
             self.expresion = complejidad.replace("O(", "").replace(")", "")
             self.notacion_asintotica = complejidad
     
+    def usar_costo(self, costo):
+        """
+        Usa una ExpresionCosto (con sus coeficientes reales) para evaluar la
+        función en lugar del término dominante de la notación. Un costo
+        polinómico no representa una notación exponencial, que se conserva
+        """
+        self.costo = None if self.notacion_asintotica.endswith("^n)") else costo
+        self._evaluador = None
+
+    def variables(self):
+        """
+        Variables de tamaño del costo (n, m, ...); vacía si no hay costo
+        """
+        return self.costo.variables() if self.costo is not None else []
+
+    def proyecciones(self, valor_fijo):
+        """
+        Una función por variable de tamaño, que varía esa variable con el resto
+        fijo en valor_fijo. Con una sola variable devuelve [self]
+        """
+        if len(self.variables()) <= 1:
+            return [self]
+        proyecciones = []
+        for variable in self.variables():
+            proyeccion = FuncionTiempo(self.expresion, self.notacion_asintotica)
+            proyeccion.costo = self.costo
+            proyeccion.variable = variable
+            proyeccion.valor_fijo = valor_fijo
+            proyecciones.append(proyeccion)
+        return proyecciones
+
+    def etiqueta(self):
+        """
+        Texto de la leyenda: la notación y, en una proyección, qué variable cambia
+        """
+        if self.variable is None:
+            return self.notacion_asintotica
+        return f"{self.notacion_asintotica} ({self.variable} variable, resto = {self.valor_fijo:g})"
+
+    def _valor_costo(self, n):
+        if self.variable is None:
+            return self.costo.evaluar(n)
+        return self.costo.evaluar_con({self.variable: n}, self.valor_fijo)
+
+    def compilar(self):
+        """
+        Devuelve un evaluador vectorizado que recibe un arreglo de n (de NumPy
+        o cualquier secuencia) y devuelve la curva completa como ndarray.
+        Se construye una sola vez y se reutiliza mientras no cambie la expresión
+        """
+        if self._evaluador is None or self._expresion_compilada != self.expresion:
+            import numpy as np
+            if self.costo is not None:
+                termino = lambda m, n: self._valor_costo(n)
+            else:
+                termino = _termino_de_expresion(self.expresion)
+
+            def evaluador(rango_n):
+                n = np.asarray(rango_n, dtype=float)
+                valores = np.zeros(n.shape)
+                positivos = n > 0
+                valores[positivos] = termino(np, n[positivos])
+                return valores
+
+            self._evaluador = evaluador
+            self._expresion_compilada = self.expresion
+        return self._evaluador
+
+    def evaluar(self, rango_n):
+        """
+        Evalúa la función sobre un arreglo de n de una sola vez (admite
+        millones de puntos y rangos logarítmicos, ver rango_logaritmico)
+        """
+        return self.compilar()(rango_n)
+
     def calcular_valores(self, rango_n):
         """
         Calcula los valores de la función para un rango dado
         """
-        valores = []
-        for n in rango_n:
-            if n <= 0:
-                valores.append(0)
-                continue
-                
-            if self.notacion_asintotica == "O(1)":
-                valores.append(1)
-            elif self.notacion_asintotica == "O(n)":
-                valores.append(n)
-            elif self.notacion_asintotica == "O(n²)":
-                valores.append(n * n)
-            elif self.notacion_asintotica == "O(n³)":
-                valores.append(n * n * n)
-            elif self.notacion_asintotica == "O(n log n)":
-                valores.append(n * math.log2(n) if n > 0 else 0)
-            elif self.notacion_asintotica == "O(log n)":
-                valores.append(math.log2(n) if n > 0 else 0)
-            else:
-                valores.append(n)  # Default
-                
-        return valores
+        if self.costo is not None:
+            return [self._valor_costo(n) if n > 0 else 0 for n in rango_n]
+        termino = _termino_de_expresion(self.expresion)
+        return [termino(math, n) if n > 0 else 0 for n in rango_n]
     
+    def valor(self, n):
+        """
+        Valor de la función en un solo n (con los coeficientes reales si los
+        hay); infinito si desborda, como una exponencial en n grande
+        """
+        if n <= 0:
+            return 0
+        try:
+            if self.costo is not None:
+                return float(self._valor_costo(n))
+            return float(_termino_de_expresion(self.expresion)(math, n))
+        except OverflowError:
+            return math.inf
+
+    def cruces(self, otra_funcion, n_max=N_MAXIMO_CRUCE):
+        """
+        Tamaños de entrada en los que esta función y la otra se cruzan
+        """
+        return puntos_cruce(self.valor, otra_funcion.valor, n_max=n_max)
+
+    def describir_cruces(self, otra_funcion, nombre="Función 1", nombre_otra="Función 2", n_max=N_MAXIMO_CRUCE):
+        """
+        Tramos de n en que cada función es la más rápida, como texto
+        """
+        return describir_cruces(self.valor, otra_funcion.valor, nombre, nombre_otra, n_max=n_max)
+
     def comparar(self, otra_funcion):
         """
-        Compara esta función con otra
+        Compara esta función con otra para n grande (al final del rango de
+        cruces), con sus constantes reales. Si ambas desbordan se compara la
+        notación asintótica
         """
+        propio, ajeno = self.valor(N_MAXIMO_CRUCE), otra_funcion.valor(N_MAXIMO_CRUCE)
+        if not (math.isinf(propio) and math.isinf(ajeno)):
+            if math.isclose(propio, ajeno, rel_tol=1e-9):
+                return "Igual eficiencia"
+            return "Más eficiente" if propio < ajeno else "Menos eficiente"
+        
         orden_complejidad = {
             "O(1)": 1,
             "O(log n)": 2,
@@ -81,4 +221,12 @@ class FuncionTiempo:
         elif valor_actual == valor_otra:
             return "Igual eficiencia"
         else:
-            return "Menos eficiente"
\ No newline at end of file
+            return "Menos eficiente"
+
+
+def rango_logaritmico(n_min, n_max, puntos=1000):
+    """
+    Devuelve un arreglo de n espaciado logarítmicamente entre n_min y n_max
+    """
+    import numpy as np
+    return np.geomspace(max(n_min, 1), n_max, puntos)
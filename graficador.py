@@ -2,11 +2,15 @@ import tkinter as tk
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import numpy as np
+from funcion_tiempo import rango_logaritmico
 
 class Graficador:
     """
     Maneja la generación de gráficos para visualizar las funciones de tiempo
     """
+    COLORES = ['blue', 'red', 'green', 'orange', 'purple', 'brown', 'magenta',
+               'olive', 'cyan', 'gray', 'navy', 'teal', 'gold', 'crimson']
+    TRAZOS = ['-', '--', ':', '-.']
     
     def __init__(self, frame_parent):
         self.frame_parent = frame_parent
@@ -15,23 +19,26 @@ class Graficador:
         self.canvas = FigureCanvasTkAgg(self.figura, frame_parent)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         
-    def graficar_funcion(self, funcion_tiempo, titulo="Análisis de Complejidad"):
+    def graficar_funcion(self, funcion_tiempo, titulo="Análisis de Complejidad", n_max=100):
         """
         Grafica una función de tiempo
         """
         self.figura.clear()
         ax = self.figura.add_subplot(111)
         
-        # Generar valores para el eje x
-        n_valores = np.array(range(1, 101))
-        y_valores = funcion_tiempo.calcular_valores(n_valores)
-        
-        # Ajustes de estilo para espacio reducido
-        ax.plot(n_valores, y_valores, 'b-', linewidth=1.5,  # Línea más delgada
-                label=f'{funcion_tiempo.notacion_asintotica}')
+        # Generar valores para el eje x (la curva se evalúa en una sola operación)
+        n_valores = self._rango_n(ax, n_max)
+        # Con varias variables de tamaño se traza una curva por variable
+        for i, proyeccion in enumerate(funcion_tiempo.proyecciones(n_max)):
+            y_valores = proyeccion.evaluar(n_valores)
+            
+            # Ajustes de estilo para espacio reducido
+            ax.plot(n_valores, y_valores, color=self.COLORES[i % len(self.COLORES)],
+                    linewidth=1.5,  # Línea más delgada
+                    label=proyeccion.etiqueta())
         
         # Fuentes más pequeñas
-        ax.set_xlabel('Tamaño de entrada (n)', fontsize=8)
+        ax.set_xlabel('Tamaño de entrada', fontsize=8)
         ax.set_ylabel('Tiempo de ejecución', fontsize=8)
         ax.set_title(titulo, fontsize=9, pad=10)  # pad reduce espacio sobre título
         ax.grid(True, alpha=0.3)
@@ -43,24 +50,32 @@ class Graficador:
         self.figura.subplots_adjust(left=0.15, bottom=0.15, right=0.85, top=0.85)
         self.canvas.draw()
     
-    def graficar_comparacion(self, funciones_lista, titulo="Comparación de Complejidades"):
+    def graficar_comparacion(self, funciones_lista, titulo="Comparación de Complejidades", n_max=100,
+                             marcar_cruces=True):
         """
-        Grafica múltiples funciones para comparación
+        Grafica múltiples funciones para comparación, marcando los tamaños en
+        que dos de ellas se cruzan
         """
         self.figura.clear()
         ax = self.figura.add_subplot(111)
         
-        n_valores = np.array(range(1, 101))
-        colores = ['blue', 'red', 'green', 'orange', 'purple']
+        n_valores = self._rango_n(ax, n_max)
+        max_valores = 0
         
         for i, funcion in enumerate(funciones_lista):
-            y_valores = funcion.calcular_valores(n_valores)
-            color = colores[i % len(colores)]
-            ax.plot(n_valores, y_valores, color=color, linewidth=1.5,  # Línea más delgada
-                    label=funcion.notacion_asintotica)
+            color = self.COLORES[i % len(self.COLORES)]
+            # Las proyecciones de una misma función comparten color y cambian de trazo
+            for j, proyeccion in enumerate(funcion.proyecciones(n_max)):
+                y_valores = proyeccion.evaluar(n_valores)
+                max_valores = max(max_valores, float(y_valores.max()))
+                ax.plot(n_valores, y_valores, color=color, linewidth=1.5,  # Línea más delgada
+                        linestyle=self.TRAZOS[j % len(self.TRAZOS)], label=proyeccion.etiqueta())
+        
+        if marcar_cruces:
+            self._marcar_cruces(ax, funciones_lista, n_max)
         
         # Fuentes más pequeñas
-        ax.set_xlabel('Tamaño de entrada (n)', fontsize=8)
+        ax.set_xlabel('Tamaño de entrada', fontsize=8)
         ax.set_ylabel('Tiempo de ejecución', fontsize=8)
         ax.set_title(titulo, fontsize=9, pad=10)
         ax.grid(True, alpha=0.3)
@@ -69,10 +84,37 @@ class Graficador:
         ax.legend(fontsize=7, loc='center left', bbox_to_anchor=(1, 0.5))
         
         # Escala logarítmica si hay grandes diferencias
-        max_valores = max([max(f.calcular_valores(n_valores)) for f in funciones_lista])
         if max_valores > 10000:
             ax.set_yscale('log')
         
         # Ajustar márgenes para mejor visualización
         self.figura.subplots_adjust(left=0.15, bottom=0.15, right=0.7, top=0.85)
-        self.canvas.draw()
\ No newline at end of file
+        self.canvas.draw()
+
+    def _marcar_cruces(self, ax, funciones_lista, n_max):
+        """
+        Marca con una línea punteada y una cruz cada punto de cruce dentro del
+        rango graficado (solo entre funciones de una variable, que se dibujan
+        como una sola curva)
+        """
+        simples = [f for f in funciones_lista if len(f.variables()) <= 1]
+        cruces = []
+        for i, funcion in enumerate(simples):
+            for otra in simples[i + 1:]:
+                cruces += [(n, funcion.valor(n)) for n in funcion.cruces(otra, n_max)]
+        for n, valor in cruces:
+            ax.axvline(n, color='black', linestyle=':', linewidth=0.8, alpha=0.6)
+            ax.plot([n], [valor], 'kx', markersize=6)
+            # Con muchos cruces las etiquetas se superponen: solo se rotulan unos pocos
+            if len(cruces) <= 4:
+                ax.annotate(f"n₀ ≈ {n:.1f}", (n, valor), textcoords="offset points", xytext=(4, 4), fontsize=7)
+
+    def _rango_n(self, ax, n_max):
+        """
+        Valores de n a graficar: lineales hasta 1000 y espaciados
+        logarítmicamente (con eje x logarítmico) para rangos mayores
+        """
+        if n_max <= 1000:
+            return np.arange(1, int(n_max) + 1)
+        ax.set_xscale('log')
+        return rango_logaritmico(1, n_max, 2000)
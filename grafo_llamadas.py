@@ -0,0 +1,176 @@
+# grafo_llamadas.py (grafo de llamadas entre las funciones de un módulo)
+import ast
+
+_FUNCIONES = (ast.FunctionDef, ast.AsyncFunctionDef)
+_AMBITOS = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Lambda)
+
+
+def componentes_fuertes(grafo):
+    """
+    Componentes fuertemente conexas (Tarjan, iterativo) de un grafo dado como
+    diccionario nodo -> vecinos. Devuelve una lista de listas de nodos en
+    orden topológico inverso (primero las que no llaman a ninguna otra)
+    """
+    indices, bajos, en_pila = {}, {}, set()
+    pila, componentes = [], []
+    contador = 0
+
+    for inicio in grafo:
+        if inicio in indices:
+            continue
+        trabajo = [(inicio, iter(grafo[inicio]))]
+        indices[inicio] = bajos[inicio] = contador
+        contador += 1
+        pila.append(inicio)
+        en_pila.add(inicio)
+
+        while trabajo:
+            nodo, vecinos = trabajo[-1]
+            avanzo = False
+            for vecino in vecinos:
+                if vecino not in indices:
+                    indices[vecino] = bajos[vecino] = contador
+                    contador += 1
+                    pila.append(vecino)
+                    en_pila.add(vecino)
+                    trabajo.append((vecino, iter(grafo.get(vecino, ()))))
+                    avanzo = True
+                    break
+                if vecino in en_pila:
+                    bajos[nodo] = min(bajos[nodo], indices[vecino])
+            if avanzo:
+                continue
+
+            trabajo.pop()
+            if trabajo:
+                padre = trabajo[-1][0]
+                bajos[padre] = min(bajos[padre], bajos[nodo])
+            if bajos[nodo] == indices[nodo]:
+                componente = []
+                while True:
+                    miembro = pila.pop()
+                    en_pila.discard(miembro)
+                    componente.append(miembro)
+                    if miembro is nodo:
+                        break
+                componentes.append(componente)
+    return componentes
+
+
+def recorrer_local(nodos):
+    """
+    Recorre los nodos sin entrar en funciones, clases ni lambdas anidadas
+    """
+    pendientes = list(nodos)
+    while pendientes:
+        nodo = pendientes.pop()
+        yield nodo
+        pendientes.extend(h for h in ast.iter_child_nodes(nodo) if not isinstance(h, _AMBITOS))
+
+
+def _anidadas(funcion):
+    """
+    Funciones definidas directamente dentro de otra (también como métodos de una clase anidada)
+    """
+    anidadas = []
+    pendientes = list(ast.iter_child_nodes(funcion))
+    while pendientes:
+        nodo = pendientes.pop()
+        if isinstance(nodo, _FUNCIONES):
+            anidadas.append(nodo)
+        else:
+            pendientes.extend(ast.iter_child_nodes(nodo))
+    return anidadas
+
+
+class GrafoLlamadas:
+    """
+    Funciones definidas en un módulo y las llamadas entre ellas. Resuelve
+    llamadas por nombre (f(x)) y a métodos de la propia clase (self.m(x))
+    """
+
+    def __init__(self, tree):
+        self.funciones = [n for n in ast.walk(tree) if isinstance(n, _FUNCIONES)]
+        self._metodos = {}
+        self._clase_de = {}
+        for nodo in ast.walk(tree):
+            if isinstance(nodo, ast.ClassDef):
+                for hijo in nodo.body:
+                    if isinstance(hijo, _FUNCIONES):
+                        self._metodos[(nodo, hijo.name)] = hijo
+                        self._clase_de[hijo] = nodo
+        self._por_nombre = {}
+        for funcion in self.funciones:
+            if funcion not in self._clase_de:
+                self._por_nombre.setdefault(funcion.name, []).append(funcion)
+
+        self.llamadas = {f: [destino for _, destino in self.llamadas_salientes(f)] for f in self.funciones}
+        # Funciones llamadas desde el código de nivel de módulo
+        self.llamadas_modulo = {
+            destino
+            for nodo in recorrer_local(n for n in tree.body if not isinstance(n, _AMBITOS))
+            if isinstance(nodo, ast.Call)
+            for destino in self.destinos(nodo, None)
+        }
+        self._componente_de = {}
+        for componente in componentes_fuertes(self.llamadas):
+            for funcion in componente:
+                self._componente_de[funcion] = componente
+        self._con_llamadores = set(self.llamadas_modulo) | {
+            destino
+            for origen, destinos in self.llamadas.items()
+            for destino in destinos if not self.misma_componente(origen, destino)
+        }
+
+    def destinos(self, llamada, funcion):
+        """
+        Funciones del código a las que puede referirse la llamada hecha desde funcion
+        """
+        if isinstance(llamada.func, ast.Name):
+            return self._por_nombre.get(llamada.func.id, [])
+        if isinstance(llamada.func, ast.Attribute) and isinstance(llamada.func.value, ast.Name) \
+                and llamada.func.value.id in ('self', 'cls') and funcion in self._clase_de:
+            metodo = self._metodos.get((self._clase_de[funcion], llamada.func.attr))
+            return [metodo] if metodo else []
+        return []
+
+    def llamadas_salientes(self, funcion):
+        return [
+            (nodo, destino)
+            for nodo in recorrer_local(funcion.body)
+            if isinstance(nodo, ast.Call)
+            for destino in self.destinos(nodo, funcion)
+        ]
+
+    def componentes(self):
+        """
+        Componentes fuertemente conexas de las llamadas, de las hojas hacia arriba
+        """
+        return componentes_fuertes(self.llamadas)
+
+    def es_recursiva(self, componente):
+        return len(componente) > 1 or componente[0] in self.llamadas[componente[0]]
+
+    def componente_de(self, funcion):
+        return self._componente_de.get(funcion)
+
+    def misma_componente(self, funcion, otra):
+        return funcion is not None and self.componente_de(funcion) is self.componente_de(otra)
+
+    def tiene_llamadores(self, funcion):
+        """
+        Indica si la función se llama desde el módulo o desde otra función que
+        no forma parte de su misma recursión
+        """
+        return funcion in self._con_llamadores
+
+    def orden_costeo(self):
+        """
+        Grupos de funciones en el orden en que hay que calcular su costo: las
+        llamadas y las funciones anidadas antes que quien las usa o las contiene
+        """
+        dependencias = {
+            funcion: self.llamadas[funcion] + _anidadas(funcion)
+            for funcion in self.funciones
+        }
+        return componentes_fuertes(dependencias)
@@ -1,9 +1,44 @@
+import math
+import queue
+import threading
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog
 from analizador_algoritmo import AnalizadorAlgoritmo
 from funcion_tiempo import FuncionTiempo
 from graficador import Graficador
-from calculador_tiempo import CalculadorTiempo
+from errores import ErrorAnalisis
+from cache_analisis import CacheAnalisis
+from medicion_empirica import serie_geometrica
+from ejecutor_aislado import EjecucionAislada
+from analisis_en_vivo import AnalisisEnVivo, RETARDO_EN_VIVO_MS
+from comparador_multiple import ComparadorMultiple, cargar_candidatos
+from calibracion import PerfilMaquina
+from operaciones_elementales import texto_histograma
+
+# Colores del mapa de calor del editor, de menor a mayor clase de costo.
+# Las líneas O(1) no se colorean
+NIVELES_COSTO = [
+    ("O(1)", None),
+    ("O(log n)", "#e3f2fd"),
+    ("O(n)", "#fff9c4"),
+    ("O(n log n)", "#ffe0b2"),
+    ("O(n²)", "#ffab91"),
+    ("O(n³)+", "#ef9a9a"),
+]
+
+
+def _nivel_costo(orden):
+    """
+    Posición en NIVELES_COSTO de un término con orden (grado, grado del logaritmo)
+    """
+    grado, grado_log = orden
+    if grado == 0:
+        return 1 if grado_log else 0
+    if grado < 1 or (grado == 1 and not grado_log):
+        return 2
+    if grado == 1:
+        return 3
+    return 4 if grado <= 2 else 5
 
 class InterfazUsuario:
     """
@@ -19,8 +54,18 @@ class InterfazUsuario:
         self.analizador = AnalizadorAlgoritmo()
         self.funcion_actual = None
         self.funciones_comparacion = []
-        self.calculador_tiempo = CalculadorTiempo()
+        self.cache = CacheAnalisis()
+        self.ejecucion = None
+        self.en_vivo = AnalisisEnVivo(self.cache)
+        self._id_en_vivo = None
+        self._consultando_en_vivo = False
+        self.comparador_multiple = None
+        # Costo real de las OE en esta máquina (1e6 OE/seg si no se calibró)
+        self.perfil = PerfilMaquina.cargar_o_predeterminado()
+        self._calibracion = None
         self.inicializar_componentes()
+        if self.perfil.calibrado and not self.perfil.es_de_esta_maquina():
+            self.root.after_idle(self._avisar_perfil_ajeno)
         
     def inicializar_componentes(self):
         """
@@ -88,10 +133,27 @@ class InterfazUsuario:
         ttk.Button(frame_botones_archivo, text="Limpiar", 
                 command=self.limpiar_codigo).pack(side=tk.LEFT)
         
-        # Botón de análisis
-        self.boton_analizar = ttk.Button(frame_codigo, text="Analizar Algoritmo", 
+        # Botón de análisis y modo en vivo
+        frame_analisis = ttk.Frame(frame_codigo)
+        frame_analisis.grid(row=2, column=0, pady=(10, 0))
+        self.boton_analizar = ttk.Button(frame_analisis, text="Analizar Algoritmo", 
                                         command=self.analizar_algoritmo)
-        self.boton_analizar.grid(row=2, column=0, pady=(10, 0))
+        self.boton_analizar.pack(side=tk.LEFT, padx=(0, 5))
+        self.var_en_vivo = tk.BooleanVar()
+        ttk.Checkbutton(frame_analisis, text="Análisis en vivo", variable=self.var_en_vivo,
+                        command=self.cambiar_analisis_en_vivo).pack(side=tk.LEFT)
+        self.etiqueta_en_vivo = ttk.Label(frame_analisis, text="", font=("Arial", 8))
+        self.etiqueta_en_vivo.pack(side=tk.LEFT, padx=(5, 0))
+        self.texto_codigo.bind("<KeyRelease>", self._programar_analisis_en_vivo)
+
+        # Mapa de calor: cada línea se colorea según la clase de su costo
+        frame_leyenda = ttk.Frame(frame_codigo)
+        frame_leyenda.grid(row=3, column=0, pady=(5, 0))
+        for nivel, (clase, color) in enumerate(NIVELES_COSTO):
+            if color:
+                self.texto_codigo.tag_configure(f"costo_{nivel}", background=color)
+                tk.Label(frame_leyenda, text=clase, background=color,
+                         font=("Arial", 8)).pack(side=tk.LEFT, padx=1)
         
         # Frame derecho - Contenedor principal
         frame_derecho = ttk.Frame(main_frame)
@@ -147,10 +209,16 @@ class InterfazUsuario:
         
         ttk.Button(frame_botones_tiempo, text="Medir Tiempo", 
                 command=self.medir_tiempo_real).pack(side=tk.LEFT, padx=(0, 5))
+        self.boton_cancelar_medicion = ttk.Button(frame_botones_tiempo, text="Cancelar",
+                command=self.cancelar_medicion, state=tk.DISABLED)
+        self.boton_cancelar_medicion.pack(side=tk.LEFT, padx=(0, 5))
         ttk.Button(frame_botones_tiempo, text="Estimar", 
                 command=self.estimar_tiempo).pack(side=tk.LEFT, padx=(0, 5))
         ttk.Button(frame_botones_tiempo, text="Proyección", 
-                command=self.proyeccion_tiempo).pack(side=tk.LEFT)
+                command=self.proyeccion_tiempo).pack(side=tk.LEFT, padx=(0, 5))
+        self.boton_calibrar = ttk.Button(frame_botones_tiempo, text="Calibrar",
+                command=self.calibrar_maquina)
+        self.boton_calibrar.pack(side=tk.LEFT)
         
         # Frame para gráficos (ahora más estrecho)
         frame_graficos = ttk.LabelFrame(frame_inferior, text="Visualización", padding="5")
@@ -261,6 +329,13 @@ class InterfazUsuario:
                   command=self.comparar_funciones_usuarios).pack(side=tk.LEFT, padx=(0, 10))
         ttk.Button(frame_botones_comp, text="Análisis Completo", 
                   command=self.analisis_completo_comparacion).pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Button(frame_botones_comp, text="Comparar Archivos...", 
+                  command=lambda: self.comparar_varios(carpeta=False)).pack(side=tk.LEFT, padx=(0, 5))
+        ttk.Button(frame_botones_comp, text="Comparar Carpeta...", 
+                  command=lambda: self.comparar_varios(carpeta=True)).pack(side=tk.LEFT, padx=(0, 5))
+        self.var_medir_candidatos = tk.BooleanVar(value=False)
+        ttk.Checkbutton(frame_botones_comp, text="Medir candidatos", 
+                        variable=self.var_medir_candidatos).pack(side=tk.LEFT, padx=(0, 10))
         ttk.Button(frame_botones_comp, text="Limpiar", 
                   command=self.limpiar_comparador).pack(side=tk.LEFT)
         
@@ -355,6 +430,7 @@ def quick_sort(arr):
         Limpia el área de código
         """
         self.texto_codigo.delete(1.0, tk.END)
+        self.colorear_codigo({})
         self.texto_resultados.delete(1.0, tk.END)
         self.texto_tiempo.delete(1.0, tk.END)
         self.graficador.figura.clear()
@@ -369,20 +445,23 @@ def quick_sort(arr):
             return
         
         try:
-            # Reiniciar el analizador
-            self.analizador = AnalizadorAlgoritmo()
+            # Analizar (o recuperar de la caché si el código no cambió)
+            analizador = self._ejecutar_analisis(codigo)
             
-            if self.analizador.analizar_codigo(codigo):
+            if analizador:
+                self.analizador = analizador
                 # Obtener el resumen directamente como texto
                 resumen_texto = self.analizador.obtener_resumen()
                 
                 # Mostrar resultados en el widget de texto correcto
                 self.texto_resultados.delete("1.0", tk.END)
                 self.texto_resultados.insert("1.0", resumen_texto)
+                self.colorear_codigo(self.analizador.costo_por_linea)
                 
                 # Actualizar la función actual para comparaciones
                 self.funcion_actual = FuncionTiempo()
                 self.funcion_actual.generar_funcion(self.analizador.complejidad_detectada)
+                self.funcion_actual.usar_costo(self.analizador.tiempo_algoritmo.expresion)
                 
                 # Actualizar sección de tiempo
                 total_oe = self.analizador.detalles_analisis['operaciones_primitivas']
@@ -391,6 +470,140 @@ def quick_sort(arr):
         except Exception as e:
             messagebox.showerror("Error", f"Ocurrió un error al analizar el código:\n{str(e)}")
     
+    def _ejecutar_analisis(self, codigo):
+        """
+        Analiza el código a través de la caché y devuelve el analizador,
+        o None si hubo un error (que se muestra en un diálogo)
+        """
+        try:
+            return self.cache.analizar(codigo)
+        except ErrorAnalisis as e:
+            messagebox.showerror(e.titulo, e.mensaje)
+            return None
+
+    def cambiar_analisis_en_vivo(self):
+        """
+        Activa o desactiva el re-análisis automático mientras se edita
+        """
+        if self.var_en_vivo.get():
+            self._lanzar_analisis_en_vivo()
+        else:
+            if self._id_en_vivo is not None:
+                self.root.after_cancel(self._id_en_vivo)
+                self._id_en_vivo = None
+            self.etiqueta_en_vivo.config(text="")
+
+    def _programar_analisis_en_vivo(self, evento=None):
+        """
+        Reinicia la espera en cada tecla: se analiza cuando se deja de escribir
+        """
+        if not self.var_en_vivo.get():
+            return
+        if self._id_en_vivo is not None:
+            self.root.after_cancel(self._id_en_vivo)
+        self._id_en_vivo = self.root.after(RETARDO_EN_VIVO_MS, self._lanzar_analisis_en_vivo)
+
+    def _lanzar_analisis_en_vivo(self):
+        self._id_en_vivo = None
+        codigo = self.texto_codigo.get("1.0", tk.END)
+        if not codigo.strip():
+            return
+        self.etiqueta_en_vivo.config(text="Analizando...")
+        self.en_vivo.solicitar(codigo)
+        if not self._consultando_en_vivo:
+            self._consultando_en_vivo = True
+            self.root.after(100, self._consultar_en_vivo)
+
+    def _consultar_en_vivo(self):
+        """
+        Recoge en el hilo de Tk los resultados del hilo de análisis
+        """
+        for evento in self.en_vivo.consultar():
+            if not self.var_en_vivo.get():
+                continue
+            if evento[0] == 'error':
+                self.etiqueta_en_vivo.config(text=f"Código incompleto ({evento[1]})")
+            else:
+                self._mostrar_analisis_en_vivo(evento[1])
+
+        if self.var_en_vivo.get() or not self.en_vivo.pedidos.empty():
+            self.root.after(100, self._consultar_en_vivo)
+        else:
+            self._consultando_en_vivo = False
+
+    def _mostrar_analisis_en_vivo(self, resultado):
+        texto = "ANÁLISIS EN VIVO\n================\n\n"
+        texto += f"Complejidad detectada: {resultado['complejidad']}\n"
+        texto += f"Función de tiempo estimada: {resultado['expresion'].firma()} = {resultado['expresion'].a_texto() or '0'}\n\n"
+        texto += "Segmentos:\n"
+        costo_por_linea = {}
+        for segmento in resultado['segmentos']:
+            rango = f"líneas {segmento['primera']}-{segmento['ultima']}"
+            analizador = segmento['analizador']
+            if analizador is None:
+                texto += f"- {segmento['nombre']} ({rango}): error: {segmento['error']}\n"
+                continue
+            llamado = "" if segmento['aporta'] else " (se suma donde se lo llama)"
+            texto += f"- {segmento['nombre']} ({rango}): {analizador.complejidad_detectada}, {analizador.funcion_tiempo}{llamado}\n"
+            for linea, costo in segmento['costo_por_linea'].items():
+                costo_por_linea[linea + segmento['primera'] - 1] = costo
+
+        self.texto_resultados.delete("1.0", tk.END)
+        self.texto_resultados.insert("1.0", texto)
+        # Si se siguió escribiendo, las líneas ya no coinciden: se colorea con el próximo resultado
+        if resultado['codigo'] == self.texto_codigo.get("1.0", tk.END):
+            self.colorear_codigo(costo_por_linea)
+        self.etiqueta_en_vivo.config(
+            text=f"{resultado['reanalizados']} segmento(s) analizados, {resultado['reutilizados']} de la caché")
+
+    def colorear_codigo(self, costo_por_linea, desplazamiento=0, lineas=None):
+        """
+        Colorea las líneas del editor según costo_por_linea (línea -> costo,
+        como en AnalizadorAlgoritmo). Solo se tocan las líneas cuyo color
+        cambia; con lineas=(primera, ultima) se actualiza únicamente ese tramo
+        """
+        deseado = {
+            linea + desplazamiento: _nivel_costo(costo['orden'])
+            for linea, costo in costo_por_linea.items()
+        }
+        dentro = (lambda linea: lineas[0] <= linea <= lineas[1]) if lineas else (lambda linea: True)
+
+        # Quitar los colores que ya no corresponden
+        coloreadas = set()
+        for nivel, (_, color) in enumerate(NIVELES_COSTO):
+            if not color:
+                continue
+            etiqueta = f"costo_{nivel}"
+            rangos = self.texto_codigo.tag_ranges(etiqueta)
+            for inicio, fin in zip(rangos[::2], rangos[1::2]):
+                primera = int(str(inicio).split('.')[0])
+                fila, columna = (int(parte) for parte in str(fin).split('.'))
+                for linea in range(primera, fila + (columna > 0)):
+                    if not dentro(linea):
+                        continue
+                    if deseado.get(linea) == nivel:
+                        coloreadas.add(linea)
+                    else:
+                        self.texto_codigo.tag_remove(etiqueta, f"{linea}.0", f"{linea + 1}.0")
+
+        for linea, nivel in deseado.items():
+            if linea not in coloreadas and dentro(linea) and NIVELES_COSTO[nivel][1]:
+                self.texto_codigo.tag_add(f"costo_{nivel}", f"{linea}.0", f"{linea + 1}.0")
+
+    def _analisis_actual(self):
+        """
+        Analiza el código del editor con el mismo motor (y caché) que el
+        resumen, para que las estimaciones usen sus mismos OE y T(n). Devuelve
+        el analizador, o None si hubo un error
+        """
+        analizador = self._ejecutar_analisis(self.texto_codigo.get("1.0", tk.END))
+        if analizador is not None:
+            self.analizador = analizador
+            self.funcion_actual = FuncionTiempo()
+            self.funcion_actual.generar_funcion(analizador.complejidad_detectada)
+            self.funcion_actual.usar_costo(analizador.tiempo_algoritmo.expresion)
+        return analizador
+
     def _formatear_resumen(self, resumen_dict):
         """Convierte el diccionario de resumen a texto formateado"""
         texto = f"""
@@ -460,6 +673,9 @@ def quick_sort(arr):
         for funcion in funciones_seleccionadas[1:]:
             comparacion = self.funcion_actual.comparar(funcion)
             resultado_comp += f"vs {funcion.notacion_asintotica}: {comparacion}\n"
+            cruces = self.funcion_actual.cruces(funcion)
+            if cruces:
+                resultado_comp += f"   se cruzan en n ≈ {', '.join(f'{n:,.2f}' for n in cruces)}\n"
         
         self.texto_resultados.insert(tk.END, resultado_comp)
     
@@ -501,9 +717,9 @@ def quick_sort(arr):
             return
         
         # Crear analizador temporal
-        analizador_temp = AnalizadorAlgoritmo()
+        analizador_temp = self._ejecutar_analisis(codigo)
         
-        if analizador_temp.analizar_codigo(codigo):
+        if analizador_temp:
             resultado = f"ANÁLISIS FUNCIÓN {numero_funcion}:\n"
             resultado += "=" * 30 + "\n"
             resultado += f"Complejidad: {analizador_temp.complejidad_detectada}\n"
@@ -528,16 +744,18 @@ def quick_sort(arr):
             return
         
         # Analizar ambas funciones
-        analizador1 = AnalizadorAlgoritmo()
-        analizador2 = AnalizadorAlgoritmo()
+        analizador1 = self._ejecutar_analisis(codigo1)
+        analizador2 = self._ejecutar_analisis(codigo2) if analizador1 else None
         
-        if analizador1.analizar_codigo(codigo1) and analizador2.analizar_codigo(codigo2):
+        if analizador1 and analizador2:
             # Crear funciones de tiempo
             funcion1 = FuncionTiempo()
             funcion1.generar_funcion(analizador1.complejidad_detectada)
+            funcion1.usar_costo(analizador1.tiempo_algoritmo.expresion)
             
             funcion2 = FuncionTiempo()
             funcion2.generar_funcion(analizador2.complejidad_detectada)
+            funcion2.usar_costo(analizador2.tiempo_algoritmo.expresion)
             
             # Mostrar comparación
             resultado = "\n" + "=" * 60 + "\n"
@@ -548,7 +766,10 @@ def quick_sort(arr):
             resultado += f"FUNCIÓN 2: {analizador2.complejidad_detectada}\n\n"
             
             comparacion = funcion1.comparar(funcion2)
-            resultado += f"RESULTADO: Función 1 es {comparacion} que Función 2\n\n"
+            resultado += f"RESULTADO: Función 1 es {comparacion} que Función 2\n"
+            for frase in funcion1.describir_cruces(funcion2):
+                resultado += f"- {frase}\n"
+            resultado += "\n"
             
             # Detalles específicos
             resultado += "DETALLES FUNCIÓN 1:\n"
@@ -581,17 +802,19 @@ def quick_sort(arr):
             return
         
         # Analizar ambas funciones
-        analizador1 = AnalizadorAlgoritmo()
-        analizador2 = AnalizadorAlgoritmo()
+        analizador1 = self._ejecutar_analisis(codigo1)
+        analizador2 = self._ejecutar_analisis(codigo2) if analizador1 else None
         
-        if analizador1.analizar_codigo(codigo1) and analizador2.analizar_codigo(codigo2):
+        if analizador1 and analizador2:
             # Crear funciones de tiempo
             funcion1 = FuncionTiempo()
             funcion1.generar_funcion(analizador1.complejidad_detectada)
+            funcion1.usar_costo(analizador1.tiempo_algoritmo.expresion)
             funcion1.notacion_asintotica = f"Función 1: {analizador1.complejidad_detectada}"
             
             funcion2 = FuncionTiempo()
             funcion2.generar_funcion(analizador2.complejidad_detectada)
+            funcion2.usar_costo(analizador2.tiempo_algoritmo.expresion)
             funcion2.notacion_asintotica = f"Función 2: {analizador2.complejidad_detectada}"
             
             # Crear gráfico en la pestaña principal
@@ -615,7 +838,11 @@ def quick_sort(arr):
             resultado += "ANÁLISIS COMPARATIVO:\n"
             resultado += "-" * 40 + "\n"
             comparacion = funcion1.comparar(funcion2)
-            resultado += f"Eficiencia: Función 1 es {comparacion} que Función 2\n\n"
+            resultado += f"Eficiencia: Función 1 es {comparacion} que Función 2\n"
+            # Con constantes reales, la función asintóticamente peor puede ganar para n chico
+            for frase in funcion1.describir_cruces(funcion2):
+                resultado += f"• {frase}\n"
+            resultado += "\n"
             
             # Recomendaciones
             resultado += "RECOMENDACIONES:\n"
@@ -636,10 +863,76 @@ def quick_sort(arr):
             messagebox.showinfo("Análisis Completo", 
                               "Análisis completo realizado. Revise los resultados en la pestaña principal.")
     
+    def comparar_varios(self, carpeta=False):
+        """
+        Compara a la vez las funciones de los editores y los archivos elegidos
+        (o todos los .py de una carpeta): las analiza en paralelo, las ordena
+        por costo y grafica todas las curvas superpuestas
+        """
+        if self.comparador_multiple and not self.comparador_multiple.terminada:
+            messagebox.showwarning("Advertencia", "Ya hay una comparación en curso")
+            return
+        
+        if carpeta:
+            ruta = filedialog.askdirectory(title="Seleccionar carpeta con las implementaciones")
+            rutas = [ruta] if ruta else []
+        else:
+            rutas = list(filedialog.askopenfilenames(
+                title="Seleccionar implementaciones a comparar",
+                filetypes=[("Python files", "*.py"), ("All files", "*.*")]
+            ))
+        
+        candidatos = []
+        for numero, texto in ((1, self.texto_funcion1), (2, self.texto_funcion2)):
+            codigo = texto.get(1.0, tk.END).strip()
+            if codigo:
+                candidatos.append((f"Función {numero}", codigo))
+        try:
+            candidatos += cargar_candidatos(rutas)
+        except (OSError, UnicodeDecodeError) as e:
+            messagebox.showerror("Error", f"Error al cargar los archivos: {str(e)}")
+            return
+        
+        if len(candidatos) < 2:
+            messagebox.showwarning("Advertencia", "Se necesitan al menos dos implementaciones para comparar")
+            return
+        
+        self.comparador_multiple = ComparadorMultiple(candidatos, medir=self.var_medir_candidatos.get(),
+                                                      tamanos=serie_geometrica(16, 2048))
+        self.comparador_multiple.iniciar()
+        self.texto_resultados_comp.delete(1.0, tk.END)
+        self.texto_resultados_comp.insert(tk.END, f"Comparando {len(candidatos)} implementaciones...\n")
+        self.root.after(100, self._consultar_comparacion)
+    
+    def _consultar_comparacion(self):
+        """Muestra el avance de la comparación múltiple y el ranking al terminar"""
+        comparador = self.comparador_multiple
+        for evento in comparador.consultar():
+            if evento[0] == 'analisis':
+                self.texto_resultados_comp.insert(tk.END, f"- {evento[1]}: analizada\n")
+            elif evento[0] == 'medicion':
+                self.texto_resultados_comp.insert(tk.END, f"- {evento[1]}: medida\n")
+            elif evento[0] == 'error':
+                self.texto_resultados_comp.insert(tk.END, f"- {evento[1]}: {evento[2]}\n")
+            self.texto_resultados_comp.see(tk.END)
+        
+        if not comparador.terminada:
+            self.root.after(100, self._consultar_comparacion)
+            return
+        
+        self.texto_resultados_comp.delete(1.0, tk.END)
+        self.texto_resultados_comp.insert(tk.END, comparador.obtener_resumen())
+        funciones = comparador.funciones_tiempo()
+        if funciones:
+            self.notebook.select(0)  # El gráfico está en la pestaña principal
+            self.graficador.graficar_comparacion(funciones, "Comparación de Implementaciones")
+    
     def limpiar_comparador(self):
         """
         Limpia las áreas del comparador
         """
+        if self.comparador_multiple and not self.comparador_multiple.terminada:
+            self.comparador_multiple.cancelar()
         self.texto_funcion1.delete(1.0, tk.END)
         self.texto_funcion2.delete(1.0, tk.END)
         self.texto_resultados_comp.delete(1.0, tk.END)
@@ -649,7 +942,8 @@ def quick_sort(arr):
     
     def medir_tiempo_real(self):
         """
-        Mide el tiempo real de ejecución del algoritmo
+        Mide el tiempo real de la primera función del código con entradas de
+        tamaño creciente, en un proceso aparte para no bloquear la interfaz
         """
         codigo = self.texto_codigo.get(1.0, tk.END).strip()
         
@@ -657,39 +951,51 @@ def quick_sort(arr):
             messagebox.showwarning("Advertencia", "Por favor, ingrese código para medir")
             return
         
-        try:
-            # Crear un entorno seguro para ejecutar el código
-            local_vars = {}
-            global_vars = {}
-            
-            # Ejecutar el código para medir tiempo
-            import time
-            inicio = time.time()
-            exec(codigo, global_vars, local_vars)
-            tiempo_ejecucion = time.time() - inicio
-            
-            # Mostrar resultados
-            tiempo_info = f"""
-RESULTADOS DE MEDICIÓN REAL
-==========================
-
-Tiempo de ejecución: {tiempo_ejecucion:.6f} segundos
-
-Detalles:
-• Código ejecutado con los valores por defecto
-• Ambiente controlado sin entradas externas
-• Tiempo puede variar según el hardware
-
-Recomendaciones:
-• Ejecute varias veces para obtener un promedio
-• Pruebe con diferentes tamaños de entrada
-"""
-            
-            self.texto_tiempo.delete(1.0, tk.END)
-            self.texto_tiempo.insert(tk.END, tiempo_info)
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"No se pudo ejecutar el código: {str(e)}")
+        if self.ejecucion and self.ejecucion.activa:
+            messagebox.showwarning("Advertencia", "Ya hay una medición en curso")
+            return
+        
+        # Cada tamaño recibe una lista aleatoria de n enteros
+        self.ejecucion = EjecucionAislada(codigo, tamanos=serie_geometrica(16, 2048), repeticiones=5)
+        self.ejecucion.iniciar()
+        
+        self.texto_tiempo.delete(1.0, tk.END)
+        self.texto_tiempo.insert(tk.END, "MIDIENDO EN UN PROCESO SEPARADO...\n\n")
+        self.boton_cancelar_medicion.config(state=tk.NORMAL)
+        self.root.after(100, self._consultar_medicion)
+    
+    def _consultar_medicion(self):
+        """Muestra el progreso de la medición en curso y su resultado al terminar"""
+        if not self.ejecucion:
+            return
+        
+        for evento in self.ejecucion.consultar():
+            if evento[0] == 'progreso':
+                _, n, tiempo = evento
+                self.texto_tiempo.insert(tk.END, f"n = {n:<8} {tiempo / 1e9:.6f} s\n")
+            elif evento[0] == 'resultado':
+                complejidad = self.analizador.complejidad_detectada if self.funcion_actual else None
+                self.texto_tiempo.delete(1.0, tk.END)
+                self.texto_tiempo.insert(tk.END, evento[1].obtener_resumen(complejidad))
+                if self.funcion_actual:
+                    # La complejidad espacial se muestra junto a T(n) en el análisis
+                    self.analizador.medicion = evento[1]
+                    self.texto_resultados.delete("1.0", tk.END)
+                    self.texto_resultados.insert("1.0", self.analizador.obtener_resumen())
+            else:
+                messagebox.showerror("Error", f"No se pudo ejecutar el código: {evento[1]}")
+        
+        if self.ejecucion.activa:
+            self.root.after(100, self._consultar_medicion)
+        else:
+            self.boton_cancelar_medicion.config(state=tk.DISABLED)
+    
+    def cancelar_medicion(self):
+        """Detiene la medición en curso"""
+        if self.ejecucion and self.ejecucion.activa:
+            self.ejecucion.cancelar()
+            self.texto_tiempo.insert(tk.END, "\nMedición cancelada\n")
+        self.boton_cancelar_medicion.config(state=tk.DISABLED)
     
     def estimar_tiempo(self):
         """
@@ -699,9 +1005,11 @@ Recomendaciones:
             messagebox.showwarning("Advertencia", "Primero debe analizar un algoritmo")
             return
         
-        # Obtener el número base de OE
-        codigo = self.texto_codigo.get(1.0, tk.END).strip()
-        total_oe = self.calculador_tiempo.analizar_codigo(codigo)
+        # OE base del mismo análisis que el resumen
+        analizador = self._analisis_actual()
+        if analizador is None:
+            return
+        total_oe = analizador.detalles_analisis['operaciones_primitivas']
         
         # Crear ventana para entrada de n
         ventana_estimacion = tk.Toplevel(self.root)
@@ -718,7 +1026,7 @@ Recomendaciones:
         
         entrada_oe_por_seg = tk.Entry(ventana_estimacion)
         entrada_oe_por_seg.pack(pady=5)
-        entrada_oe_por_seg.insert(0, "1000000")
+        entrada_oe_por_seg.insert(0, f"{self.perfil.oe_por_segundo():.0f}")
         
         resultado = tk.Text(ventana_estimacion, height=8, width=50)
         resultado.pack(pady=10)
@@ -728,7 +1036,7 @@ Recomendaciones:
                 n = int(entrada_n.get())
                 oe_por_seg = float(entrada_oe_por_seg.get())
                 
-                oe_estimados = self._estimar_oe(n, total_oe)
+                oe_estimados = self._estimar_oe(n)
                 tiempo_estimado = oe_estimados / oe_por_seg
                 
                 resultado.delete(1.0, tk.END)
@@ -737,6 +1045,7 @@ Recomendaciones:
                     f"OE estimados: {oe_estimados}\n"
                     f"Tiempo estimado: {tiempo_estimado:.6f} segundos\n\n"
                     f"Complejidad: {self.analizador.complejidad_detectada}\n"
+                    f"{self.analizador.funcion_tiempo}\n"
                     f"OE base: {total_oe}"
                 )
             except ValueError:
@@ -752,17 +1061,19 @@ Recomendaciones:
             messagebox.showwarning("Advertencia", "Primero debe analizar un algoritmo")
             return
         
-        # Obtener el número base de OE
-        codigo = self.texto_codigo.get(1.0, tk.END).strip()
-        total_oe = self.calculador_tiempo.analizar_codigo(codigo)
+        # OE base del mismo análisis que el resumen
+        analizador = self._analisis_actual()
+        if analizador is None:
+            return
+        total_oe = analizador.detalles_analisis['operaciones_primitivas']
         
         # Calcular proyecciones
         tamanos = [10, 100, 1000, 10000, 100000]
         resultados = []
         
         for n in tamanos:
-            oe = self._estimar_oe(n, total_oe)
-            tiempo = oe / 1e6  # Asumiendo 1 millón de OE por segundo
+            oe = self._estimar_oe(n)
+            tiempo = self.perfil.segundos(self._estimar_oe_por_tipo(n))
             resultados.append((n, oe, tiempo))
         
         # Mostrar resultados
@@ -776,8 +1087,23 @@ Recomendaciones:
             proyeccion_info += f"│ {n:<11} │ {oe:<16} │ {tiempo:<20.6f} │\n"
         
         proyeccion_info += "└─────────────┴──────────────────┴──────────────────────┘\n\n"
-        proyeccion_info += f"Nota: Asumiendo 1,000,000 OE por segundo\n"
+        
+        # Con varias variables de tamaño, cada una se proyecta con el resto fijo
+        variables = self.analizador.tiempo_algoritmo.expresion.variables()
+        if len(variables) > 1:
+            fijo = 1000
+            proyeccion_info += f"Tamaños iguales en la tabla anterior ({', '.join(variables)} = n)\n\n"
+            for variable in variables:
+                proyeccion_info += f"Variando {variable} (resto = {fijo}):\n"
+                for n in tamanos:
+                    oe = self._estimar_oe(n, variable, fijo)
+                    tiempo = self.perfil.segundos(self._estimar_oe_por_tipo(n, variable, fijo))
+                    proyeccion_info += f"  {variable} = {n:<8} OE: {oe:<16} Tiempo: {tiempo:.6f} s\n"
+                proyeccion_info += "\n"
+        proyeccion_info += f"OE por tipo (n = 1000): {texto_histograma(self._estimar_oe_por_tipo(1000))}\n"
+        proyeccion_info += f"Perfil de la máquina: {self.perfil.descripcion()}\n"
         proyeccion_info += f"Complejidad: {self.analizador.complejidad_detectada}\n"
+        proyeccion_info += f"{self.analizador.funcion_tiempo}\n"
         proyeccion_info += f"OE base: {total_oe}"
         
         self.texto_tiempo.delete(1.0, tk.END)
@@ -796,13 +1122,16 @@ INFORMACIÓN DE TIEMPO DE EJECUCIÓN
 
 Detalles del cálculo:
 • Cada operación elemental (OE) toma 1 unidad de tiempo
-• T(n) = Número total de OE
+• {self.analizador.funcion_tiempo}
 • Complejidad temporal: {self.analizador.complejidad_detectada}
+• OE primitivas contadas en el código: {total_oe}
+  ({texto_histograma(self.analizador.detalles_analisis['oe_por_tipo'])})
 
 Ejemplo de estimación:
 Para n = 1000:
-• OE esperados: {self._estimar_oe(1000, total_oe)}
-• Tiempo estimado: {self._estimar_tiempo(1000, total_oe):.6f} segundos (asumiendo 1e6 OE/seg)
+• OE esperados: {self._estimar_oe(1000)}
+• Tiempo estimado: {self._estimar_tiempo(1000):.6f} segundos
+• Perfil de la máquina: {self.perfil.descripcion()}
 
 Utilice los botones para:
 • Medir tiempo real con diferentes entradas
@@ -813,26 +1142,87 @@ Utilice los botones para:
         self.texto_tiempo.insert(tk.END, info_tiempo)
 
     
-    def _estimar_oe(self, n, base_oe):
-            """Estima OE para un tamaño n dado"""
-            complejidad = self.analizador.complejidad_detectada
-            if "O(1)" in complejidad:
-                return base_oe
-            elif "O(n)" in complejidad:
-                return base_oe * n
-            elif "O(n^2)" in complejidad or "O(n²)" in complejidad:
-                return base_oe * n * n
-            elif "O(log n)" in complejidad:
-                return base_oe * (n.bit_length() + 1)
-            elif "O(n log n)" in complejidad:
-                return base_oe * n * (n.bit_length() + 1)
-            else:
-                return base_oe * n  # Por defecto, asumir lineal
+    def _estimar_oe(self, n, variable=None, fijo=None):
+        """
+        Estima OE evaluando T(n) con sus coeficientes reales, incluidas las
+        recursiones exponenciales (infinito si desbordan). Todas las variables
+        de tamaño valen n, salvo que se indique una variable: esa vale n y el
+        resto fijo
+        """
+        tiempo = self.analizador.tiempo_algoritmo
+        if variable is not None:
+            oe = tiempo.evaluar({v: n if v == variable else fijo for v in tiempo.expresion.variables()})
+        else:
+            oe = tiempo.evaluar(n)
+        return oe if math.isinf(oe) else max(1, round(oe))
             
-    def _estimar_tiempo(self, n, base_oe):
-        """Estima tiempo en segundos para un tamaño n"""
-        oe = self._estimar_oe(n, base_oe)
-        return oe / 1e6  # Asumiendo 1 millón de OE por segundo
+    def _estimar_oe_por_tipo(self, n, variable=None, fijo=None):
+        """
+        OE de cada tipo de operación para un tamaño, con los mismos valores de
+        las variables que _estimar_oe
+        """
+        tiempo = self.analizador.tiempo_algoritmo
+        if variable is not None:
+            return tiempo.oe_por_tipo({v: n if v == variable else fijo for v in tiempo.expresion.variables()})
+        return tiempo.oe_por_tipo(n)
+
+    def _estimar_tiempo(self, n):
+        """Estima tiempo en segundos para un tamaño n según el costo de cada tipo de OE en la máquina"""
+        return self.perfil.segundos(self._estimar_oe_por_tipo(n))
+    
+    def calibrar_maquina(self):
+        """
+        Mide el costo de cada tipo de operación elemental en esta máquina y
+        guarda el perfil para las próximas estimaciones. Los microbenchmarks
+        corren en un hilo aparte para no bloquear la interfaz
+        """
+        if self._calibracion is not None:
+            messagebox.showwarning("Advertencia", "Ya hay una calibración en curso")
+            return
+        self._calibracion = queue.Queue()
+        self.boton_calibrar.config(state=tk.DISABLED)
+        self.texto_tiempo.delete(1.0, tk.END)
+        self.texto_tiempo.insert(tk.END, "CALIBRANDO...\n")
+        threading.Thread(target=self._calibrar, args=(self._calibracion,), daemon=True).start()
+        self.root.after(100, self._consultar_calibracion)
+
+    @staticmethod
+    def _calibrar(eventos):
+        try:
+            eventos.put(('resultado', PerfilMaquina.calibrar()))
+        except Exception as e:
+            eventos.put(('error', str(e)))
+
+    def _consultar_calibracion(self):
+        """Recoge en el hilo de Tk el perfil medido por el hilo de calibración"""
+        try:
+            evento = self._calibracion.get_nowait()
+        except queue.Empty:
+            self.root.after(100, self._consultar_calibracion)
+            return
+        self._calibracion = None
+        self.boton_calibrar.config(state=tk.NORMAL)
+        self.texto_tiempo.delete(1.0, tk.END)
+        if evento[0] == 'error':
+            messagebox.showerror("Error", f"No se pudo calibrar: {evento[1]}")
+            return
+        self.perfil = evento[1]
+        try:
+            self.perfil.guardar()
+        except OSError as e:
+            messagebox.showwarning("Advertencia", f"No se pudo guardar el perfil: {str(e)}")
+        self.texto_tiempo.insert(tk.END, self.perfil.obtener_resumen())
+
+    def _avisar_perfil_ajeno(self):
+        """
+        El perfil guardado se midió en otra máquina o con otra versión de
+        Python: sus tiempos no sirven aquí, así que se ofrece recalibrar
+        """
+        if messagebox.askyesno("Perfil de otra máquina",
+                               f"El perfil guardado se midió en {self.perfil.descripcion()}.\n"
+                               "Las estimaciones de tiempo no corresponderán a esta máquina.\n\n"
+                               "¿Calibrar ahora?"):
+            self.calibrar_maquina()
     
     def _configurar_scroll_x(self, frame, *args):
         """Configura el scroll horizontal para los widgets de texto"""
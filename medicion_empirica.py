@@ -0,0 +1,318 @@
+# medicion_empirica.py (medición real del tiempo de ejecución y ajuste a clases de complejidad)
+import ast
+import gc
+import math
+import random
+import time
+import tracemalloc
+
+# Clases candidatas para el ajuste: notación -> g(n)
+CLASES_CANDIDATAS = {
+    "O(1)": lambda n: 1.0,
+    "O(log n)": lambda n: math.log2(n),
+    "O(n)": lambda n: float(n),
+    "O(n log n)": lambda n: n * math.log2(n),
+    "O(n²)": lambda n: float(n) ** 2,
+    "O(n³)": lambda n: float(n) ** 3,
+    "O(2^n)": lambda n: 2.0 ** n,
+}
+
+# Duración mínima de cada muestra (las llamadas más cortas se repiten)
+DURACION_MINIMA_NS = 200_000
+
+# Elementos de entrada que se generan de una vez antes de cronometrar una tanda
+# de llamadas (una entrada nueva por llamada, con la memoria acotada)
+ELEMENTOS_POR_TANDA = 1_000_000
+
+# Variación de memoria pico (bytes) por debajo de la cual el espacio se
+# considera constante sin ajustar (evita ajustar el ruido del intérprete)
+VARIACION_MEMORIA_CONSTANTE = 1024
+
+
+def serie_geometrica(n_min=16, n_max=4096, factor=2):
+    """
+    Tamaños de entrada n_min, n_min·factor, ... hasta n_max
+    """
+    tamanos = []
+    n = n_min
+    while n <= n_max:
+        tamanos.append(int(n))
+        n *= factor
+    return tamanos
+
+
+def lista_aleatoria(n):
+    """
+    Generador de entrada por defecto: lista de n enteros aleatorios
+    """
+    return [random.randint(0, 10 * n) for _ in range(n)]
+
+
+def cargar_funcion(codigo, nombre=None):
+    """
+    Ejecuta el código y devuelve la función indicada (o la primera def
+    de nivel superior si no se indica nombre)
+    """
+    if nombre is None:
+        tree = ast.parse(codigo)
+        nombres = [n.name for n in tree.body if isinstance(n, ast.FunctionDef)]
+        if not nombres:
+            raise ValueError("El código no define ninguna función para medir")
+        nombre = nombres[0]
+
+    espacio = {'__name__': '__medicion__'}
+    exec(codigo, espacio)
+    if not callable(espacio.get(nombre)):
+        raise ValueError(f"No se encontró la función '{nombre}'")
+    return espacio[nombre]
+
+
+def _media_recortada(muestras, recorte):
+    ordenadas = sorted(muestras)
+    k = int(len(ordenadas) * recorte)
+    centrales = ordenadas[k:len(ordenadas) - k] or ordenadas
+    return sum(centrales) / len(centrales)
+
+
+def ajustar_clase(tamanos, tiempos, g):
+    """
+    Ajusta t ≈ a + c·g(n) por mínimos cuadrados ponderados (error relativo).
+    Devuelve (a, c, error) o None si la clase no es evaluable en esos n
+    """
+    try:
+        valores_g = [g(n) for n in tamanos]
+    except OverflowError:
+        return None
+    if any(math.isinf(v) for v in valores_g):
+        return None
+
+    pesos = [1.0 / (t * t) if t > 0 else 1.0 for t in tiempos]
+    s = sum(pesos)
+    sg = sum(w * v for w, v in zip(pesos, valores_g))
+    sgg = sum(w * v * v for w, v in zip(pesos, valores_g))
+    st = sum(w * t for w, t in zip(pesos, tiempos))
+    sgt = sum(w * v * t for w, v, t in zip(pesos, valores_g, tiempos))
+
+    determinante = s * sgg - sg * sg
+    if abs(determinante) <= 1e-12 * max(s * sgg, 1e-300):
+        a, c = st / s, 0.0
+    else:
+        a = (sgg * st - sg * sgt) / determinante
+        c = (s * sgt - sg * st) / determinante
+        if c < 0:
+            a, c = st / s, 0.0
+        elif a < 0:
+            a, c = 0.0, sgt / sgg
+
+    error = math.sqrt(sum(w * (t - a - c * v) ** 2 for w, t, v in zip(pesos, tiempos, valores_g)) / len(tiempos))
+    return a, c, error
+
+
+def mejor_clase(tamanos, valores):
+    """
+    Ajusta los valores a todas las clases candidatas. Devuelve (ajustes, clase),
+    donde entre ajustes casi igual de buenos gana la clase más simple
+    (las clases vecinas, como n y n log n, se distinguen poco)
+    """
+    ajustes = {}
+    for clase, g in CLASES_CANDIDATAS.items():
+        ajuste = ajustar_clase(tamanos, valores, g)
+        if ajuste is not None:
+            ajustes[clase] = ajuste
+    if not ajustes:
+        return ajustes, None
+    mejor = min(ajuste[2] for ajuste in ajustes.values())
+    return ajustes, next(c for c, ajuste in ajustes.items() if ajuste[2] <= mejor * 1.1)
+
+
+def exponente_empirico(tamanos, tiempos):
+    """
+    Pendiente de log t frente a log n en la mitad superior de los tamaños
+    (t ∝ n^k); None si no hay suficientes puntos
+    """
+    puntos = [(math.log(n), math.log(t)) for n, t in zip(tamanos, tiempos) if n > 0 and t > 0]
+    puntos = puntos[len(puntos) // 2:] if len(puntos) >= 6 else puntos
+    if len(puntos) < 2:
+        return None
+    media_x = sum(x for x, _ in puntos) / len(puntos)
+    media_y = sum(y for _, y in puntos) / len(puntos)
+    sxx = sum((x - media_x) ** 2 for x, _ in puntos)
+    if sxx == 0:
+        return None
+    return sum((x - media_x) * (y - media_y) for x, y in puntos) / sxx
+
+
+class ResultadoMedicion:
+    """
+    Tiempos (y opcionalmente memoria) medidos por tamaño de entrada y su
+    ajuste a las clases candidatas
+    """
+
+    def __init__(self, tamanos, tiempos_ns, repeticiones, memoria_bytes=None, asignaciones=None):
+        self.tamanos = tamanos
+        self.tiempos_ns = tiempos_ns
+        self.repeticiones = repeticiones
+        self.memoria_bytes = memoria_bytes or []
+        self.asignaciones = asignaciones or []
+        self.ajustes = {}
+        self.clase_ajustada = None
+        self.exponente = None
+        self.ajustes_espacio = {}
+        self.clase_espacio = None
+        self._ajustar()
+
+    def _ajustar(self):
+        if len(self.tamanos) < 2:
+            return
+        self.ajustes, self.clase_ajustada = mejor_clase(self.tamanos, self.tiempos_ns)
+        self.exponente = exponente_empirico(self.tamanos, self.tiempos_ns)
+        if len(self.memoria_bytes) == len(self.tamanos):
+            if max(self.memoria_bytes) - min(self.memoria_bytes) < VARIACION_MEMORIA_CONSTANTE:
+                self.clase_espacio = "O(1)"
+            else:
+                self.ajustes_espacio, self.clase_espacio = mejor_clase(self.tamanos, self.memoria_bytes)
+
+    def obtener_resumen(self, complejidad_estatica=None):
+        resumen = "RESULTADOS DE MEDICIÓN REAL\n"
+        resumen += "=" * 40 + "\n\n"
+        if self.memoria_bytes:
+            resumen += f"{'n':>10} │ {'tiempo medio':>16} │ {'memoria pico':>14} │ {'bloques':>8}\n"
+            resumen += "─" * 11 + "┼" + "─" * 18 + "┼" + "─" * 16 + "┼" + "─" * 9 + "\n"
+            for n, t, m, a in zip(self.tamanos, self.tiempos_ns, self.memoria_bytes, self.asignaciones):
+                resumen += f"{n:>10} │ {t / 1e9:>14.6f} s │ {m / 1024:>11.1f} KB │ {a:>8}\n"
+        else:
+            resumen += f"{'n':>10} │ {'tiempo medio':>16}\n"
+            resumen += "─" * 11 + "┼" + "─" * 18 + "\n"
+            for n, t in zip(self.tamanos, self.tiempos_ns):
+                resumen += f"{n:>10} │ {t / 1e9:>14.6f} s\n"
+
+        resumen += f"\nRepeticiones por tamaño: {self.repeticiones} (media recortada)\n"
+        if self.clase_ajustada:
+            resumen += f"Clase ajustada (empírica): {self.clase_ajustada}\n"
+        if self.exponente is not None:
+            resumen += f"Exponente empírico: n^{self.exponente:.2f}\n"
+        if self.clase_espacio:
+            resumen += f"Complejidad espacial (empírica): {self.clase_espacio}\n"
+        if complejidad_estatica:
+            resumen += f"Complejidad detectada (estática): {complejidad_estatica}\n"
+
+        if self.ajustes:
+            resumen += "\nError relativo del ajuste por clase:\n"
+            for clase, (_, _, error) in sorted(self.ajustes.items(), key=lambda item: item[1][2]):
+                resumen += f"  {clase:<12} {error:.4f}\n"
+        if self.ajustes_espacio:
+            resumen += "\nError relativo del ajuste de memoria por clase:\n"
+            for clase, (_, _, error) in sorted(self.ajustes_espacio.items(), key=lambda item: item[1][2]):
+                resumen += f"  {clase:<12} {error:.4f}\n"
+        return resumen
+
+
+class MedidorEmpirico:
+    """
+    Ejecuta una función sobre una serie geométrica de tamaños de entrada con
+    calentamiento, repeticiones y recorte de valores atípicos. Con medir_memoria
+    también registra la memoria pico y los bloques reservados de cada tamaño
+    """
+
+    def __init__(self, funcion, generador_entrada=lista_aleatoria, tamanos=None,
+                 repeticiones=7, calentamiento=2, recorte=0.2, tiempo_maximo=2.0,
+                 medir_memoria=True):
+        self.funcion = funcion
+        self.generador_entrada = generador_entrada
+        self.tamanos = tamanos or serie_geometrica()
+        self.repeticiones = repeticiones
+        self.calentamiento = calentamiento
+        self.recorte = recorte
+        # Segundos por muestra a partir de los cuales no se prueban tamaños mayores
+        self.tiempo_maximo = tiempo_maximo
+        self.medir_memoria = medir_memoria
+
+    def _muestra(self, n, llamadas=1):
+        """
+        Tiempo medio por llamada en ns. Cada llamada recibe su propia entrada,
+        generada antes de tomar el tiempo: una función que ordena o modifica
+        la entrada nunca vuelve a procesar datos que ya procesó. Las entradas
+        se generan por tandas de a lo sumo ELEMENTOS_POR_TANDA elementos
+        """
+        tanda = max(1, min(llamadas, ELEMENTOS_POR_TANDA // max(n, 1)))
+        total = 0
+        restantes = llamadas
+        gc_activo = gc.isenabled()
+        try:
+            while restantes:
+                entradas = [self.generador_entrada(n) for _ in range(min(tanda, restantes))]
+                restantes -= len(entradas)
+                gc.disable()
+                inicio = time.perf_counter_ns()
+                for entrada in entradas:
+                    self.funcion(entrada)
+                total += time.perf_counter_ns() - inicio
+                if gc_activo:
+                    gc.enable()
+            return total / llamadas
+        finally:
+            if gc_activo:
+                gc.enable()
+
+    def _memoria(self, n):
+        """
+        Memoria pico en bytes reservada durante una llamada (sin contar la
+        entrada) y cantidad de bloques que siguen reservados al terminar,
+        incluido el resultado. Se mide aparte del tiempo porque tracemalloc
+        ralentiza cada reserva
+        """
+        entrada = self.generador_entrada(n)
+        ya_activo = tracemalloc.is_tracing()
+        if not ya_activo:
+            tracemalloc.start()
+        try:
+            antes = tracemalloc.take_snapshot()
+            base, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            resultado = self.funcion(entrada)
+            _, pico = tracemalloc.get_traced_memory()
+            despues = tracemalloc.take_snapshot()
+            # Las instantáneas reservan memoria propia: se excluye del conteo
+            filtro = [tracemalloc.Filter(False, tracemalloc.__file__)]
+            diferencias = despues.filter_traces(filtro).compare_to(antes.filter_traces(filtro), 'filename')
+            bloques = sum(max(d.count_diff, 0) for d in diferencias)
+            del resultado
+            return max(pico - base, 0), bloques
+        finally:
+            if not ya_activo:
+                tracemalloc.stop()
+
+    def _llamadas_por_muestra(self, n):
+        """
+        Las funciones muy rápidas se llaman varias veces por muestra hasta
+        cubrir DURACION_MINIMA_NS y así quedar por encima de la resolución del reloj
+        """
+        llamadas = 1
+        while llamadas < 10000 and self._muestra(n, llamadas) * llamadas < DURACION_MINIMA_NS:
+            llamadas *= 2
+        return llamadas
+
+    def medir(self, progreso=None):
+        """
+        Mide todos los tamaños y devuelve un ResultadoMedicion. progreso, si se
+        indica, se llama con (n, tiempo medio en ns) tras cada tamaño
+        """
+        tamanos, tiempos, memoria, asignaciones = [], [], [], []
+        for n in self.tamanos:
+            for _ in range(self.calentamiento):
+                self._muestra(n)
+            llamadas = self._llamadas_por_muestra(n)
+            muestras = [self._muestra(n, llamadas) for _ in range(self.repeticiones)]
+            tiempo = _media_recortada(muestras, self.recorte)
+
+            tamanos.append(n)
+            tiempos.append(tiempo)
+            if self.medir_memoria:
+                pico, bloques = self._memoria(n)
+                memoria.append(pico)
+                asignaciones.append(bloques)
+            if progreso:
+                progreso(n, tiempo)
+            if tiempo / 1e9 > self.tiempo_maximo:
+                break
+        return ResultadoMedicion(tamanos, tiempos, self.repeticiones, memoria, asignaciones)
@@ -0,0 +1,366 @@
+# modelo_costos.py (costo de funciones predefinidas, métodos de contenedores y comprensiones)
+import ast
+import hashlib
+import json
+from errores import ErrorAnalisis
+from expresion_costo import ExpresionCosto
+
+# Clase de complejidad de cada operación en función del tamaño n de su entrada.
+# Las claves son nombres de funciones predefinidas, "tipo.metodo", "modulo.funcion"
+# o una operación especial:
+#   - "tipo.metodo(i)": variante del método cuando se llama con argumentos que no
+#                       indican el último elemento (list.pop(0) sí, list.pop(-1) no)
+#   - "tipo.in":        operador in sobre un contenedor de ese tipo
+#   - "rebanada":       arr[a:b]
+#   - "comprension":    iteraciones de cada for de una comprensión
+COSTOS_PREDETERMINADOS = {
+    # Funciones predefinidas
+    'len': '1', 'print': '1', 'abs': '1', 'range': '1', 'enumerate': '1', 'zip': '1',
+    'reversed': '1', 'iter': '1', 'next': '1', 'int': '1', 'float': '1', 'bool': '1',
+    'sum': 'n', 'min': 'n', 'max': 'n', 'any': 'n', 'all': 'n', 'map': '1', 'filter': '1',
+    'list': 'n', 'tuple': 'n', 'set': 'n', 'dict': 'n', 'frozenset': 'n', 'str': '1',
+    'sorted': 'n log n',
+    # list
+    'list.append': '1', 'list.pop': '1', 'list.pop(i)': 'n', 'list.insert': 'n',
+    'list.remove': 'n', 'list.index': 'n', 'list.count': 'n', 'list.extend': 'n',
+    'list.reverse': 'n', 'list.copy': 'n', 'list.clear': '1', 'list.sort': 'n log n',
+    'list.in': 'n',
+    # range (pertenencia aritmética, sin recorrerlo)
+    'range.in': '1',
+    # dict
+    'dict.get': '1', 'dict.pop': '1', 'dict.setdefault': '1', 'dict.keys': '1',
+    'dict.values': '1', 'dict.items': '1', 'dict.update': 'n', 'dict.copy': 'n',
+    'dict.popitem': '1', 'dict.clear': '1', 'dict.in': '1',
+    # set
+    'set.add': '1', 'set.remove': '1', 'set.discard': '1', 'set.pop': '1',
+    'set.union': 'n', 'set.intersection': 'n', 'set.difference': 'n', 'set.update': 'n',
+    'set.issubset': 'n', 'set.copy': 'n', 'set.clear': '1', 'set.in': '1',
+    # str
+    'str.join': 'n', 'str.split': 'n', 'str.replace': 'n', 'str.find': 'n',
+    'str.index': 'n', 'str.count': 'n', 'str.lower': 'n', 'str.upper': 'n',
+    'str.strip': 'n', 'str.startswith': '1', 'str.endswith': '1', 'str.in': 'n',
+    # collections.deque
+    'deque.append': '1', 'deque.appendleft': '1', 'deque.pop': '1', 'deque.popleft': '1',
+    'deque.extend': 'n', 'deque.rotate': 'n', 'deque.remove': 'n', 'deque.in': 'n',
+    # heapq y bisect
+    'heapq.heappush': 'log n', 'heapq.heappop': 'log n', 'heapq.heapreplace': 'log n',
+    'heapq.heappushpop': 'log n', 'heapq.heapify': 'n',
+    'heapq.nlargest': 'n log n', 'heapq.nsmallest': 'n log n',
+    'bisect.bisect': 'log n', 'bisect.bisect_left': 'log n', 'bisect.bisect_right': 'log n',
+    'bisect.insort': 'n', 'bisect.insort_left': 'n', 'bisect.insort_right': 'n',
+    # Operaciones especiales
+    'rebanada': 'n',
+    'comprension': 'n',
+}
+
+# Tipo por defecto de un contenedor cuyo tipo no se pudo inferir
+TIPO_POR_DEFECTO = 'list'
+
+_AMBITOS = (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda, ast.ClassDef)
+_COMPRENSIONES = (ast.ListComp, ast.SetComp, ast.DictComp, ast.GeneratorExp)
+_LITERALES = (ast.List, ast.Tuple, ast.Set, ast.Dict)
+_TIPOS_LITERALES = {ast.List: 'list', ast.ListComp: 'list', ast.Dict: 'dict', ast.DictComp: 'dict',
+                    ast.Set: 'set', ast.SetComp: 'set', ast.JoinedStr: 'str'}
+_CONSTRUCTORES = {'list': 'list', 'dict': 'dict', 'set': 'set', 'str': 'str', 'sorted': 'list',
+                  'deque': 'deque', 'defaultdict': 'dict', 'Counter': 'dict', 'OrderedDict': 'dict',
+                  'range': 'range'}
+# Vistas de diccionario que buscan por hash como el diccionario mismo
+_VISTAS = {'keys': 'dict', 'items': 'dict'}
+
+
+def _es_literal_fijo(nodo):
+    """
+    Contenedor escrito en el código ((1, 2, 3), "aeiou"): su tamaño no
+    depende de la entrada, así que buscar en él cuesta O(1)
+    """
+    return isinstance(nodo, _LITERALES) or (isinstance(nodo, ast.Constant) and isinstance(nodo.value, str))
+
+
+def _es_indice_final(nodo):
+    """
+    Índice que señala el último elemento: -1 o len(x) - 1
+    """
+    if isinstance(nodo, ast.UnaryOp) and isinstance(nodo.op, ast.USub):
+        return isinstance(nodo.operand, ast.Constant) and nodo.operand.value == 1
+    if isinstance(nodo, ast.Constant):
+        return nodo.value == -1
+    return (isinstance(nodo, ast.BinOp) and isinstance(nodo.op, ast.Sub)
+            and isinstance(nodo.right, ast.Constant) and nodo.right.value == 1
+            and isinstance(nodo.left, ast.Call) and isinstance(nodo.left.func, ast.Name)
+            and nodo.left.func.id == 'len')
+
+
+def clase_a_expresion(clase):
+    """
+    Convierte una clase como "1", "log n", "n", "n log n", "n²" o "n^3" en la
+    ExpresionCosto correspondiente
+    """
+    texto = clase.strip().replace("O(", "").rstrip(")").replace("²", "^2").replace("³", "^3")
+    partes = texto.split()
+    expresion = ExpresionCosto.constante()
+    try:
+        while partes:
+            parte = partes.pop(0)
+            if parte == "1":
+                continue
+            if parte == "log":
+                variable = partes.pop(0)
+                expresion = expresion * ExpresionCosto.logaritmo(variable)
+            else:
+                variable, _, grado = parte.partition("^")
+                expresion = expresion * ExpresionCosto.potencia(variable, int(grado or 1))
+    except (IndexError, ValueError):
+        raise ValueError(f"Clase de complejidad no válida: '{clase}'")
+    return expresion
+
+
+class ContextoTipos:
+    """
+    Tipos inferidos de los nombres del código (por asignaciones y anotaciones)
+    y módulos importados con sus alias. Los tipos se guardan por ámbito (el
+    módulo y cada def, lambda o class): un nombre se busca en su ámbito y
+    luego en los que lo contienen, como en Python. costo_llamada, si se
+    asigna, devuelve el costo de una llamada a una función del propio código
+    (o None), y variable_tamano, la letra del tamaño de una expresión (n, m, ...)
+    """
+
+    def __init__(self, tree=None):
+        self.tipos = {None: {}}
+        self.alias = {}
+        self.costo_llamada = None
+        self.variable_tamano = None
+        self._ambito_de = {}
+        self._ambito_padre = {}
+        if tree is not None:
+            self._inferir(tree)
+
+    def dimensionar(self, costo, operando):
+        """
+        Expresa en la variable de tamaño del operando un costo de la tabla (en n)
+        """
+        if costo is None or costo.es_constante() or operando is None or self.variable_tamano is None:
+            return costo
+        variable = self.variable_tamano(operando)
+        return costo if variable == "n" else costo.renombrar({"n": variable})
+
+    def _inferir(self, tree):
+        # Primero se ubica cada nodo en su ámbito y después se infieren los
+        # tipos, para que tipo_de encuentre el ámbito de cualquier nombre
+        recorridos = []
+        pendientes = [(nodo, None) for nodo in ast.iter_child_nodes(tree)]
+        while pendientes:
+            nodo, ambito = pendientes.pop(0)
+            recorridos.append((nodo, ambito))
+            if isinstance(nodo, ast.Name):
+                self._ambito_de[nodo] = ambito
+            if isinstance(nodo, _AMBITOS):
+                self._ambito_padre[nodo] = ambito
+                self.tipos[nodo] = {}
+                # Decoradores, bases y anotaciones de retorno se evalúan afuera
+                internos = set(map(id, nodo.body if isinstance(nodo.body, list) else [nodo.body]))
+                if not isinstance(nodo, ast.ClassDef):
+                    internos.add(id(nodo.args))
+                for hijo in ast.iter_child_nodes(nodo):
+                    pendientes.append((hijo, nodo if id(hijo) in internos else ambito))
+            else:
+                pendientes.extend((hijo, ambito) for hijo in ast.iter_child_nodes(nodo))
+        for nodo, ambito in recorridos:
+            self._registrar(nodo, ambito)
+
+    def _registrar(self, nodo, ambito):
+        tipos = self.tipos[ambito]
+        if isinstance(nodo, ast.Import):
+            for nombre in nodo.names:
+                self.alias[nombre.asname or nombre.name] = nombre.name
+        elif isinstance(nodo, ast.ImportFrom) and nodo.module:
+            for nombre in nodo.names:
+                self.alias[nombre.asname or nombre.name] = f"{nodo.module}.{nombre.name}"
+        elif isinstance(nodo, ast.Assign):
+            tipo = self.tipo_de(nodo.value)
+            for destino in nodo.targets:
+                if isinstance(destino, ast.Name):
+                    self._ligar(tipos, destino.id, tipo)
+        elif isinstance(nodo, ast.AnnAssign) and isinstance(nodo.target, ast.Name):
+            tipo = self._tipo_anotacion(nodo.annotation) or (nodo.value and self.tipo_de(nodo.value))
+            self._ligar(tipos, nodo.target.id, tipo)
+        elif isinstance(nodo, ast.arg):
+            self._ligar(tipos, nodo.arg, nodo.annotation and self._tipo_anotacion(nodo.annotation))
+
+    @staticmethod
+    def _ligar(tipos, nombre, tipo):
+        """
+        Registra un nombre del ámbito aunque su tipo se desconozca (None), para
+        que tape al del mismo nombre de un ámbito exterior; el primer tipo
+        conocido es el que queda
+        """
+        if tipos.get(nombre) is None:
+            tipos[nombre] = tipo or None
+
+    def _tipo_nombre(self, nombre):
+        """
+        Busca el nombre desde su ámbito hacia afuera; el cuerpo de una clase
+        solo es visible para sí mismo, no para sus métodos
+        """
+        ambito = inicial = self._ambito_de.get(nombre)
+        while True:
+            if (ambito is inicial or not isinstance(ambito, ast.ClassDef)) and nombre.id in self.tipos[ambito]:
+                return self.tipos[ambito][nombre.id]
+            if ambito is None:
+                return None
+            ambito = self._ambito_padre[ambito]
+
+    def _tipo_anotacion(self, anotacion):
+        if isinstance(anotacion, ast.Subscript):
+            anotacion = anotacion.value
+        nombre = anotacion.id if isinstance(anotacion, ast.Name) else \
+            anotacion.attr if isinstance(anotacion, ast.Attribute) else None
+        return _CONSTRUCTORES.get(nombre) or _CONSTRUCTORES.get((nombre or "").lower())
+
+    def tipo_de(self, expresion):
+        """
+        Tipo de contenedor de una expresión (None si no se puede inferir)
+        """
+        if type(expresion) in _TIPOS_LITERALES:
+            return _TIPOS_LITERALES[type(expresion)]
+        if isinstance(expresion, ast.Constant) and isinstance(expresion.value, str):
+            return 'str'
+        if isinstance(expresion, ast.Name):
+            return self._tipo_nombre(expresion)
+        if isinstance(expresion, ast.Call):
+            funcion = expresion.func
+            if isinstance(funcion, ast.Attribute) and funcion.attr in _VISTAS:
+                return _VISTAS[funcion.attr]
+            nombre = funcion.id if isinstance(funcion, ast.Name) else \
+                funcion.attr if isinstance(funcion, ast.Attribute) else None
+            return _CONSTRUCTORES.get(nombre)
+        if isinstance(expresion, ast.BinOp) and isinstance(expresion.op, ast.Add):
+            return self.tipo_de(expresion.left) or self.tipo_de(expresion.right)
+        return None
+
+
+class ModeloCostos:
+    """
+    Tabla de costos de operaciones de biblioteca, ampliable con un archivo
+    JSON {"clave": "clase"} que reemplaza o agrega entradas a la tabla
+    """
+
+    def __init__(self, costos=None):
+        self.costos = dict(COSTOS_PREDETERMINADOS)
+        self.costos.update(costos or {})
+        self._expresiones = {clave: clase_a_expresion(clase) for clave, clase in self.costos.items()}
+
+    @classmethod
+    def desde_archivo(cls, ruta):
+        try:
+            with open(ruta, 'r', encoding='utf-8') as f:
+                costos = json.load(f)
+            if not isinstance(costos, dict):
+                raise ValueError("se esperaba un objeto JSON {\"operación\": \"clase\"}")
+            return cls({str(k): str(v) for k, v in costos.items()})
+        except (OSError, ValueError) as e:
+            raise ErrorAnalisis(f"No se pudo cargar el modelo de costos '{ruta}': {e}",
+                                "Error en el modelo de costos") from e
+
+    def huella(self):
+        """
+        Hash de la tabla, para no reutilizar análisis hechos con otro modelo
+        """
+        return hashlib.sha256(json.dumps(self.costos, sort_keys=True).encode('utf-8')).hexdigest()
+
+    def costo(self, clave):
+        return self._expresiones.get(clave)
+
+    def costo_expresion(self, nodo, contexto):
+        """
+        Costo adicional de las llamadas, pertenencias, rebanadas y comprensiones
+        de una expresión. Las operaciones de costo constante no suman nada: ya
+        cuentan como la operación elemental de la sentencia que las contiene
+        """
+        total = ExpresionCosto()
+        pendientes = [nodo]
+        while pendientes:
+            actual = pendientes.pop()
+            if isinstance(actual, _COMPRENSIONES):
+                total = total + self._costo_comprension(actual, contexto)
+                continue
+            if isinstance(actual, (ast.Lambda, ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                continue
+
+            costo = None
+            propio = contexto.costo_llamada(actual) if contexto.costo_llamada and isinstance(actual, ast.Call) else None
+            if propio is not None:
+                # Función del código analizado: se suma su costo completo
+                total = total + propio
+            elif isinstance(actual, ast.Call):
+                costo = contexto.dimensionar(self.costo(self._clave_llamada(actual, contexto)),
+                                             self._operando_llamada(actual, contexto))
+            elif isinstance(actual, ast.Subscript) and isinstance(actual.slice, ast.Slice):
+                costo = contexto.dimensionar(self.costo('rebanada'), actual.value)
+            elif isinstance(actual, ast.Compare):
+                for operador, comparado in zip(actual.ops, actual.comparators):
+                    if isinstance(operador, (ast.In, ast.NotIn)) and not _es_literal_fijo(comparado):
+                        tipo = contexto.tipo_de(comparado) or TIPO_POR_DEFECTO
+                        costo_in = self.costo(f"{tipo}.in")
+                        if costo_in is not None and not costo_in.es_constante():
+                            total = total + contexto.dimensionar(costo_in, comparado)
+            if costo is not None and not costo.es_constante():
+                total = total + costo
+            pendientes.extend(ast.iter_child_nodes(actual))
+        return total
+
+    def _costo_comprension(self, nodo, contexto):
+        """
+        La primera fuente se evalúa una vez; el elemento y los filtros, en
+        cada una de las iteraciones de los for anidados de la comprensión
+        """
+        iteraciones = ExpresionCosto.constante()
+        por_elemento = ExpresionCosto.constante()
+        for i, generador in enumerate(nodo.generators):
+            iteraciones = iteraciones * contexto.dimensionar(
+                self.costo('comprension') or ExpresionCosto.potencia("n"), generador.iter)
+            if i > 0:
+                por_elemento = por_elemento + self.costo_expresion(generador.iter, contexto)
+            for condicion in generador.ifs:
+                por_elemento = por_elemento + self.costo_expresion(condicion, contexto)
+        elementos = [nodo.key, nodo.value] if isinstance(nodo, ast.DictComp) else [nodo.elt]
+        for elemento in elementos:
+            por_elemento = por_elemento + self.costo_expresion(elemento, contexto)
+        return self.costo_expresion(nodo.generators[0].iter, contexto) + iteraciones * por_elemento
+
+    @staticmethod
+    def _operando_llamada(llamada, contexto):
+        """
+        Expresión cuyo tamaño determina el costo de la llamada: el receptor de
+        un método o el primer argumento de una función (heapq.heappush(h, x) -> h)
+        """
+        receptor = llamada.func.value if isinstance(llamada.func, ast.Attribute) else None
+        if receptor is not None and not (isinstance(receptor, ast.Name) and receptor.id in contexto.alias):
+            return receptor
+        return llamada.args[0] if llamada.args else None
+
+    def _clave_llamada(self, llamada, contexto):
+        funcion = llamada.func
+        if isinstance(funcion, ast.Name):
+            return contexto.alias.get(funcion.id, funcion.id)
+        if not isinstance(funcion, ast.Attribute):
+            return None
+
+        receptor, metodo = funcion.value, funcion.attr
+        if isinstance(receptor, ast.Name) and receptor.id in contexto.alias:
+            return f"{contexto.alias[receptor.id]}.{metodo}"
+        tipo = contexto.tipo_de(receptor) or self._tipo_por_metodo(metodo)
+        clave = f"{tipo}.{metodo}"
+        final = len(llamada.args) == 1 and not llamada.keywords and _es_indice_final(llamada.args[0])
+        if (llamada.args or llamada.keywords) and not final and f"{clave}(i)" in self.costos:
+            return f"{clave}(i)"
+        return clave
+
+    def _tipo_por_metodo(self, metodo):
+        """
+        Tipo de un receptor desconocido según los tipos que definen el método
+        (popleft solo existe en deque); si hay varios se supone una lista
+        """
+        tipos = [clave.split('.')[0] for clave in self.costos if clave.endswith(f".{metodo}")]
+        if len(tipos) == 1:
+            return tipos[0]
+        return TIPO_POR_DEFECTO if TIPO_POR_DEFECTO in tipos or not tipos else tipos[0]
@@ -0,0 +1,77 @@
+# operaciones_elementales.py (conteo de operaciones elementales por tipo)
+import ast
+from collections import Counter
+
+# Tipos de operación elemental, en el orden en que se muestran
+TIPOS_OE = ('aritmetica', 'comparacion', 'asignacion', 'subindice', 'llamada', 'atributo', 'reserva')
+
+_AMBITOS = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Lambda)
+_COLECCIONES = (ast.List, ast.Tuple, ast.Set, ast.Dict)
+_COMPRENSIONES = (ast.ListComp, ast.SetComp, ast.DictComp, ast.GeneratorExp)
+
+
+def oe_propias(nodo):
+    """
+    Operaciones elementales que realiza el propio nodo, sin contar las de sus
+    hijos: a[i] = x + 1 son una asignación (Assign), un subíndice (Subscript)
+    y una suma (BinOp)
+    """
+    oe = Counter()
+    if isinstance(nodo, ast.Assign):
+        oe['asignacion'] += len(nodo.targets)
+    elif isinstance(nodo, ast.AugAssign):
+        oe['aritmetica'] += 1
+        oe['asignacion'] += 1
+    elif isinstance(nodo, ast.AnnAssign) and nodo.value is not None:
+        oe['asignacion'] += 1
+    elif isinstance(nodo, ast.BinOp):
+        oe['aritmetica'] += 1
+    elif isinstance(nodo, ast.UnaryOp):
+        # not es una operación lógica; -x y ~x, aritméticas
+        oe['comparacion' if isinstance(nodo.op, ast.Not) else 'aritmetica'] += 1
+    elif isinstance(nodo, ast.BoolOp):
+        oe['comparacion'] += len(nodo.values) - 1
+    elif isinstance(nodo, ast.Compare):
+        oe['comparacion'] += len(nodo.ops)
+    elif isinstance(nodo, ast.Call):
+        oe['llamada'] += 1
+    elif isinstance(nodo, ast.Subscript):
+        oe['subindice'] += 1
+    elif isinstance(nodo, ast.Attribute):
+        oe['atributo'] += 1
+    elif isinstance(nodo, _COMPRENSIONES):
+        oe['reserva'] += 1
+    elif isinstance(nodo, _COLECCIONES) and not isinstance(getattr(nodo, 'ctx', None), (ast.Store, ast.Del)):
+        # Las tuplas y listas de destino (a, b = ...) no crean nada
+        oe['reserva'] += 1
+    return oe
+
+
+def contar_oe_por_tipo(nodo):
+    """
+    Histograma (Counter tipo -> cantidad) de las operaciones elementales de un
+    nodo y todo su subárbol, sin entrar en las funciones, clases y lambdas que
+    define (su cuerpo se cuenta donde se las llama)
+    """
+    oe = Counter()
+    pendientes = [nodo]
+    while pendientes:
+        actual = pendientes.pop()
+        if isinstance(actual, _AMBITOS):
+            continue
+        oe.update(oe_propias(actual))
+        pendientes.extend(ast.iter_child_nodes(actual))
+    return oe
+
+
+def texto_histograma(oe):
+    """
+    Texto del tipo "3 asignacion, 2 aritmetica" con los tipos de mayor a menor cantidad
+    """
+    partes = [(tipo, oe[tipo]) for tipo in TIPOS_OE if oe.get(tipo)]
+    partes.sort(key=lambda parte: parte[1], reverse=True)
+    return ", ".join(f"{_texto_cantidad(cantidad)} {tipo}" for tipo, cantidad in partes) or "sin operaciones"
+
+
+def _texto_cantidad(cantidad):
+    return f"{cantidad:g}" if isinstance(cantidad, float) else str(cantidad)
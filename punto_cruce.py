@@ -0,0 +1,109 @@
+# punto_cruce.py (tamaños de entrada en los que dos funciones de tiempo se cruzan)
+import math
+from medicion_empirica import CLASES_CANDIDATAS
+
+# Rango de n en el que se buscan los cruces
+N_MINIMO_CRUCE = 1
+N_MAXIMO_CRUCE = 1e9
+
+# Muestras geométricas del rango usadas para encerrar cada raíz
+_MUESTRAS = 600
+
+
+def _valor(funcion, n):
+    """
+    Valor de una función de tiempo en n; infinito si desborda (exponenciales)
+    """
+    try:
+        valor = float(funcion(n))
+    except OverflowError:
+        return math.inf
+    return valor if not math.isnan(valor) else math.inf
+
+
+def _signo(f, g, n):
+    a, b = _valor(f, n), _valor(g, n)
+    if a == b:
+        return 0
+    return 1 if a > b else -1
+
+
+def _biseccion(f, g, izquierda, derecha, signo_izquierda, tolerancia):
+    """
+    Raíz de f - g entre dos tamaños con signos opuestos, bisecando en escala
+    logarítmica (los cruces pueden estar en n = 3 o en n = 10⁸)
+    """
+    while derecha / izquierda - 1 > tolerancia:
+        medio = math.sqrt(izquierda * derecha)
+        signo = _signo(f, g, medio)
+        if signo == 0:
+            return medio
+        if signo == signo_izquierda:
+            izquierda = medio
+        else:
+            derecha = medio
+    return math.sqrt(izquierda * derecha)
+
+
+def puntos_cruce(f, g, n_min=N_MINIMO_CRUCE, n_max=N_MAXIMO_CRUCE, tolerancia=1e-12):
+    """
+    Tamaños n en [n_min, n_max] donde f(n) = g(n) y una pasa a ser menor que
+    la otra. f y g son funciones de n (ExpresionCosto.evaluar, una curva
+    empírica, ...). Los tramos en que coinciden no cuentan como cruce
+    """
+    n_min = max(n_min, 1e-9)
+    razon = (n_max / n_min) ** (1 / _MUESTRAS)
+    cruces = []
+    anterior = None
+    for i in range(_MUESTRAS + 1):
+        n = n_max if i == _MUESTRAS else n_min * razon ** i
+        signo = _signo(f, g, n)
+        if signo == 0:
+            continue
+        if anterior is not None and signo != anterior[1]:
+            cruces.append(_biseccion(f, g, anterior[0], n, anterior[1], tolerancia))
+        anterior = (n, signo)
+    return cruces
+
+
+def curva_empirica(medicion):
+    """
+    Curva ajustada de una medición (ResultadoMedicion): t(n) = a + c·g(n) en
+    ns con la clase ganadora; None si no hay ajuste
+    """
+    if not medicion.clase_ajustada:
+        return None
+    a, c, _ = medicion.ajustes[medicion.clase_ajustada]
+    g = CLASES_CANDIDATAS[medicion.clase_ajustada]
+    return lambda n: a + c * g(n)
+
+
+def _texto_n(n):
+    return f"{n:,.0f}" if n >= 100 else f"{n:.2f}"
+
+
+def describir_cruces(f, g, nombre1="Función 1", nombre2="Función 2",
+                     n_min=N_MINIMO_CRUCE, n_max=N_MAXIMO_CRUCE):
+    """
+    Frases del tipo "Función 1 es más rápida para n < N₀" que cubren todo el
+    rango, un tramo por cada intervalo entre cruces
+    """
+    cruces = puntos_cruce(f, g, n_min, n_max)
+    limites = [n_min] + cruces + [n_max]
+    frases = []
+    for izquierda, derecha in zip(limites, limites[1:]):
+        signo = _signo(f, g, math.sqrt(izquierda * derecha))
+        if signo == 0:
+            continue
+        mas_rapida = nombre1 if signo < 0 else nombre2
+        if izquierda == n_min and derecha == n_max:
+            frases.append(f"{mas_rapida} es más rápida para todo n en [{_texto_n(n_min)}, {_texto_n(n_max)}]")
+        elif izquierda == n_min:
+            frases.append(f"{mas_rapida} es más rápida para n < {_texto_n(derecha)}")
+        elif derecha == n_max:
+            frases.append(f"{mas_rapida} es más rápida para n > {_texto_n(izquierda)}")
+        else:
+            frases.append(f"{mas_rapida} es más rápida para {_texto_n(izquierda)} < n < {_texto_n(derecha)}")
+    if not frases:
+        frases.append(f"{nombre1} y {nombre2} tardan lo mismo en todo el rango")
+    return frases
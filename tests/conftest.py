@@ -0,0 +1,21 @@
+# conftest.py (las pruebas importan los módulos de la raíz del proyecto)
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analizador_algoritmo import AnalizadorAlgoritmo  # noqa: E402
+
+
+@pytest.fixture
+def analizar():
+    """
+    Analiza un código con el analizador principal y devuelve el analizador
+    """
+    def _analizar(codigo, modelo_costos=None):
+        analizador = AnalizadorAlgoritmo(modelo_costos)
+        analizador.analizar_codigo(codigo)
+        return analizador
+    return _analizar
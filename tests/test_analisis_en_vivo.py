@@ -0,0 +1,116 @@
+# test_analisis_en_vivo.py (re-análisis incremental por segmentos)
+import time
+
+from analisis_en_vivo import AnalisisEnVivo, unidades_de_analisis, dividir_segmentos
+from cache_analisis import CacheAnalisis
+
+AYUDANTE = """def ayudante(a):
+    for x in a:
+        print(x)
+"""
+
+PRINCIPAL = """def principal(a):
+    for y in a:
+        ayudante(a)
+"""
+
+SUELTA = """def suelta(a):
+    return len(a)
+"""
+
+
+def test_llamada_entre_segmentos_como_el_modulo_completo(analizar):
+    codigo = AYUDANTE + "\n" + PRINCIPAL
+    resultado = AnalisisEnVivo(CacheAnalisis())._analizar(codigo)
+    completo = analizar(codigo)
+    assert resultado['complejidad'] == "O(n²)"
+    assert resultado['expresion'].a_texto() == completo.tiempo_algoritmo.expresion.a_texto()
+    assert [segmento['aporta'] for segmento in resultado['segmentos']] == [False, True]
+
+
+def test_solo_se_reanalizan_los_segmentos_afectados():
+    en_vivo = AnalisisEnVivo(CacheAnalisis())
+    codigo = AYUDANTE + "\n" + PRINCIPAL + "\n" + SUELTA
+    assert en_vivo._analizar(codigo)['reanalizados'] == 3
+
+    otra_suelta = SUELTA.replace("len(a)", "len(a) + 1")
+    resultado = en_vivo._analizar(AYUDANTE + "\n" + PRINCIPAL + "\n" + otra_suelta)
+    assert (resultado['reanalizados'], resultado['reutilizados']) == (1, 2)
+
+    # Cambiar el llamado invalida también a quien lo llama
+    otro_ayudante = AYUDANTE.replace("print(x)", "print(x, x)")
+    resultado = en_vivo._analizar(otro_ayudante + "\n" + PRINCIPAL + "\n" + otra_suelta)
+    assert (resultado['reanalizados'], resultado['reutilizados']) == (2, 1)
+
+
+def test_las_lineas_quedan_dentro_del_segmento():
+    codigo = PRINCIPAL + "\n" + AYUDANTE
+    resultado = AnalisisEnVivo(CacheAnalisis())._analizar(codigo)
+    principal = resultado['segmentos'][0]
+    assert principal['analizador'].costo_por_linea.keys() - principal['costo_por_linea'].keys()
+    assert max(principal['costo_por_linea']) <= principal['ultima'] - principal['primera'] + 1
+
+
+def test_recursion_mutua_entre_segmentos_aporta_una_vez():
+    codigo = """def par(n):
+    if n == 0:
+        return True
+    return impar(n - 1)
+
+def impar(n):
+    if n == 0:
+        return False
+    return par(n - 1)
+
+par(10)
+"""
+    unidades = unidades_de_analisis(dividir_segmentos(codigo))
+    assert [aporta for _, aporta in unidades] == [False, False, True]
+    assert unidades[0][0].startswith("def par") and unidades[1][0].startswith("def impar")
+
+
+def test_dividir_segmentos():
+    codigo = """import os
+x = 1
+
+@staticmethod
+def a(arr):
+    return arr
+y = [1]
+
+class K:
+    pass
+"""
+    segmentos = [(nombre, primera, ultima) for nombre, primera, ultima, _ in dividir_segmentos(codigo)]
+    assert segmentos == [("(módulo)", 1, 2), ("a", 4, 6), ("(módulo)", 7, 7), ("K", 9, 10)]
+    assert dividir_segmentos(codigo)[1][3].startswith("@staticmethod")
+
+
+def _esperar(en_vivo):
+    for _ in range(200):
+        eventos = en_vivo.consultar()
+        if eventos:
+            return eventos
+        time.sleep(0.02)
+    raise AssertionError("el análisis en vivo no respondió")
+
+
+def test_hilo_de_trabajo():
+    en_vivo = AnalisisEnVivo(CacheAnalisis())
+    try:
+        en_vivo.solicitar(AYUDANTE)
+        (tipo, resultado), = _esperar(en_vivo)
+        assert tipo == 'resultado' and resultado['complejidad'] == "O(n)"
+
+        en_vivo.solicitar("def f(:\n")
+        (tipo, mensaje), = _esperar(en_vivo)
+        assert tipo == 'error' and mensaje.startswith("Línea 1:")
+    finally:
+        en_vivo.detener()
+
+
+def test_solo_interesa_el_ultimo_pedido():
+    en_vivo = AnalisisEnVivo(CacheAnalisis())
+    for codigo in ("x = 1\n", "x = 2\n", SUELTA):
+        en_vivo.pedidos.put(codigo)
+    assert en_vivo._ultimo_pedido(en_vivo.pedidos.get()) == SUELTA
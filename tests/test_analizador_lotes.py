@@ -0,0 +1,68 @@
+# test_analizador_lotes.py (análisis por lotes desde la línea de comandos)
+import json
+
+import pytest
+
+import analizador_lotes
+from analizador_lotes import analizar_rutas, descubrir_archivos, main
+
+CODIGO = """def ayudante(a):
+    for x in a:
+        print(x)
+
+def principal(a):
+    for y in a:
+        ayudante(a)
+"""
+
+
+@pytest.fixture
+def arbol(tmp_path, monkeypatch):
+    # Cada prueba empieza sin la caché del proceso
+    monkeypatch.setattr(analizador_lotes, "_cache", None)
+    (tmp_path / "a.py").write_text(CODIGO, encoding="utf-8")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "b.py").write_text("def f(:\n", encoding="utf-8")
+    (tmp_path / "sub" / "notas.txt").write_text("x", encoding="utf-8")
+    (tmp_path / ".oculto").mkdir()
+    (tmp_path / ".oculto" / "c.py").write_text("x = 1\n", encoding="utf-8")
+    return tmp_path
+
+
+def test_descubrir_archivos(arbol):
+    archivos = list(descubrir_archivos([str(arbol), str(arbol / "a.py"), str(arbol / "**" / "*.py")]))
+    assert archivos == [str(arbol / "a.py"), str(arbol / "sub" / "b.py")]
+
+
+def test_una_fila_por_funcion_y_errores(arbol):
+    filas = list(analizar_rutas([str(arbol)], procesos=1))
+    por_funcion = {fila['funcion']: fila for fila in filas if 'funcion' in fila}
+    assert por_funcion['ayudante']['complejidad'] == "O(n)"
+    # La llamada a ayudante se resuelve dentro del archivo
+    assert por_funcion['principal']['complejidad'] == "O(n²)"
+    assert set(por_funcion['principal']['costo_por_linea']) <= {5, 6, 7}
+    errores = [fila for fila in filas if 'error' in fila]
+    assert [(fila['archivo'], fila['error']['tipo']) for fila in errores] == [(str(arbol / "sub" / "b.py"), "ErrorSintaxis")]
+
+
+def test_main_escribe_json_lines_y_usa_la_cache(arbol):
+    salida = arbol / "salida.jsonl"
+    cache = arbol / "cache.sqlite"
+    assert main([str(arbol / "a.py"), "-j", "1", "-o", str(salida), "--cache", str(cache)]) == 0
+    filas = [json.loads(linea) for linea in salida.read_text(encoding="utf-8").splitlines()]
+    assert [fila['funcion'] for fila in filas] == ["ayudante", "principal"]
+    assert cache.exists()
+
+
+def test_main_rechaza_un_modelo_de_costos_invalido(arbol, capsys):
+    costos = arbol / "costos.json"
+    costos.write_text("[]", encoding="utf-8")
+    assert main([str(arbol), "--costos", str(costos)]) == 2
+    assert "modelo de costos" in capsys.readouterr().err
+
+
+def test_pool_de_procesos_da_las_mismas_filas(arbol):
+    def resumen(filas):
+        return sorted((fila['archivo'], fila.get('funcion', ''), fila.get('complejidad', '')) for fila in filas)
+    secuencial = resumen(analizar_rutas([str(arbol)], procesos=1))
+    assert resumen(analizar_rutas([str(arbol)], procesos=2)) == secuencial
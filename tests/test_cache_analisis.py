@@ -0,0 +1,79 @@
+# test_cache_analisis.py (caché de análisis en memoria y en disco)
+from cache_analisis import CacheAnalisis, CacheDisco, hash_codigo
+from modelo_costos import ModeloCostos
+
+CODIGO = """def f(a):
+    for x in a:
+        print(x)
+"""
+
+
+def test_la_clave_ignora_comentarios_espacios_y_docstrings():
+    documentado = '''def f(a):
+    """Recorre a"""
+    for x in a:
+        print(x)
+'''
+    variante = '''def f(a):
+    """Muestra cada elemento"""
+    for x in a:   # un comentario
+        print( x )
+'''
+    assert hash_codigo(documentado) == hash_codigo(variante)
+    assert hash_codigo(CODIGO) == hash_codigo(CODIGO.replace("print(x)", "print(x)  # listo"))
+
+
+def test_la_clave_incluye_posiciones_y_modelo():
+    corrido = "\n" + CODIGO
+    assert hash_codigo(CODIGO) != hash_codigo(corrido)
+    assert hash_codigo(CODIGO, ModeloCostos()) != hash_codigo(CODIGO, ModeloCostos({'print': 'n'}))
+
+
+def test_resultado_restaurado_con_las_lineas_del_codigo():
+    cache = CacheAnalisis()
+    primero = cache.analizar(CODIGO)
+    corrido = cache.analizar("\n" + CODIGO)
+    assert cache.fallos == 2
+    assert set(corrido.costo_por_linea) == {linea + 1 for linea in primero.costo_por_linea}
+
+    comentado = CODIGO.replace("print(x)", "print(x)  # listo")
+    restaurado = cache.analizar(comentado)
+    assert cache.estadisticas()['aciertos_memoria'] == 1
+    assert restaurado.complejidad_detectada == primero.complejidad_detectada
+    assert restaurado.lineas == comentado.splitlines()
+
+
+def test_expulsion_lru_en_memoria():
+    cache = CacheAnalisis(max_memoria=2)
+    codigos = [f"x = {i}\n" for i in range(3)]
+    cache.analizar(codigos[0])
+    cache.analizar(codigos[1])
+    cache.analizar(codigos[0])
+    cache.analizar(codigos[2])
+    assert cache.estadisticas()['entradas_memoria'] == 2
+    cache.analizar(codigos[0])
+    cache.analizar(codigos[1])
+    # Se expulsó el menos usado (codigos[1]), no el más antiguo
+    assert (cache.aciertos_memoria, cache.fallos) == (2, 4)
+
+
+def test_nivel_en_disco_entre_instancias(tmp_path):
+    ruta = str(tmp_path / "cache.sqlite")
+    cache = CacheAnalisis(ruta_disco=ruta)
+    cache.analizar(CODIGO)
+    cache.cerrar()
+
+    otra = CacheAnalisis(ruta_disco=ruta)
+    assert otra.analizar(CODIGO).complejidad_detectada == "O(n)"
+    assert (otra.aciertos_disco, otra.fallos) == (1, 0)
+    otra.cerrar()
+
+
+def test_el_disco_respeta_el_tamano_maximo(tmp_path):
+    disco = CacheDisco(str(tmp_path / "cache.sqlite"), max_bytes=250)
+    for i in range(5):
+        disco.guardar(f"clave{i}", bytes(100))
+    assert disco.bytes_usados <= 250
+    assert disco.obtener("clave4") is not None
+    assert disco.obtener("clave0") is None
+    disco.cerrar()
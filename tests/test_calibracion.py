@@ -0,0 +1,63 @@
+# test_calibracion.py (perfil de la máquina para convertir OE en segundos)
+import json
+
+import pytest
+
+from calibracion import MICROBENCHMARKS, NS_POR_OE_PREDETERMINADO, PerfilMaquina, main
+from errores import ErrorAnalisis
+
+
+def test_segundos_por_tipo_y_sin_tipo():
+    perfil = PerfilMaquina({'asignacion': 10.0, 'llamada': 50.0})
+    assert perfil.ns_por_oe() == 30.0
+    assert perfil.segundos(1e9) == pytest.approx(30.0)
+    # Los tipos no medidos cuestan el promedio
+    assert perfil.segundos({'asignacion': 2, 'llamada': 1, 'reserva': 1}) == pytest.approx((20 + 50 + 30) / 1e9)
+
+
+def test_predeterminado_sin_calibrar():
+    perfil = PerfilMaquina.predeterminado()
+    assert not perfil.calibrado
+    assert perfil.ns_por_oe() == NS_POR_OE_PREDETERMINADO
+    assert perfil.descripcion().startswith("sin calibrar")
+
+
+def test_calibrar_mide_cada_tipo():
+    perfil = PerfilMaquina.calibrar(numero=1000, repeticiones=1)
+    assert set(perfil.ns_por_tipo) == set(MICROBENCHMARKS)
+    assert all(ns > 0 for ns in perfil.ns_por_tipo.values())
+    assert perfil.es_de_esta_maquina()
+
+
+def test_guardar_y_cargar(tmp_path):
+    ruta = str(tmp_path / "perfil" / "perfil.json")
+    perfil = PerfilMaquina.calibrar(numero=1000, repeticiones=1)
+    perfil.guardar(ruta)
+    cargado = PerfilMaquina.cargar(ruta)
+    assert cargado.ns_por_tipo == perfil.ns_por_tipo
+    assert cargado.es_de_esta_maquina() and "otra máquina" not in cargado.descripcion()
+
+
+def test_perfil_de_otra_maquina(tmp_path):
+    ruta = tmp_path / "perfil.json"
+    ruta.write_text(json.dumps({'ns_por_tipo': {'llamada': 40}, 'maquina': {'nodo': 'otra'},
+                                'fecha': '2020-01-01T00:00:00'}), encoding='utf-8')
+    perfil = PerfilMaquina.cargar(str(ruta))
+    assert not perfil.es_de_esta_maquina()
+    assert "conviene recalibrar" in perfil.descripcion()
+
+
+def test_perfil_invalido(tmp_path):
+    ruta = tmp_path / "perfil.json"
+    ruta.write_text("{}", encoding='utf-8')
+    with pytest.raises(ErrorAnalisis):
+        PerfilMaquina.cargar(str(ruta))
+    assert not PerfilMaquina.cargar_o_predeterminado(str(ruta)).calibrado
+    assert not PerfilMaquina.cargar_o_predeterminado(str(tmp_path / "no_existe.json")).calibrado
+
+
+def test_main_guarda_el_perfil(tmp_path, capsys):
+    ruta = tmp_path / "perfil.json"
+    assert main(["-o", str(ruta), "-n", "1000"]) == 0
+    assert PerfilMaquina.cargar(str(ruta)).calibrado
+    assert "Perfil guardado" in capsys.readouterr().out
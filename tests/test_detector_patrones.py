@@ -0,0 +1,71 @@
+# test_detector_patrones.py (patrones que elevan la complejidad dentro de bucles)
+import pytest
+
+
+def _patrones(analizar, codigo):
+    return [(h['linea'], h['patron']) for h in analizar(codigo).detalles_analisis['patrones']]
+
+
+@pytest.mark.parametrize("sentencia, patron", [
+    ("if x in vistos: pass", "pertenencia_en_lista"),
+    ("texto += str(x)", "concatenacion_cadenas"),
+    ("cola.pop(0)", "pop_al_inicio"),
+    ("cola.insert(0, x)", "insert_al_inicio"),
+    ("y = len(a)", "len_repetido"),
+    ("y = sorted(a)", "ordenamiento_en_bucle"),
+    ("cola.sort()", "ordenamiento_en_bucle"),
+])
+def test_patron_en_bucle(analizar, sentencia, patron):
+    codigo = f"""def f(a):
+    vistos = []
+    texto = ""
+    cola = []
+    for x in a:
+        {sentencia}
+"""
+    assert _patrones(analizar, codigo) == [(6, patron)]
+
+
+@pytest.mark.parametrize("sentencia", [
+    "if x in conjunto: pass",
+    "if x in range(x + 1): pass",
+    "if x in d.keys(): pass",
+    "if x in (1, 2, 3): pass",
+    "cola.pop()",
+    "cola.append(x)",
+])
+def test_sin_patron(analizar, sentencia):
+    codigo = f"""def f(a):
+    conjunto = set(a)
+    d = {{}}
+    cola = []
+    for x in a:
+        {sentencia}
+"""
+    assert _patrones(analizar, codigo) == []
+
+
+def test_fuera_de_bucles_no_se_reporta(analizar):
+    assert _patrones(analizar, "def f(a, x):\n    a.pop(0)\n    return x in a\n") == []
+
+
+def test_el_iterable_del_for_se_evalua_una_vez(analizar):
+    codigo = """def f(a):
+    for x in sorted(a):
+        print(x)
+    for x in a:
+        for y in sorted(a):
+            print(y)
+"""
+    # El sorted del for de afuera corre una vez; el del for interno, en cada vuelta
+    assert _patrones(analizar, codigo) == [(5, "ordenamiento_en_bucle")]
+
+
+def test_len_de_una_lista_que_cambia_no_es_invariante(analizar):
+    codigo = """def f(a):
+    b = []
+    for x in a:
+        b.append(x)
+        y = len(b)
+"""
+    assert _patrones(analizar, codigo) == []
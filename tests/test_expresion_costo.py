@@ -0,0 +1,40 @@
+# test_expresion_costo.py (pruebas del álgebra simbólica de ExpresionCosto)
+from fractions import Fraction
+
+import pytest
+
+from expresion_costo import ExpresionCosto
+
+n = ExpresionCosto.potencia("n")
+m = ExpresionCosto.potencia("m")
+
+
+def test_terminos_no_comparables_en_orden_estable():
+    assert (m + n).complejidad() == "O(n + m)"
+    assert (n + m).complejidad() == "O(n + m)"
+    assert (n * m + n ** 2 + m).complejidad() == "O(n·m + n²)"
+
+
+def test_texto_sin_coeficientes_unitarios():
+    assert (n * m + n * ExpresionCosto.logaritmo("n") + 1).a_texto() == "n·m + n log n + 1"
+    assert (n * 3 - 1).a_texto() == "3n - 1"
+
+
+def test_coeficientes_exactos():
+    triangular = ExpresionCosto.potencia("i").sumatoria("i", 0, n - 1)
+    assert triangular.a_texto() == "(1/2)n² - (3/2)n + 1"
+    assert triangular.coeficiente(2) == Fraction(1, 2)
+    assert triangular.evaluar(10) == 36
+
+
+def test_evaluacion_de_varios_terminos():
+    expresion = n ** 2 * 3 + n * ExpresionCosto.logaritmo("n") + 5
+    assert expresion.evaluar(8) == 3 * 64 + 8 * 3 + 5
+    numpy = pytest.importorskip("numpy")
+    assert list(expresion.evaluar(numpy.array([2, 4]))) == [3 * 4 + 2 + 5, 3 * 16 + 8 + 5]
+    assert expresion.complejidad() == "O(n²)"
+
+
+def test_maximo_termino_a_termino():
+    assert (n * 2 + 4).maximo(n * 3 + 1).a_texto() == "3n + 4"
+    assert not (n - n)
@@ -0,0 +1,54 @@
+# test_medicion_empirica.py (pruebas del ajuste empírico de tiempos medidos)
+import pytest
+
+from medicion_empirica import MedidorEmpirico, exponente_empirico, mejor_clase
+
+
+def _insercion(a):
+    # Ordena en el lugar: con la misma lista ya ordenada tardaría O(n)
+    for i in range(1, len(a)):
+        x = a[i]
+        j = i - 1
+        while j >= 0 and a[j] > x:
+            a[j + 1] = a[j]
+            j -= 1
+        a[j + 1] = x
+
+
+def test_cada_llamada_recibe_una_entrada_nueva():
+    vistas = []
+    medidor = MedidorEmpirico(vistas.append, tamanos=[8], repeticiones=1, calentamiento=0, medir_memoria=False)
+    medidor._muestra(8, llamadas=5)
+    assert len({id(entrada) for entrada in vistas}) == 5
+
+
+def test_ordenamiento_en_el_lugar_se_ajusta_cuadratico():
+    resultado = MedidorEmpirico(_insercion, tamanos=[32, 64, 128, 256], repeticiones=3,
+                                calentamiento=1, medir_memoria=False).medir()
+    assert resultado.clase_ajustada == "O(n²)"
+    assert resultado.exponente == pytest.approx(2, abs=0.4)
+
+
+@pytest.mark.parametrize("clase, funcion", [
+    ("O(n)", lambda n: 3 * n + 10),
+    ("O(n²)", lambda n: n * n / 2),
+    ("O(n log n)", lambda n: n * (n.bit_length() - 1)),
+])
+def test_mejor_clase_de_datos_exactos(clase, funcion):
+    tamanos = [2 ** k for k in range(4, 12)]
+    _, elegida = mejor_clase(tamanos, [funcion(n) for n in tamanos])
+    assert elegida == clase
+
+
+def test_exponente_empirico():
+    tamanos = [10, 20, 40, 80]
+    assert exponente_empirico(tamanos, [n ** 3 for n in tamanos]) == pytest.approx(3)
+
+
+def test_memoria_lineal_y_constante():
+    tamanos = [1000, 2000, 4000, 8000, 16000]
+    copia = MedidorEmpirico(lambda a: [x * 2 for x in a], tamanos=tamanos, repeticiones=1, calentamiento=0).medir()
+    assert copia.clase_espacio == "O(n)"
+    assert copia.memoria_bytes[-1] > copia.memoria_bytes[0] * 8
+    suma = MedidorEmpirico(sum, tamanos=tamanos, repeticiones=1, calentamiento=0).medir()
+    assert suma.clase_espacio == "O(1)"
@@ -0,0 +1,56 @@
+# test_modelo_costos.py (costos de biblioteca según el tipo del receptor)
+import ast
+
+import pytest
+
+from modelo_costos import ContextoTipos, ModeloCostos, clase_a_expresion
+
+
+def _en_bucle(sentencia):
+    return f"def f(a, n):\n    d = {{}}\n    for x in a:\n        {sentencia}\n"
+
+
+@pytest.mark.parametrize("sentencia, complejidad", [
+    ("a.pop()", "O(n)"),
+    ("a.pop(-1)", "O(n)"),
+    ("a.pop(len(a) - 1)", "O(n)"),
+    ("a.pop(0)", "O(n²)"),
+    ("a.pop(x)", "O(n²)"),
+    ("y = x in range(n)", "O(n)"),
+    ("y = x in d", "O(n)"),
+    ("y = x in d.keys()", "O(n)"),
+    ("y = x in d.values()", "O(n²)"),
+    ("y = x in a", "O(n²)"),
+    ("y = x in (1, 2, 3)", "O(n)"),
+    ("y = x in 'aeiou'", "O(n)"),
+])
+def test_costo_en_bucle(analizar, sentencia, complejidad):
+    assert analizar(_en_bucle(sentencia)).complejidad_detectada == complejidad
+
+
+def test_tipos_por_ambito():
+    codigo = """s = set()
+def f(s):
+    return 1 in s
+def g():
+    return 1 in s
+class K:
+    s = {}
+    def h(self):
+        return 1 in s
+"""
+    tree = ast.parse(codigo)
+    contexto = ContextoTipos(tree)
+    modelo = ModeloCostos()
+    comparaciones = [nodo for nodo in ast.walk(tree) if isinstance(nodo, ast.Compare)]
+    # El parámetro s de f tapa al set del módulo; el cuerpo de la clase no es visible en h
+    costos = [modelo.costo_expresion(nodo, contexto).complejidad() for nodo in comparaciones]
+    assert costos == ["O(n)", "O(1)", "O(1)"]
+
+
+def test_modelo_desde_json_reemplaza_entradas(tmp_path):
+    ruta = tmp_path / "costos.json"
+    ruta.write_text('{"list.in": "log n"}', encoding="utf-8")
+    modelo = ModeloCostos.desde_archivo(str(ruta))
+    assert modelo.costo("list.in").a_texto() == clase_a_expresion("log n").a_texto()
+    assert modelo.huella() != ModeloCostos().huella()
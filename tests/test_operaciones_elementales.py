@@ -0,0 +1,46 @@
+# test_operaciones_elementales.py (pruebas del conteo de OE por tipo)
+import ast
+
+from operaciones_elementales import contar_oe_por_tipo, oe_propias, texto_histograma
+
+BUCLE = '''def f(a, o):
+    t = []
+    for i in range(1, len(a)):
+        t.append(o.x[a[i]] * 2 + a[i-1])
+    return t
+'''
+
+
+def _nodo(codigo):
+    return ast.parse(codigo).body[0]
+
+
+def test_oe_propias_de_una_asignacion():
+    asignacion = _nodo("a[i] = x + 1")
+    assert oe_propias(asignacion) == {'asignacion': 1}
+    assert contar_oe_por_tipo(asignacion) == {'asignacion': 1, 'subindice': 1, 'aritmetica': 1}
+
+
+def test_no_entra_en_funciones_definidas():
+    bloque = ast.parse("def g():\n    return a + b + c\nx = g()")
+    assert contar_oe_por_tipo(bloque) == {'llamada': 1, 'asignacion': 1}
+
+
+def test_texto_histograma_de_mayor_a_menor():
+    assert texto_histograma({'aritmetica': 1, 'subindice': 3}) == "3 subindice, 1 aritmetica"
+    assert texto_histograma({}) == "sin operaciones"
+
+
+def test_cada_termino_se_reparte_como_las_oe_de_sus_sentencias(analizar):
+    analizador = analizar(BUCLE)
+    lineal = next(fila for fila in analizador.tiempo_algoritmo.histograma_terminos() if fila['orden'] == (1, 0))
+    vuelta, = analizador.detalles_analisis['oe_por_bucle']
+    assert lineal['oe_por_tipo'] == vuelta['oe_por_tipo']
+    assert sum(lineal['oe_por_tipo'].values()) == lineal['coeficiente']
+    assert lineal['oe_por_tipo']['subindice'] == 3
+    assert lineal['oe_por_tipo']['atributo'] == 2
+
+
+def test_las_oe_por_tipo_suman_el_total(analizar):
+    tiempo = analizar(BUCLE).tiempo_algoritmo
+    assert sum(tiempo.oe_por_tipo(100).values()) == float(tiempo.expresion.evaluar(100))
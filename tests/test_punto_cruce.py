@@ -0,0 +1,43 @@
+# test_punto_cruce.py (tamaños en que dos funciones de tiempo se cruzan)
+import pytest
+
+from expresion_costo import ExpresionCosto
+from punto_cruce import describir_cruces, puntos_cruce
+
+n = ExpresionCosto.potencia("n")
+
+
+def test_cruce_de_lineal_y_cuadratica():
+    # 100n = n² en n = 100
+    lineal, cuadratica = n * 100, n ** 2
+    assert puntos_cruce(lineal.evaluar, cuadratica.evaluar) == [pytest.approx(100)]
+
+
+def test_varios_cruces():
+    # (n - 10)(n - 1000) = n² - 1010n + 10000 cambia de signo dos veces
+    f = n ** 2 + 10000
+    g = n * 1010
+    assert puntos_cruce(f.evaluar, g.evaluar) == [pytest.approx(10), pytest.approx(1000)]
+
+
+def test_n_log_n_contra_lineal_con_constante():
+    f = n * ExpresionCosto.logaritmo("n")
+    g = n * 10
+    assert puntos_cruce(f.evaluar, g.evaluar) == [pytest.approx(1024)]
+
+
+def test_exponencial_que_desborda():
+    assert puntos_cruce(lambda x: 2.0 ** x, lambda x: x ** 3) == [pytest.approx(1.3734, abs=1e-3),
+                                                                  pytest.approx(9.9395, abs=1e-3)]
+
+
+def test_funciones_iguales_no_se_cruzan():
+    assert puntos_cruce((n * 2).evaluar, (n + n).evaluar) == []
+    assert describir_cruces((n * 2).evaluar, (n + n).evaluar) == ["Función 1 y Función 2 tardan lo mismo en todo el rango"]
+
+
+def test_describir_cruces():
+    frases = describir_cruces((n * 100).evaluar, (n ** 2).evaluar, "A", "B", n_max=1e6)
+    assert frases == ["B es más rápida para n < 100", "A es más rápida para n > 100"]
+    assert describir_cruces(n.evaluar, (n ** 2 + 1).evaluar, "A", "B", n_max=1e3) == \
+        ["A es más rápida para todo n en [1.00, 1,000]"]
@@ -0,0 +1,57 @@
+# test_rangos.py (pruebas de las cotas simbólicas de los for sobre range)
+from fractions import Fraction
+
+import pytest
+
+from expresion_costo import ExpresionCosto
+
+n = ExpresionCosto.potencia("n")
+i = ExpresionCosto.potencia("i")
+
+RANGO_DESDE_I = '''def f(n):
+    t = 0
+    for i in range(n):
+        for j in range(i, n):
+            t += 1
+    return t
+'''
+
+
+@pytest.mark.parametrize("inicio, paso", [(0, 1), (1, 1), (3, 1), (0, 2), (1, 3), (2, 4)])
+def test_sumatoria_faulhaber_sobre_range(inicio, paso):
+    # Σ (i² + 3i + 1) para i en range(inicio, n, paso), comparada con la suma directa
+    cuerpo = i ** 2 + i * 3 + 1
+    suma = cuerpo.sumatoria("i", inicio, n, paso)
+    for valor in (inicio + paso * k for k in (1, 5, 12)):
+        esperado = sum(t * t + 3 * t + 1 for t in range(inicio, valor, paso))
+        assert suma.evaluar(valor) == pytest.approx(esperado)
+
+
+def test_sumatoria_con_limite_simbolico():
+    # for i in range(n): for j in range(i, n) -> Σ (n - i) = n²/2 + n/2
+    interna = ExpresionCosto.constante().sumatoria("j", i, n)
+    total = interna.sumatoria("i", 0, n)
+    assert total.coeficiente(2) == Fraction(1, 2)
+    assert total.coeficiente(1) == Fraction(1, 2)
+    assert total.complejidad() == "O(n²)"
+
+
+def test_bucle_anidado_desde_i(analizar):
+    # El cuerpo interno corre n(n + 1)/2 veces: la mitad que con range(n)
+    triangular = analizar(RANGO_DESDE_I).tiempo_algoritmo.expresion
+    cuadrado = analizar(RANGO_DESDE_I.replace("range(i, n)", "range(n)")).tiempo_algoritmo.expresion
+    assert triangular.complejidad() == "O(n²)"
+    assert triangular.coeficiente(2) * 2 == cuadrado.coeficiente(2)
+
+
+def test_variable_del_for_en_su_propio_range(analizar):
+    # El range se evalúa antes de asignar la variable: n es el parámetro
+    analizador = analizar("def f(n):\n    t = 0\n    for n in range(n):\n        t += 1\n    return t\n")
+    assert analizador.complejidad_detectada == "O(n)"
+
+
+def test_range_interno_con_la_variable_de_afuera(analizar):
+    # La i de range(i, n) es la del for de afuera, no la del for que la reasigna
+    triangular = analizar(RANGO_DESDE_I).tiempo_algoritmo.expresion
+    sombra = analizar(RANGO_DESDE_I.replace("for j in range(i, n)", "for i in range(i, n)"))
+    assert sombra.tiempo_algoritmo.expresion.coeficiente(2) == triangular.coeficiente(2)
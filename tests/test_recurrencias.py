@@ -0,0 +1,147 @@
+# test_recurrencias.py (pruebas de la resolución de recurrencias y de casos conocidos)
+import pytest
+
+BUSQUEDA_BINARIA = '''def bs(arr, x, lo, hi):
+    if lo > hi:
+        return -1
+    mid = (lo + hi) // 2
+    if arr[mid] == x:
+        return mid
+    elif arr[mid] < x:
+        return bs(arr, x, mid + 1, hi)
+    else:
+        return bs(arr, x, lo, mid - 1)
+'''
+
+MERGE_SORT = '''def merge_sort(a):
+    if len(a) <= 1:
+        return a
+    mid = len(a) // 2
+    izq = merge_sort(a[:mid])
+    der = merge_sort(a[mid:])
+    res = []
+    for x in izq:
+        res.append(x)
+    for x in der:
+        res.append(x)
+    return res
+'''
+
+KARATSUBA = '''def k(x, n):
+    if n <= 1:
+        return x
+    a = k(x, n // 2)
+    b = k(x, n // 2)
+    c = k(x, n // 2)
+    return a + b + c
+'''
+
+AKRA_BAZZI = '''def f(a):
+    if len(a) <= 1:
+        return 0
+    total = 0
+    for x in a:
+        total += x
+    return f(a[:len(a) // 2]) + f(a[:len(a) // 4]) + total
+'''
+
+HANOI = '''def hanoi(n, origen, destino, auxiliar):
+    if n == 0:
+        return
+    hanoi(n - 1, origen, auxiliar, destino)
+    print(origen, destino)
+    hanoi(n - 1, auxiliar, destino, origen)
+'''
+
+FIBONACCI = '''def fib(n):
+    if n < 2:
+        return n
+    return fib(n - 1) + fib(n - 2)
+'''
+
+SUMA_POR_RESTA = '''def s(a):
+    if len(a) <= 1:
+        return 0
+    t = 0
+    for x in a:
+        t += x
+    return s(a[1:]) + t
+'''
+
+FACTORIAL = '''def f(n):
+    if n <= 1:
+        return 1
+    return f(n - 1) * n
+'''
+
+CUADRATICO_DIVIDIDO = '''def q(a):
+    if len(a) <= 1:
+        return a
+    total = 0
+    for x in a:
+        for y in a:
+            total += 1
+    return q(a[:len(a) // 2]) + q(a[len(a) // 2:])
+'''
+
+PAR_IMPAR = '''def par(n):
+    if n == 0:
+        return True
+    return impar(n - 1)
+
+def impar(n):
+    if n == 0:
+        return False
+    return par(n - 1)
+'''
+
+
+@pytest.mark.parametrize("codigo, metodo, complejidad", [
+    (BUSQUEDA_BINARIA, "Teorema maestro", "O(log n)"),
+    (MERGE_SORT, "Teorema maestro", "O(n log n)"),
+    (KARATSUBA, "Teorema maestro", "O(n^1.58)"),
+    (AKRA_BAZZI, "Akra-Bazzi", "O(n)"),
+    (HANOI, "Ecuación característica", "O(2^n)"),
+    (FIBONACCI, "Ecuación característica", "O(1.62^n)"),
+    (SUMA_POR_RESTA, "Suma de niveles (resta y vencerás)", "O(n²)"),
+    (FACTORIAL, "Suma de niveles (resta y vencerás)", "O(n)"),
+    (CUADRATICO_DIVIDIDO, "Teorema maestro", "O(n²)"),
+])
+def test_solucion_de_recurrencias(analizar, codigo, metodo, complejidad):
+    analizador = analizar(codigo)
+    funcion, = analizador.detalles_analisis['recursion']['funciones']
+    assert funcion['metodo'] == metodo
+    assert funcion['complejidad'] == complejidad
+    assert analizador.complejidad_detectada == complejidad
+
+
+def test_recurrencia_con_el_costo_del_cuerpo(analizar):
+    funcion, = analizar(SUMA_POR_RESTA).detalles_analisis['recursion']['funciones']
+    assert funcion['recurrencia'] == "T(n) = T(n-1) + O(n)"
+    funcion, = analizar(CUADRATICO_DIVIDIDO).detalles_analisis['recursion']['funciones']
+    assert funcion['recurrencia'] == "T(n) = 2T(n/2) + O(n²)"
+
+
+def test_recursion_mutua_se_suma_una_vez(analizar):
+    analizador = analizar(PAR_IMPAR)
+    assert analizador.detalles_analisis['recursion']['tipo'] == 'mutua'
+    # Cada solución ya incluye las llamadas a la otra función de la componente
+    (_, solucion), _ = analizador.analizador_recursion.soluciones
+    assert analizador.tiempo_algoritmo.expresion.coeficiente(1) == solucion.coeficiente(1)
+    assert analizador.complejidad_detectada == "O(n)"
+
+
+def test_recursion_exponencial_crece_en_las_estimaciones(analizar):
+    # T(n) = 2 + O(1.62^n): la parte exponencial también se evalúa
+    tiempo = analizar(FIBONACCI).tiempo_algoritmo
+    assert tiempo.evaluar(20) > 1.6 * tiempo.evaluar(19)
+    por_tipo = tiempo.oe_por_tipo(20)
+    assert sum(por_tipo.values()) == pytest.approx(tiempo.evaluar(20))
+    assert por_tipo['llamada'] > 1000
+    assert tiempo.evaluar(5000) == float('inf')
+
+
+def test_recursion_polinomica_no_agrega_exponenciales(analizar):
+    tiempo = analizar(BUSQUEDA_BINARIA).tiempo_algoritmo
+    assert tiempo.exponenciales == []
+    assert tiempo.evaluar(1024) == pytest.approx(float(tiempo.expresion.evaluar(1024)))
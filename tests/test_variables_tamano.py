@@ -0,0 +1,54 @@
+# test_variables_tamano.py (complejidad en varias variables de tamaño)
+import pytest
+
+from expresion_costo import ExpresionCosto
+
+n = ExpresionCosto.potencia("n")
+m = ExpresionCosto.potencia("m")
+
+
+def test_aritmetica_varias_variables():
+    producto = (n + m) * (n - m)
+    assert producto.a_texto() == "n² - m²"
+    assert producto.variables() == ["n", "m"]
+    assert producto.firma() == "T(n, m)"
+    assert producto.evaluar({"n": 5, "m": 3}) == 16
+    assert (n * m * 2 + n).renombrar({"m": "k"}).evaluar({"n": 2, "k": 3}) == 14
+
+
+@pytest.mark.parametrize("codigo, complejidad", [
+    ('''def f(filas, columnas):
+    for i in range(filas):
+        for j in range(columnas):
+            print(i, j)
+''', "O(n·m)"),
+    ('''def g(grafo):
+    for u in range(len(grafo)):
+        for v in grafo[u]:
+            print(v)
+''', "O(n·m)"),
+    ('''def h(a, b):
+    for x in a:
+        print(x)
+    for y in b:
+        print(y)
+''', "O(n + m)"),
+    ('''def p(n, k):
+    for i in range(n):
+        for j in range(k):
+            print(j)
+''', "O(n·k)"),
+    ('''def ayudante(b):
+    for y in b:
+        print(y)
+
+def principal(a, b):
+    for x in a:
+        ayudante(b)
+''', "O(n·m)"),
+])
+def test_variables_por_dato_de_entrada(analizar, codigo, complejidad):
+    analizador = analizar(codigo)
+    assert analizador.complejidad_detectada == complejidad
+    variables = [letra for letra in "nmk" if letra in complejidad]
+    assert analizador.funcion_tiempo.startswith(f"T({', '.join(variables)}) = ")
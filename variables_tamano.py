@@ -0,0 +1,192 @@
+# variables_tamano.py (variables de tamaño n, m, k, ... de los datos de entrada)
+import ast
+from expresion_costo import VARIABLES_TAMANO
+
+_FUNCIONES = (ast.FunctionDef, ast.AsyncFunctionDef)
+# Llamadas cuyo tamaño es el de su primer argumento
+_ENVOLTORIOS = {'enumerate', 'reversed', 'sorted', 'zip', 'list', 'tuple', 'set', 'frozenset', 'iter', 'deque'}
+# Métodos cuyo resultado tiene el tamaño del receptor
+_VISTAS = {'items', 'keys', 'values', 'copy'}
+# Nombres que, usados como tamaño, conservan su propia letra
+_PROPIAS = VARIABLES_TAMANO[:3]
+
+
+def _texto(nodo):
+    try:
+        return ast.unparse(nodo)
+    except (AttributeError, ValueError):
+        return None
+
+
+class VariablesTamano:
+    """
+    Asigna una letra a cada tamaño distinto de los datos de entrada: los
+    parámetros usados como límite, len(x) de cada argumento, las filas de una
+    matriz o las listas de adyacencia de un grafo (x[i]). Cada función tiene
+    sus propias letras, empezando por n: def f(filas, columnas) recorre n·m.
+    Los parámetros llamados n, m o k conservan su letra
+    """
+
+    def __init__(self, tree):
+        self._ambito = {}
+        self._alias = {}
+        self._elementos = {}
+        self._parametros = {}
+        self._letras = {}
+        self._recorrer(tree)
+        self._registrar_usos(tree)
+
+    def _recorrer(self, tree):
+        """
+        Ámbito (función o módulo) de cada nodo, alias de tamaño (x = len(arr))
+        y variables que recorren colecciones (for x in lista)
+        """
+        pendientes = [(tree, tree)]
+        while pendientes:
+            nodo, ambito = pendientes.pop()
+            self._ambito[nodo] = ambito
+            if isinstance(nodo, _FUNCIONES):
+                self._parametros[nodo] = [a.arg for a in nodo.args.posonlyargs + nodo.args.args]
+            interior = nodo if isinstance(nodo, _FUNCIONES) else ambito
+            pendientes.extend((hijo, interior) for hijo in ast.iter_child_nodes(nodo))
+
+        for nodo in ast.walk(tree):
+            ambito = self._ambito[nodo]
+            if isinstance(nodo, ast.Assign) and len(nodo.targets) == 1 and isinstance(nodo.targets[0], ast.Name):
+                self._alias.setdefault((ambito, nodo.targets[0].id), nodo.value)
+            elif isinstance(nodo, (ast.For, ast.comprehension)):
+                self._registrar_elementos(nodo.target, nodo.iter, ambito)
+
+    def _registrar_elementos(self, destino, iterable, ambito):
+        es_range = isinstance(iterable, ast.Call) and isinstance(iterable.func, ast.Name) \
+            and iterable.func.id == 'range'
+        enumera = isinstance(iterable, ast.Call) and isinstance(iterable.func, ast.Name) \
+            and iterable.func.id == 'enumerate'
+        nombres = [destino] if isinstance(destino, ast.Name) else \
+            [e for e in destino.elts[enumera:] if isinstance(e, ast.Name)] if isinstance(destino, ast.Tuple) else []
+        if enumera and isinstance(destino, ast.Tuple) and destino.elts and isinstance(destino.elts[0], ast.Name):
+            self._elementos.setdefault((ambito, destino.elts[0].id), None)
+        for nombre in nombres:
+            # Los índices de range no son tamaños; los elementos de una colección sí
+            self._elementos.setdefault((ambito, nombre.id), None if es_range else iterable)
+
+    def _registrar_usos(self, tree):
+        """
+        Reserva las letras en el orden en que aparecen los tamaños: primero
+        los parámetros de cada función, luego el resto según el código
+        """
+        usos = []
+        for nodo in ast.walk(tree):
+            if isinstance(nodo, ast.For) or isinstance(nodo, ast.comprehension):
+                iterable = nodo.iter
+                if isinstance(iterable, ast.Call) and isinstance(iterable.func, ast.Name) and iterable.func.id == 'range':
+                    usos.extend(n for argumento in iterable.args for n in self._tamanos_en(argumento))
+                else:
+                    usos.append(iterable)
+            elif isinstance(nodo, ast.While):
+                usos.extend(self._tamanos_en(nodo.test))
+            elif self._es_len(nodo):
+                usos.append(nodo)
+
+        claves = {}
+        for nodo in usos:
+            clave = self.clave(nodo)
+            if clave is not None:
+                ambito = self._ambito[nodo]
+                # Las filas o vecinos (x[·]) van después del tamaño de la colección x
+                base = clave.split("[")[0]
+                for parcial in (base, clave):
+                    claves.setdefault(ambito, {}).setdefault(parcial, (nodo.lineno, nodo.col_offset))
+        for ambito, posiciones in claves.items():
+            parametros = self._parametros.get(ambito, [])
+            orden = sorted(posiciones, key=lambda c: (
+                (0, parametros.index(c)) if c in parametros else (1,) + posiciones[c]))
+            # Los nombres n, m y k se reservan primero para sí mismos
+            for clave in orden:
+                if clave in _PROPIAS:
+                    self._letra(ambito, clave)
+            for clave in orden:
+                self._letra(ambito, clave)
+
+    def _tamanos_en(self, expresion):
+        """
+        Nombres y len(...) de una expresión (sin los nombres de las funciones llamadas)
+        """
+        llamadas = {id(n.func) for n in ast.walk(expresion) if isinstance(n, ast.Call)}
+        return [n for n in ast.walk(expresion)
+                if (isinstance(n, ast.Name) and id(n) not in llamadas) or self._es_len(n)]
+
+    @staticmethod
+    def _es_len(nodo):
+        return isinstance(nodo, ast.Call) and isinstance(nodo.func, ast.Name) and nodo.func.id == 'len' \
+            and len(nodo.args) == 1
+
+    def _letra(self, ambito, clave):
+        letras = self._letras.setdefault(ambito, {})
+        if clave not in letras:
+            usadas = set(letras.values())
+            if clave in _PROPIAS and clave not in usadas:
+                letras[clave] = clave
+            else:
+                libres = [v for v in VARIABLES_TAMANO if v not in usadas]
+                letras[clave] = libres[0] if libres else VARIABLES_TAMANO[-1]
+        return letras[clave]
+
+    def clave(self, nodo, profundidad=8):
+        """
+        Texto que identifica el tamaño de una expresión dentro de su ámbito
+        (None si no se reconoce, por ejemplo un número o un índice de range)
+        """
+        if profundidad == 0 or nodo not in self._ambito:
+            return None
+        ambito = self._ambito[nodo]
+        if isinstance(nodo, ast.Name):
+            if (ambito, nodo.id) in self._elementos:
+                iterable = self._elementos[(ambito, nodo.id)]
+                if iterable is None:
+                    return None
+                base = self.clave(iterable, profundidad - 1)
+                return f"{base}[·]" if base else None
+            valor = self._alias.get((ambito, nodo.id))
+            if valor is not None and nodo.id not in self._parametros.get(ambito, []):
+                return self.clave(valor, profundidad - 1)
+            return nodo.id
+        if isinstance(nodo, ast.Call):
+            funcion = nodo.func
+            if isinstance(funcion, ast.Name) and (funcion.id == 'len' or funcion.id in _ENVOLTORIOS) and nodo.args:
+                return self.clave(nodo.args[0], profundidad - 1)
+            if isinstance(funcion, ast.Attribute) and funcion.attr in _VISTAS:
+                return self.clave(funcion.value, profundidad - 1)
+            return None
+        if isinstance(nodo, ast.Subscript):
+            base = self.clave(nodo.value, profundidad - 1)
+            if base is None or isinstance(nodo.slice, ast.Slice):
+                return base
+            return f"{base}[·]"
+        if isinstance(nodo, ast.Attribute):
+            return _texto(nodo)
+        if isinstance(nodo, ast.BinOp):
+            claves = {self.clave(lado, profundidad - 1) for lado in (nodo.left, nodo.right)}
+            claves.discard(None)
+            return claves.pop() if len(claves) == 1 else None
+        if isinstance(nodo, ast.UnaryOp):
+            return self.clave(nodo.operand, profundidad - 1)
+        return None
+
+    def variable(self, nodo):
+        """
+        Letra del tamaño de una expresión; n si no se reconoce
+        """
+        clave = self.clave(nodo)
+        if clave is None:
+            return VARIABLES_TAMANO[0]
+        return self._letra(self._ambito[nodo], clave)
+
+    def letra_parametro(self, funcion, nombre):
+        """
+        Letra con que la función usa un parámetro como tamaño (None si no lo usa)
+        """
+        return self._letras.get(funcion, {}).get(nombre)
+
+    def parametros(self, funcion):
+        return self._parametros.get(funcion, [])